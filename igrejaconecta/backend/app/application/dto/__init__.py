@@ -13,20 +13,32 @@ from app.application.dto.contact_dto import (
     ContactCreateDTO,
     ContactUpdateDTO,
     ContactResponseDTO,
+    ContactPageDTO,
     ContactBulkCreateDTO,
     ContactFilterDTO,
+    ContactImportResultDTO,
+    ContactImportJobDTO,
+    ContactImportRejectionDTO,
+    ContactImportProgressDTO,
+    TagCountDTO,
+    AudienceQueryDTO,
+    AudienceSizeDTO,
 )
 from app.application.dto.broadcast_dto import (
     BroadcastCreateDTO,
     BroadcastUpdateDTO,
     BroadcastResponseDTO,
+    BroadcastPageDTO,
     BroadcastFilterDTO,
     BroadcastStatisticsDTO,
+    BroadcastJobDTO,
+    BroadcastProgressDTO,
 )
 from app.application.dto.template_dto import (
     TemplateCreateDTO,
     TemplateUpdateDTO,
     TemplateResponseDTO,
+    TemplatePageDTO,
     UseTemplateDTO,
 )
 
@@ -41,18 +53,30 @@ __all__ = [
     "ContactCreateDTO",
     "ContactUpdateDTO",
     "ContactResponseDTO",
+    "ContactPageDTO",
     "ContactBulkCreateDTO",
     "ContactFilterDTO",
+    "ContactImportResultDTO",
+    "ContactImportJobDTO",
+    "ContactImportRejectionDTO",
+    "ContactImportProgressDTO",
+    "TagCountDTO",
+    "AudienceQueryDTO",
+    "AudienceSizeDTO",
     # Broadcast
     "BroadcastCreateDTO",
     "BroadcastUpdateDTO",
     "BroadcastResponseDTO",
+    "BroadcastPageDTO",
     "BroadcastFilterDTO",
     "BroadcastStatisticsDTO",
+    "BroadcastJobDTO",
+    "BroadcastProgressDTO",
     # Template
     "TemplateCreateDTO",
     "TemplateUpdateDTO",
     "TemplateResponseDTO",
+    "TemplatePageDTO",
     "UseTemplateDTO",
 ]
 
@@ -3,10 +3,18 @@ Broadcast DTOs
 """
 
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
+class BroadcastMediaDTO(BaseModel):
+    """DTO for a media file stored for broadcasts, as returned by the upload"""
+    kind: str  # image, document or video
+    sha256: str
+    mime_type: str
+    filename: Optional[str] = None
+
+
 class BroadcastCreateDTO(BaseModel):
     """DTO for creating a broadcast"""
     title: Optional[str] = None
@@ -14,7 +22,12 @@ class BroadcastCreateDTO(BaseModel):
     link_url: Optional[str] = None
     button_text: Optional[str] = None
     contact_tags: List[str] = []
+    segment: Optional[Dict[str, Any]] = None  # Tag expression, replaces contact_tags
     scheduled_at: Optional[datetime] = None
+    whatsapp_template: Optional[str] = None  # Approved template, required outside the 24h window
+    whatsapp_template_language: Optional[str] = None  # e.g. pt_BR
+    template_parameters: List[str] = []  # Body variables in order; placeholders like {nome} allowed
+    media: Optional[BroadcastMediaDTO] = None  # From POST /broadcasts/media; message becomes the caption
 
 
 class BroadcastUpdateDTO(BaseModel):
@@ -36,16 +49,30 @@ class BroadcastResponseDTO(BaseModel):
     link_url: Optional[str]
     button_text: Optional[str]
     contact_tags: List[str]
+    segment: Optional[Dict[str, Any]] = None
     scheduled_at: Optional[datetime]
     sent_at: Optional[datetime]
     status: str
     total_sent: int
+    total_delivered: int = 0
+    total_read: int = 0
+    total_failed: int = 0
+    whatsapp_template: Optional[str] = None
+    whatsapp_template_language: Optional[str] = None
+    template_parameters: List[str] = []
+    media: Optional[BroadcastMediaDTO] = None
     created_at: datetime
     
     class Config:
         from_attributes = True
 
 
+class BroadcastPageDTO(BaseModel):
+    """DTO for a page of broadcasts; pass next_cursor back to get the next page"""
+    items: List[BroadcastResponseDTO]
+    next_cursor: Optional[str] = None
+
+
 class BroadcastFilterDTO(BaseModel):
     """DTO for filtering broadcasts"""
     status: Optional[str] = None
@@ -57,8 +84,28 @@ class BroadcastStatisticsDTO(BaseModel):
     """DTO for broadcast statistics"""
     total: int
     pending: int
+    sending: int = 0
     sent: int
     failed: int
     cancelled: int
     total_messages_sent: int
 
+
+
+class BroadcastJobDTO(BaseModel):
+    """DTO for an enqueued broadcast send"""
+    job_id: str
+    broadcast_id: int
+    state: str
+
+
+class BroadcastProgressDTO(BaseModel):
+    """DTO for progress of a broadcast send job"""
+    job_id: str
+    broadcast_id: int
+    state: str
+    total: int
+    sent: int
+    failed: int
+    retrying: int = 0  # Messages waiting for a retry after a transient error
+    remaining: int
@@ -31,6 +31,7 @@ class ChurchResponseDTO(BaseModel):
     email: str
     phone: Optional[str]
     whatsapp_phone_id: Optional[str]
+    messaging_tier: Optional[str] = None
     is_active: bool
     created_at: datetime
     
@@ -42,10 +43,14 @@ class WhatsAppConfigDTO(BaseModel):
     """DTO for configuring WhatsApp"""
     phone_id: str
     access_token: str
+    messaging_tier: Optional[str] = None
+    business_account_id: Optional[str] = None  # Needed for approved template messages
 
 
 class WhatsAppConfigResponseDTO(BaseModel):
     """DTO for WhatsApp configuration response"""
     phone_id: str
     is_configured: bool
+    messaging_tier: Optional[str] = None
+    business_account_id: Optional[str] = None
 
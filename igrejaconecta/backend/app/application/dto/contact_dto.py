@@ -3,7 +3,7 @@ Contact DTOs
 """
 
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
@@ -34,11 +34,64 @@ class ContactResponseDTO(BaseModel):
         from_attributes = True
 
 
+class ContactPageDTO(BaseModel):
+    """DTO for a page of contacts; pass next_cursor back to get the next page"""
+    items: List[ContactResponseDTO]
+    next_cursor: Optional[str] = None
+
+
 class ContactBulkCreateDTO(BaseModel):
     """DTO for bulk creating contacts"""
     contacts: List[ContactCreateDTO]
 
 
+class ContactImportResultDTO(BaseModel):
+    """DTO for the outcome of a contact import"""
+    imported: int
+    duplicates: int
+    rejected: int
+
+
+class ContactImportJobDTO(BaseModel):
+    """DTO for an enqueued contact import"""
+    job_id: str
+    state: str
+
+
+class ContactImportRejectionDTO(BaseModel):
+    """DTO for a CSV row rejected by an import"""
+    row: int
+    phone: Optional[str] = None
+    reason: str
+
+
+class ContactImportProgressDTO(BaseModel):
+    """DTO for progress of a contact import job"""
+    job_id: str
+    state: str
+    processed: int
+    imported: int
+    duplicates: int
+    rejected: int
+    rejections: List[ContactImportRejectionDTO] = []
+
+
+class TagCountDTO(BaseModel):
+    """DTO for how many contacts carry a tag"""
+    tag: str
+    contacts: int
+
+
+class AudienceQueryDTO(BaseModel):
+    """DTO for sizing a tag segment; no segment means every contact"""
+    segment: Optional[Dict[str, Any]] = None
+
+
+class AudienceSizeDTO(BaseModel):
+    """DTO for the number of contacts a segment selects"""
+    contacts: int
+
+
 class ContactFilterDTO(BaseModel):
     """DTO for filtering contacts"""
     tags: Optional[List[str]] = None
@@ -0,0 +1,29 @@
+"""
+Keyset pagination cursors
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+from app.core.exceptions import InvalidCursorException
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> Tuple[Any, ...]:
+    """Decode a cursor back into a sort key with the given value types"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if len(payload) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(
+            datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+            for value, value_type in zip(payload, types)
+        )
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorException(f"Invalid cursor: {str(e)}")
@@ -37,6 +37,12 @@ class TemplateResponseDTO(BaseModel):
         from_attributes = True
 
 
+class TemplatePageDTO(BaseModel):
+    """DTO for a page of templates; pass next_cursor back to get the next page"""
+    items: List[TemplateResponseDTO]
+    next_cursor: Optional[str] = None
+
+
 class UseTemplateDTO(BaseModel):
     """DTO for using a template in a broadcast"""
     template_id: int
@@ -2,15 +2,21 @@
 Repository interfaces
 """
 
-from app.application.interfaces.repositories.church_repository import IChurchRepository
-from app.application.interfaces.repositories.contact_repository import IContactRepository
-from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository
-from app.application.interfaces.repositories.template_repository import ITemplateRepository
+from app.application.interfaces.repositories.church_repository import IChurchRepository, IAsyncChurchRepository
+from app.application.interfaces.repositories.contact_repository import IContactRepository, IAsyncContactRepository
+from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository, IAsyncBroadcastRepository
+from app.application.interfaces.repositories.template_repository import ITemplateRepository, IAsyncTemplateRepository
+from app.application.interfaces.repositories.delivery_repository import IDeliveryRepository
 
 __all__ = [
     "IChurchRepository",
+    "IAsyncChurchRepository",
     "IContactRepository",
+    "IAsyncContactRepository",
     "IBroadcastRepository",
+    "IAsyncBroadcastRepository",
     "ITemplateRepository",
+    "IAsyncTemplateRepository",
+    "IDeliveryRepository",
 ]
 
@@ -3,8 +3,8 @@ Broadcast repository interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple
+from datetime import datetime, timedelta
 from app.domain.entities.broadcast import Broadcast, BroadcastStatus
 
 
@@ -25,11 +25,11 @@ class IBroadcastRepository(ABC):
     def list_by_church(
         self, 
         church_id: int, 
-        skip: int = 0, 
         limit: int = 100,
-        status: Optional[BroadcastStatus] = None
+        status: Optional[BroadcastStatus] = None,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[Broadcast]:
-        """List broadcasts by church"""
+        """List broadcasts by church, newest first, starting after a (created_at, id) key"""
         pass
     
     @abstractmethod
@@ -37,6 +37,47 @@ class IBroadcastRepository(ABC):
         """List scheduled broadcasts"""
         pass
     
+    @abstractmethod
+    def claim_for_sending(
+        self,
+        broadcast_id: int,
+        resume: bool = False,
+        lease: Optional[timedelta] = None
+    ) -> Optional[Broadcast]:
+        """Atomically move a pending broadcast, or a failed one when resuming, to sending
+
+        When resuming with a lease, a broadcast left sending whose claim was
+        not renewed within it is taken over too. Returns the claimed
+        broadcast, or None if it was not claimable, so concurrent triggers
+        can never both send it.
+        """
+        pass
+    
+    @abstractmethod
+    def renew_claim(self, broadcast_id: int) -> None:
+        """Extend the lease of a broadcast still being sent"""
+        pass
+    
+    @abstractmethod
+    def refresh_total_sent(self, broadcast_id: int) -> None:
+        """Recount total_sent from the delivery ledger in a single statement"""
+        pass
+    
+    @abstractmethod
+    def claim_due_scheduled(
+        self,
+        now: datetime,
+        horizon: timedelta,
+        lease: timedelta,
+        limit: int
+    ) -> List[Tuple[int, datetime]]:
+        """Claim pending broadcasts scheduled before now + horizon that no dispatch owns
+
+        Returns (broadcast_id, scheduled_at) pairs. Concurrent callers never
+        claim the same row; a claim lapses after lease past its scheduled time.
+        """
+        pass
+    
     @abstractmethod
     def update(self, broadcast: Broadcast) -> Broadcast:
         """Update broadcast"""
@@ -52,3 +93,52 @@ class IBroadcastRepository(ABC):
         """Get broadcast statistics for church"""
         pass
 
+
+class IAsyncBroadcastRepository(ABC):
+    """Interface for broadcast repository used from async code (the API)"""
+    
+    @abstractmethod
+    async def create(self, broadcast: Broadcast) -> Broadcast:
+        """Create a new broadcast"""
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, broadcast_id: int) -> Optional[Broadcast]:
+        """Get broadcast by ID"""
+        pass
+    
+    @abstractmethod
+    async def list_by_church(
+        self, 
+        church_id: int, 
+        limit: int = 100,
+        status: Optional[BroadcastStatus] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Broadcast]:
+        """List broadcasts by church, newest first, starting after a (created_at, id) key"""
+        pass
+    
+    @abstractmethod
+    async def list_scheduled(self, before: Optional[datetime] = None) -> List[Broadcast]:
+        """List scheduled broadcasts"""
+        pass
+    
+    @abstractmethod
+    async def mark_dispatched(self, broadcast_id: int, dispatched_at: datetime) -> None:
+        """Record that a scheduled send was handed to the queue"""
+        pass
+    
+    @abstractmethod
+    async def update(self, broadcast: Broadcast) -> Broadcast:
+        """Update broadcast"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, broadcast_id: int) -> None:
+        """Delete broadcast"""
+        pass
+    
+    @abstractmethod
+    async def get_statistics(self, church_id: int) -> dict:
+        """Get broadcast statistics for church"""
+        pass
@@ -45,3 +45,46 @@ class IChurchRepository(ABC):
         """List all churches"""
         pass
 
+
+class IAsyncChurchRepository(ABC):
+    """Interface for church repository used from async code (the API)"""
+    
+    @abstractmethod
+    async def create(self, church: Church) -> Church:
+        """Create a new church"""
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, church_id: int) -> Optional[Church]:
+        """Get church by ID"""
+        pass
+    
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[Church]:
+        """Get church by email"""
+        pass
+    
+    @abstractmethod
+    async def get_by_firebase_uid(self, firebase_uid: str) -> Optional[Church]:
+        """Get church by Firebase UID"""
+        pass
+    
+    @abstractmethod
+    async def update(self, church: Church) -> Church:
+        """Update church"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, church_id: int) -> None:
+        """Delete church"""
+        pass
+    
+    @abstractmethod
+    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Church]:
+        """List all churches"""
+        pass
+    
+    @abstractmethod
+    async def set_firebase_uid(self, church_id: int, firebase_uid: str) -> None:
+        """Link church to the Firebase user that owns it"""
+        pass
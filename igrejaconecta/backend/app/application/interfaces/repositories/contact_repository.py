@@ -3,8 +3,10 @@ Contact repository interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator, AsyncIterator, Tuple, Set, Dict
 from app.domain.entities.contact import Contact
+from app.domain.value_objects.segment import Segment
+from app.domain.value_objects.recipient import Recipient
 
 
 class IContactRepository(ABC):
@@ -26,8 +28,13 @@ class IContactRepository(ABC):
         pass
     
     @abstractmethod
-    def list_by_church(self, church_id: int, skip: int = 0, limit: int = 100) -> List[Contact]:
-        """List contacts by church"""
+    def get_existing_phones(self, church_id: int, phones: List[str]) -> Set[str]:
+        """Get which of the given phone numbers already exist in a church"""
+        pass
+    
+    @abstractmethod
+    def list_by_church(self, church_id: int, limit: int = 100, after_id: Optional[int] = None) -> List[Contact]:
+        """List contacts by church in ID order, starting after a contact ID"""
         pass
     
     @abstractmethod
@@ -35,6 +42,44 @@ class IContactRepository(ABC):
         """List contacts by tags"""
         pass
     
+    @abstractmethod
+    def iter_recipients(
+        self,
+        church_id: int,
+        segment: Optional[Segment] = None,
+        id_range: Optional[Tuple[int, int]] = None,
+        skip_settled_for: Optional[int] = None,
+        contact_ids: Optional[List[int]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Recipient]:
+        """Stream contacts of a church audience, optionally within an ID range or ID list
+
+        With skip_settled_for, contacts the given broadcast was already
+        delivered to, or failed permanently for, are left out, so a resumed
+        send only covers the rest.
+        """
+        pass
+    
+    @abstractmethod
+    def count_recipients(self, church_id: int, segment: Optional[Segment] = None) -> int:
+        """Count contacts of a church audience"""
+        pass
+    
+    @abstractmethod
+    def recipient_chunks(
+        self,
+        church_id: int,
+        segment: Optional[Segment],
+        chunk_size: int,
+        skip_settled_for: Optional[int] = None
+    ) -> List[Tuple[int, int, int]]:
+        """Split a church audience into (first_id, last_id, size) ranges of chunk_size contacts
+
+        With skip_settled_for, contacts settled for the given broadcast are
+        left out, as iter_recipients does, so sizes match what chunks send.
+        """
+        pass
+    
     @abstractmethod
     def update(self, contact: Contact) -> Contact:
         """Update contact"""
@@ -46,7 +91,75 @@ class IContactRepository(ABC):
         pass
     
     @abstractmethod
-    def bulk_create(self, contacts: List[Contact]) -> List[Contact]:
-        """Bulk create contacts"""
+    def bulk_create(self, contacts: List[Contact], skip_duplicates: bool = False) -> List[Contact]:
+        """Bulk create contacts, optionally skipping phones already in the church"""
         pass
 
+
+class IAsyncContactRepository(ABC):
+    """Interface for contact repository used from async code (the API)"""
+    
+    @abstractmethod
+    async def create(self, contact: Contact) -> Contact:
+        """Create a new contact"""
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, contact_id: int) -> Optional[Contact]:
+        """Get contact by ID"""
+        pass
+    
+    @abstractmethod
+    async def get_by_phone(self, church_id: int, phone: str) -> Optional[Contact]:
+        """Get contact by phone number"""
+        pass
+    
+    @abstractmethod
+    async def get_existing_phones(self, church_id: int, phones: List[str]) -> Set[str]:
+        """Get which of the given phone numbers already exist in a church"""
+        pass
+    
+    @abstractmethod
+    async def list_by_church(self, church_id: int, limit: int = 100, after_id: Optional[int] = None) -> List[Contact]:
+        """List contacts by church in ID order, starting after a contact ID"""
+        pass
+    
+    @abstractmethod
+    async def list_by_tags(self, church_id: int, tags: List[str]) -> List[Contact]:
+        """List contacts by tags"""
+        pass
+    
+    @abstractmethod
+    def iter_by_church(self, church_id: int, batch_size: int = 1000) -> AsyncIterator[Contact]:
+        """Stream every contact of a church in ID order"""
+        pass
+    
+    @abstractmethod
+    async def count_recipients(self, church_id: int, segment: Optional[Segment] = None) -> int:
+        """Count contacts of a church audience"""
+        pass
+    
+    @abstractmethod
+    async def get_tag_counts(self, church_id: int) -> Dict[str, int]:
+        """Get how many contacts of a church carry each tag"""
+        pass
+    
+    @abstractmethod
+    async def get_contact_total(self, church_id: int) -> int:
+        """Get how many contacts a church has"""
+        pass
+    
+    @abstractmethod
+    async def update(self, contact: Contact) -> Contact:
+        """Update contact"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, contact_id: int) -> None:
+        """Delete contact"""
+        pass
+    
+    @abstractmethod
+    async def bulk_create(self, contacts: List[Contact], skip_duplicates: bool = False) -> List[Contact]:
+        """Bulk create contacts, optionally skipping phones already in the church"""
+        pass
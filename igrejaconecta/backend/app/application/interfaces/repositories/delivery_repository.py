@@ -0,0 +1,31 @@
+"""
+Delivery repository interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Set
+from app.domain.entities.delivery import Delivery
+from app.domain.value_objects.status_event import StatusEvent
+
+
+class IDeliveryRepository(ABC):
+    """Interface for the per-recipient delivery ledger of broadcasts"""
+    
+    @abstractmethod
+    def record(self, deliveries: List[Delivery]) -> None:
+        """Insert or update delivery outcomes; a contact already sent to stays sent"""
+        pass
+    
+    @abstractmethod
+    def count_sent(self, broadcast_id: int) -> int:
+        """Count contacts the broadcast was delivered to"""
+        pass
+    
+    @abstractmethod
+    def apply_status_events(self, events: List[StatusEvent]) -> Set[str]:
+        """Move deliveries forward to reported statuses, rolling the changes up into broadcast counters
+
+        Returns the message IDs found in the ledger; events for other IDs
+        (not recorded yet) are left for the caller to retry.
+        """
+        pass
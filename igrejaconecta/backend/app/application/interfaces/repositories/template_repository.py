@@ -3,7 +3,8 @@ Template repository interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from datetime import datetime
 from app.domain.entities.template import Template
 
 
@@ -21,8 +22,13 @@ class ITemplateRepository(ABC):
         pass
     
     @abstractmethod
-    def list_by_church(self, church_id: int, skip: int = 0, limit: int = 100) -> List[Template]:
-        """List templates by church"""
+    def list_by_church(
+        self,
+        church_id: int,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Template]:
+        """List templates by church, newest first, starting after a (created_at, id) key"""
         pass
     
     @abstractmethod
@@ -35,3 +41,36 @@ class ITemplateRepository(ABC):
         """Delete template"""
         pass
 
+
+class IAsyncTemplateRepository(ABC):
+    """Interface for template repository used from async code (the API)"""
+    
+    @abstractmethod
+    async def create(self, template: Template) -> Template:
+        """Create a new template"""
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, template_id: int) -> Optional[Template]:
+        """Get template by ID"""
+        pass
+    
+    @abstractmethod
+    async def list_by_church(
+        self,
+        church_id: int,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Template]:
+        """List templates by church, newest first, starting after a (created_at, id) key"""
+        pass
+    
+    @abstractmethod
+    async def update(self, template: Template) -> Template:
+        """Update template"""
+        pass
+    
+    @abstractmethod
+    async def delete(self, template_id: int) -> None:
+        """Delete template"""
+        pass
@@ -3,7 +3,30 @@ Service interfaces
 """
 
 from app.application.interfaces.services.whatsapp_service import IWhatsAppService
+from app.application.interfaces.services.whatsapp_template_catalog import IWhatsAppTemplateCatalog
+from app.application.interfaces.services.whatsapp_media_store import IWhatsAppMediaStore
 from app.application.interfaces.services.firebase_service import IFirebaseService
+from app.application.interfaces.services.broadcast_sender import IBroadcastSender
+from app.application.interfaces.services.broadcast_queue import IBroadcastQueue
+from app.application.interfaces.services.progress_reporter import IProgressReporter
+from app.application.interfaces.services.delivery_ledger import IDeliveryLedger
+from app.application.interfaces.services.message_retry_queue import IMessageRetryQueue
+from app.application.interfaces.services.status_event_publisher import IStatusEventPublisher
+from app.application.interfaces.services.import_reporter import IImportReporter
+from app.application.interfaces.services.contact_import_queue import IContactImportQueue
 
-__all__ = ["IWhatsAppService", "IFirebaseService"]
+__all__ = [
+    "IWhatsAppService",
+    "IWhatsAppTemplateCatalog",
+    "IWhatsAppMediaStore",
+    "IFirebaseService",
+    "IBroadcastSender",
+    "IBroadcastQueue",
+    "IProgressReporter",
+    "IDeliveryLedger",
+    "IMessageRetryQueue",
+    "IStatusEventPublisher",
+    "IImportReporter",
+    "IContactImportQueue",
+]
 
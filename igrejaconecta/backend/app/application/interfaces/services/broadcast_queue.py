@@ -0,0 +1,30 @@
+"""
+Broadcast queue interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any
+from datetime import datetime
+
+
+class IBroadcastQueue(ABC):
+    """Interface for running broadcast sends as background jobs"""
+
+    @abstractmethod
+    def enqueue_send(self, church_id: int, broadcast_id: int, resume: bool = False) -> str:
+        """Enqueue a broadcast send, or the resume of a failed one, and return the job ID"""
+        pass
+
+    @abstractmethod
+    def schedule_send(self, broadcast_id: int, run_at: datetime) -> bool:
+        """Queue a scheduled broadcast to start at run_at
+
+        Returns False when run_at is too far ahead to hold in the queue; the
+        scheduler sweep dispatches such broadcasts once they come near.
+        """
+        pass
+
+    @abstractmethod
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job state and sent/failed/total counters"""
+        pass
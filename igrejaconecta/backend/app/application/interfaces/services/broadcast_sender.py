@@ -0,0 +1,32 @@
+"""
+Broadcast sender interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Dict, Optional
+from app.domain.entities.broadcast import Broadcast
+from app.domain.entities.church import Church
+from app.domain.value_objects.recipient import Recipient
+from app.application.interfaces.services.progress_reporter import IProgressReporter
+from app.application.interfaces.services.delivery_ledger import IDeliveryLedger
+
+
+class IBroadcastSender(ABC):
+    """Interface for the engine that fans a broadcast out to its recipients"""
+
+    @abstractmethod
+    def send_broadcast(
+        self,
+        broadcast: Broadcast,
+        church: Church,
+        recipients: Iterable[Recipient],
+        progress: Optional[IProgressReporter] = None,
+        ledger: Optional[IDeliveryLedger] = None
+    ) -> Dict[str, int]:
+        """Send broadcast to recipients and return success/failed/retrying/total counts
+
+        When a ledger is given, every outcome is recorded in it in batches
+        while the send runs. Messages counted as retrying failed transiently
+        and were handed to a retry queue.
+        """
+        pass
@@ -0,0 +1,25 @@
+"""
+Contact import queue interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, List
+
+
+class IContactImportQueue(ABC):
+    """Interface for running contact imports as background jobs"""
+
+    @abstractmethod
+    def enqueue_import(self, church_id: int, file_path: str) -> str:
+        """Enqueue the import of a spooled CSV file and return the job ID"""
+        pass
+
+    @abstractmethod
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job state and imported/duplicates/rejected counters"""
+        pass
+
+    @abstractmethod
+    def get_rejections(self, job_id: str) -> List[Dict[str, Any]]:
+        """Get rows rejected by the import"""
+        pass
@@ -0,0 +1,16 @@
+"""
+Delivery ledger interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+from app.domain.entities.delivery import Delivery
+
+
+class IDeliveryLedger(ABC):
+    """Interface for durably recording delivery outcomes while a send is running"""
+
+    @abstractmethod
+    def record(self, deliveries: List[Delivery]) -> None:
+        """Persist a batch of outcomes in its own transaction, independent of the caller's"""
+        pass
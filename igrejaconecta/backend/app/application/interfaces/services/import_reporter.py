@@ -0,0 +1,20 @@
+"""
+Import reporter interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any
+
+
+class IImportReporter(ABC):
+    """Interface for reporting progress of a contact import"""
+
+    @abstractmethod
+    def advance(self, imported: int = 0, duplicates: int = 0, rejected: int = 0) -> None:
+        """Add processed rows to the counters"""
+        pass
+
+    @abstractmethod
+    def reject(self, rejections: List[Dict[str, Any]]) -> None:
+        """Record rejected rows as {"row", "phone", "reason"} items"""
+        pass
@@ -0,0 +1,24 @@
+"""
+Message retry queue interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class IMessageRetryQueue(ABC):
+    """Interface for sending messages again later, after a transient failure"""
+
+    @abstractmethod
+    def schedule_retry(
+        self,
+        broadcast_id: int,
+        contact_ids: List[int],
+        attempt: int,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """Queue another attempt for contacts of a broadcast, after a backoff for the given attempt
+
+        retry_after, when the API sent one, is the least delay to wait.
+        """
+        pass
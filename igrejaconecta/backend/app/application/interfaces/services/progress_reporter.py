@@ -0,0 +1,23 @@
+"""
+Progress reporter interface
+"""
+
+from abc import ABC, abstractmethod
+
+
+class IProgressReporter(ABC):
+    """Interface for reporting progress of long running jobs"""
+
+    @abstractmethod
+    def set_total(self, total: int) -> None:
+        """Set the number of items to process"""
+        pass
+
+    @abstractmethod
+    def advance(self, sent: int = 0, failed: int = 0, retrying: int = 0) -> None:
+        """Add processed items to the counters
+
+        retrying counts items waiting for a retry; it goes down again as
+        the retries settle them.
+        """
+        pass
@@ -0,0 +1,14 @@
+"""
+Status event publisher interface
+"""
+
+from abc import ABC, abstractmethod
+
+
+class IStatusEventPublisher(ABC):
+    """Interface for handing raw webhook callbacks to the status consumer"""
+
+    @abstractmethod
+    async def publish(self, payload: str) -> None:
+        """Queue a callback body for processing; must return without waiting on it"""
+        pass
@@ -0,0 +1,16 @@
+"""
+WhatsApp media store interface
+"""
+
+from abc import ABC, abstractmethod
+from app.domain.entities.church import Church
+from app.domain.value_objects.media import Media
+
+
+class IWhatsAppMediaStore(ABC):
+    """Interface for getting WhatsApp media IDs of broadcast files"""
+
+    @abstractmethod
+    def media_id(self, church: Church, media: Media) -> str:
+        """Get the media ID for the church's phone number, uploading the file only if it has none"""
+        pass
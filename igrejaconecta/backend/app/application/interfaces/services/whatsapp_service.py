@@ -3,7 +3,8 @@ WhatsApp service interface
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from app.domain.value_objects.whatsapp_template import WhatsAppTemplate
 
 
 class IWhatsAppService(ABC):
@@ -17,9 +18,13 @@ class IWhatsAppService(ABC):
         button_text: str,
         url: str,
         phone_id: str,
-        token: str
+        token: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Send interactive message with button"""
+        """Send interactive message with button
+
+        tier is the church's messaging_tier, which sets the phone number's rate limit.
+        """
         pass
     
     @abstractmethod
@@ -28,18 +33,44 @@ class IWhatsAppService(ABC):
         to: str,
         message: str,
         phone_id: str,
-        token: str
+        token: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
         """Send simple text message"""
         pass
     
+    @abstractmethod
+    def send_template_message(
+        self,
+        to: str,
+        template_name: str,
+        language: str,
+        parameters: List[str],
+        phone_id: str,
+        token: str,
+        tier: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send approved template message, allowed outside the 24h customer window"""
+        pass
+    
+    @abstractmethod
+    def upload_media(self, phone_id: str, token: str, path: str, mime_type: str, filename: str) -> str:
+        """Upload a media file for a phone number to send, returning its WhatsApp media ID"""
+        pass
+    
+    @abstractmethod
+    def get_approved_templates(self, business_account_id: str, token: str) -> List[WhatsAppTemplate]:
+        """List templates approved for a WhatsApp Business account"""
+        pass
+    
     @abstractmethod
     def send_bulk_messages(
         self,
         recipients: List[str],
         message: str,
         phone_id: str,
-        token: str
+        token: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
         """Send bulk messages"""
         pass
@@ -0,0 +1,17 @@
+"""
+WhatsApp template catalog interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.domain.entities.church import Church
+from app.domain.value_objects.whatsapp_template import WhatsAppTemplate
+
+
+class IWhatsAppTemplateCatalog(ABC):
+    """Interface for looking up a church's approved WhatsApp templates"""
+
+    @abstractmethod
+    def find(self, church: Church, name: str, language: str) -> Optional[WhatsAppTemplate]:
+        """Get an approved template by name and language, or None if not approved"""
+        pass
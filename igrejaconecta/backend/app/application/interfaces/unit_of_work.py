@@ -0,0 +1,69 @@
+"""
+Unit of work interfaces
+"""
+
+from abc import ABC, abstractmethod
+from app.application.interfaces.repositories.church_repository import IChurchRepository, IAsyncChurchRepository
+from app.application.interfaces.repositories.contact_repository import IContactRepository, IAsyncContactRepository
+from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository, IAsyncBroadcastRepository
+from app.application.interfaces.repositories.template_repository import ITemplateRepository, IAsyncTemplateRepository
+from app.application.interfaces.repositories.delivery_repository import IDeliveryRepository
+
+
+class IUnitOfWork(ABC):
+    """One session and one transaction shared by the repositories of a task
+
+    Repositories only flush; leaving the context commits, or rolls back if
+    an exception escaped.
+    """
+    
+    churches: IChurchRepository
+    contacts: IContactRepository
+    broadcasts: IBroadcastRepository
+    templates: ITemplateRepository
+    deliveries: IDeliveryRepository
+    
+    @abstractmethod
+    def __enter__(self) -> "IUnitOfWork":
+        pass
+    
+    @abstractmethod
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+    
+    @abstractmethod
+    def commit(self) -> None:
+        """Commit the current transaction and start a new one"""
+        pass
+    
+    @abstractmethod
+    def rollback(self) -> None:
+        """Roll back the current transaction"""
+        pass
+
+
+class IAsyncUnitOfWork(ABC):
+    """One session and one transaction shared by the repositories of a request"""
+    
+    churches: IAsyncChurchRepository
+    contacts: IAsyncContactRepository
+    broadcasts: IAsyncBroadcastRepository
+    templates: IAsyncTemplateRepository
+    
+    @abstractmethod
+    async def __aenter__(self) -> "IAsyncUnitOfWork":
+        pass
+    
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+    
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the current transaction and start a new one"""
+        pass
+    
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Roll back the current transaction"""
+        pass
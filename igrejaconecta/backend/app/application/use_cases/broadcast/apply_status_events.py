@@ -0,0 +1,20 @@
+"""
+Use case: Apply Status Events
+UC13: Enviar Transmissão Imediata (RF06) - status de entrega e leitura
+"""
+
+from typing import List, Set
+from app.domain.value_objects.status_event import StatusEvent
+from app.application.interfaces.repositories.delivery_repository import IDeliveryRepository
+
+
+class ApplyStatusEventsUseCase:
+    """Use case for applying webhook status events to the delivery ledger"""
+    
+    def __init__(self, delivery_repository: IDeliveryRepository):
+        self.delivery_repository = delivery_repository
+    
+    def execute(self, events: List[StatusEvent]) -> Set[str]:
+        """Execute the use case, returning message IDs not found in the ledger yet"""
+        matched = self.delivery_repository.apply_status_events(events)
+        return {event.whatsapp_message_id for event in events} - matched
@@ -3,11 +3,18 @@ Use case: Create Broadcast
 UC12: Criar Transmissão (RF04)
 """
 
+import asyncio
 from datetime import datetime
+from typing import Optional
 from app.domain.entities.broadcast import Broadcast, BroadcastStatus
-from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository
-from app.application.interfaces.repositories.church_repository import IChurchRepository
+from app.domain.value_objects.segment import Segment
+from app.domain.value_objects.media import Media
+from app.application.interfaces.repositories.broadcast_repository import IAsyncBroadcastRepository
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
+from app.application.interfaces.services.broadcast_queue import IBroadcastQueue
+from app.application.interfaces.unit_of_work import IAsyncUnitOfWork
 from app.application.dto.broadcast_dto import BroadcastCreateDTO, BroadcastResponseDTO
+from app.domain.value_objects.message_renderer import validate_message
 from app.core.exceptions import ChurchNotFoundException
 
 
@@ -16,16 +23,20 @@ class CreateBroadcastUseCase:
     
     def __init__(
         self,
-        broadcast_repository: IBroadcastRepository,
-        church_repository: IChurchRepository
+        broadcast_repository: IAsyncBroadcastRepository,
+        church_repository: IAsyncChurchRepository,
+        broadcast_queue: Optional[IBroadcastQueue] = None,
+        unit_of_work: Optional[IAsyncUnitOfWork] = None
     ):
         self.broadcast_repository = broadcast_repository
         self.church_repository = church_repository
+        self.broadcast_queue = broadcast_queue
+        self.unit_of_work = unit_of_work
     
-    def execute(self, church_id: int, dto: BroadcastCreateDTO) -> BroadcastResponseDTO:
+    async def execute(self, church_id: int, dto: BroadcastCreateDTO) -> BroadcastResponseDTO:
         """Execute the use case"""
         # Verify church exists
-        church = self.church_repository.get_by_id(church_id)
+        church = await self.church_repository.get_by_id(church_id)
         if not church:
             raise ChurchNotFoundException(f"Church with id {church_id} not found")
         
@@ -35,6 +46,11 @@ class CreateBroadcastUseCase:
             if dto.scheduled_at <= datetime.utcnow():
                 raise ValueError("Scheduled time must be in the future")
         
+        # Reject unknown placeholders now rather than when sending; the
+        # sender compiles the message itself, once per send
+        for text in [dto.message, *dto.template_parameters]:
+            validate_message(text)
+        
         # Create domain entity
         broadcast = Broadcast(
             id=None,
@@ -48,14 +64,30 @@ class CreateBroadcastUseCase:
             sent_at=None,
             status=status,
             total_sent=0,
-            created_at=datetime.utcnow()
+            created_at=datetime.utcnow(),
+            segment=Segment.from_dict(dto.segment) if dto.segment else None,
+            whatsapp_template=dto.whatsapp_template,
+            whatsapp_template_language=dto.whatsapp_template_language,
+            template_parameters=dto.template_parameters,
+            media=Media.from_dict(dto.media.model_dump()) if dto.media else None
         )
         
         if dto.scheduled_at:
             broadcast.schedule(dto.scheduled_at)
         
         # Save to repository
-        created_broadcast = self.broadcast_repository.create(broadcast)
+        created_broadcast = await self.broadcast_repository.create(broadcast)
+        
+        # Hand near scheduled sends to the queue now; the scheduler sweep picks up the rest
+        if created_broadcast.is_scheduled() and self.broadcast_queue:
+            # Commit first so the task never runs before the broadcast exists;
+            # a dispatch lost between the two is picked up by the sweep
+            if self.unit_of_work:
+                await self.unit_of_work.commit()
+            if await asyncio.to_thread(
+                self.broadcast_queue.schedule_send, created_broadcast.id, created_broadcast.scheduled_at
+            ):
+                await self.broadcast_repository.mark_dispatched(created_broadcast.id, created_broadcast.scheduled_at)
         
         # Convert to response DTO
         return BroadcastResponseDTO(
@@ -66,10 +98,15 @@ class CreateBroadcastUseCase:
             link_url=created_broadcast.link_url,
             button_text=created_broadcast.button_text,
             contact_tags=created_broadcast.contact_tags,
+            segment=created_broadcast.segment.to_dict() if created_broadcast.segment else None,
             scheduled_at=created_broadcast.scheduled_at,
             sent_at=created_broadcast.sent_at,
             status=created_broadcast.status.value,
             total_sent=created_broadcast.total_sent,
+            whatsapp_template=created_broadcast.whatsapp_template,
+            whatsapp_template_language=created_broadcast.whatsapp_template_language,
+            template_parameters=created_broadcast.template_parameters,
+            media=created_broadcast.media.to_dict() if created_broadcast.media else None,
             created_at=created_broadcast.created_at
         )
 
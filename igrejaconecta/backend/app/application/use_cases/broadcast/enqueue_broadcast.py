@@ -0,0 +1,56 @@
+"""
+Use case: Enqueue Broadcast
+UC13: Enviar Transmissão Imediata (RF06) - execução em segundo plano
+"""
+
+import asyncio
+from datetime import timedelta
+from app.application.interfaces.repositories.broadcast_repository import IAsyncBroadcastRepository
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
+from app.application.interfaces.services.broadcast_queue import IBroadcastQueue
+from app.application.dto.broadcast_dto import BroadcastJobDTO
+from app.core.config import settings
+from app.core.exceptions import (
+    BroadcastNotFoundException,
+    ChurchNotFoundException,
+    WhatsAppConfigurationException
+)
+
+
+class EnqueueBroadcastUseCase:
+    """Use case for validating a broadcast and handing its send to a background job"""
+    
+    def __init__(
+        self,
+        broadcast_repository: IAsyncBroadcastRepository,
+        church_repository: IAsyncChurchRepository,
+        broadcast_queue: IBroadcastQueue
+    ):
+        self.broadcast_repository = broadcast_repository
+        self.church_repository = church_repository
+        self.broadcast_queue = broadcast_queue
+    
+    async def execute(self, church_id: int, broadcast_id: int, resume: bool = False) -> BroadcastJobDTO:
+        """Execute the use case; with resume, a failed or stalled broadcast is sent to the contacts it missed"""
+        # Get broadcast
+        broadcast = await self.broadcast_repository.get_by_id(broadcast_id)
+        if not broadcast or broadcast.church_id != church_id:
+            raise BroadcastNotFoundException(f"Broadcast with id {broadcast_id} not found")
+        
+        # Check if can be sent
+        lease = timedelta(seconds=settings.BROADCAST_SEND_LEASE_SECONDS)
+        if not (broadcast.can_be_resumed(lease) if resume else broadcast.can_be_sent()):
+            action = "resume" if resume else "send"
+            raise ValueError(f"Cannot {action} broadcast with status {broadcast.status.value}")
+        
+        # Check WhatsApp configuration
+        church = await self.church_repository.get_by_id(church_id)
+        if not church:
+            raise ChurchNotFoundException(f"Church with id {church_id} not found")
+        if not church.is_whatsapp_configured():
+            raise WhatsAppConfigurationException("WhatsApp not configured for this church")
+        
+        # Publishing to Celery and registering the job in Redis both block
+        job_id = await asyncio.to_thread(self.broadcast_queue.enqueue_send, church_id, broadcast_id, resume)
+        
+        return BroadcastJobDTO(job_id=job_id, broadcast_id=broadcast_id, state="queued")
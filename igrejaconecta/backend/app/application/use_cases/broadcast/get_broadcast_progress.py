@@ -0,0 +1,41 @@
+"""
+Use case: Get Broadcast Progress
+UC13: Enviar Transmissão Imediata (RF06) - acompanhamento do envio
+"""
+
+from app.application.interfaces.services.broadcast_queue import IBroadcastQueue
+from app.application.dto.broadcast_dto import BroadcastProgressDTO
+from app.core.exceptions import JobNotFoundException
+
+
+class GetBroadcastProgressUseCase:
+    """Use case for polling the progress of a broadcast send job"""
+    
+    def __init__(self, broadcast_queue: IBroadcastQueue):
+        self.broadcast_queue = broadcast_queue
+    
+    def execute(self, church_id: int, broadcast_id: int, job_id: str) -> BroadcastProgressDTO:
+        """Execute the use case"""
+        progress = self.broadcast_queue.get_progress(job_id)
+        
+        # Jobs are only visible to the church and broadcast that created them
+        if (
+            not progress
+            or int(progress.get("church_id", 0)) != church_id
+            or int(progress.get("broadcast_id", 0)) != broadcast_id
+        ):
+            raise JobNotFoundException(f"Job {job_id} not found")
+        
+        total = progress["total"]
+        settled = progress["sent"] + progress["failed"]
+        
+        return BroadcastProgressDTO(
+            job_id=job_id,
+            broadcast_id=broadcast_id,
+            state=progress["state"],
+            total=total,
+            sent=progress["sent"],
+            failed=progress["failed"],
+            retrying=progress.get("retrying", 0),
+            remaining=max(total - settled, 0)
+        )
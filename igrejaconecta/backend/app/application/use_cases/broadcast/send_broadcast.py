@@ -3,14 +3,24 @@ Use case: Send Broadcast
 UC13: Enviar Transmissão Imediata (RF06)
 """
 
-from app.domain.entities.broadcast import BroadcastStatus
+from datetime import timedelta
+from typing import Optional, List, Tuple, Iterator
+from app.domain.entities.broadcast import Broadcast
+from app.domain.entities.church import Church
+from app.domain.value_objects.recipient import Recipient
 from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository
 from app.application.interfaces.repositories.contact_repository import IContactRepository
 from app.application.interfaces.repositories.church_repository import IChurchRepository
-from app.application.interfaces.services.whatsapp_service import IWhatsAppService
+from app.application.interfaces.services.broadcast_sender import IBroadcastSender
+from app.application.interfaces.services.progress_reporter import IProgressReporter
+from app.application.interfaces.services.delivery_ledger import IDeliveryLedger
+from app.application.interfaces.services.whatsapp_template_catalog import IWhatsAppTemplateCatalog
+from app.application.interfaces.services.whatsapp_media_store import IWhatsAppMediaStore
+from app.core.config import settings
 from app.core.exceptions import (
     BroadcastNotFoundException,
     ChurchNotFoundException,
+    InvalidMessageTemplateException,
     WhatsAppConfigurationException
 )
 
@@ -23,15 +33,25 @@ class SendBroadcastUseCase:
         broadcast_repository: IBroadcastRepository,
         contact_repository: IContactRepository,
         church_repository: IChurchRepository,
-        whatsapp_service: IWhatsAppService
+        broadcast_sender: IBroadcastSender,
+        delivery_ledger: Optional[IDeliveryLedger] = None,
+        template_catalog: Optional[IWhatsAppTemplateCatalog] = None,
+        media_store: Optional[IWhatsAppMediaStore] = None
     ):
         self.broadcast_repository = broadcast_repository
         self.contact_repository = contact_repository
         self.church_repository = church_repository
-        self.whatsapp_service = whatsapp_service
+        self.broadcast_sender = broadcast_sender
+        self.delivery_ledger = delivery_ledger
+        self.template_catalog = template_catalog
+        self.media_store = media_store
     
-    def execute(self, church_id: int, broadcast_id: int) -> dict:
-        """Execute the use case"""
+    def prepare(self, church_id: int, broadcast_id: int, resume: bool = False) -> Tuple[Broadcast, Church]:
+        """Load broadcast and church, validating and claiming the broadcast for sending
+
+        With resume, a failed broadcast is claimed instead of a pending one,
+        as is a broadcast left sending by workers that stopped renewing its lease.
+        """
         # Get broadcast
         broadcast = self.broadcast_repository.get_by_id(broadcast_id)
         if not broadcast:
@@ -42,8 +62,10 @@ class SendBroadcastUseCase:
             raise BroadcastNotFoundException("Broadcast not found")
         
         # Check if can be sent
-        if not broadcast.can_be_sent():
-            raise ValueError(f"Cannot send broadcast with status {broadcast.status.value}")
+        lease = timedelta(seconds=settings.BROADCAST_SEND_LEASE_SECONDS)
+        if not (broadcast.can_be_resumed(lease) if resume else broadcast.can_be_sent()):
+            action = "resume" if resume else "send"
+            raise ValueError(f"Cannot {action} broadcast with status {broadcast.status.value}")
         
         # Get church
         church = self.church_repository.get_by_id(church_id)
@@ -54,49 +76,143 @@ class SendBroadcastUseCase:
         if not church.is_whatsapp_configured():
             raise WhatsAppConfigurationException("WhatsApp not configured for this church")
         
-        # Get contacts by tags
-        contacts = []
-        if broadcast.contact_tags:
-            contacts = self.contact_repository.list_by_tags(church_id, broadcast.contact_tags)
-        else:
-            contacts = self.contact_repository.list_by_church(church_id, limit=10000)
+        # Check the template once here, so chunks never send a template WhatsApp rejects
+        if broadcast.uses_whatsapp_template():
+            self.check_whatsapp_template(broadcast, church)
+        elif broadcast.media and self.media_store:
+            # Upload once here; every chunk then finds the media ID cached
+            self.media_store.media_id(church, broadcast.media)
         
-        # Send messages
-        success_count = 0
-        failed_count = 0
+        # Claim last, so a failed validation leaves the broadcast pending
+        claimed = self.broadcast_repository.claim_for_sending(broadcast_id, resume=resume, lease=lease)
+        if not claimed:
+            raise ValueError(f"Broadcast {broadcast_id} is already being sent")
         
-        for contact in contacts:
-            try:
-                if broadcast.link_url and broadcast.button_text:
-                    # Send interactive message
-                    self.whatsapp_service.send_interactive_message(
-                        to=contact.phone.value,
-                        body=broadcast.message,
-                        button_text=broadcast.button_text,
-                        url=broadcast.link_url,
-                        phone_id=church.whatsapp_phone_id,
-                        token=church.whatsapp_access_token
-                    )
-                else:
-                    # Send text message
-                    self.whatsapp_service.send_text_message(
-                        to=contact.phone.value,
-                        message=broadcast.message,
-                        phone_id=church.whatsapp_phone_id,
-                        token=church.whatsapp_access_token
-                    )
-                success_count += 1
-            except Exception:
-                failed_count += 1
+        return claimed, church
+    
+    def check_whatsapp_template(self, broadcast: Broadcast, church: Church) -> None:
+        """Verify the broadcast's template is approved and its parameters fit it"""
+        if not self.template_catalog:
+            return
+        template = self.template_catalog.find(
+            church, broadcast.whatsapp_template, broadcast.whatsapp_template_language
+        )
+        if not template:
+            raise InvalidMessageTemplateException(
+                f"Template {broadcast.whatsapp_template} ({broadcast.whatsapp_template_language}) "
+                "is not approved for this WhatsApp account"
+            )
+        template.check_parameters(broadcast.template_parameters)
+    
+    def abort(self, broadcast: Broadcast) -> None:
+        """Mark a claimed broadcast as failed when its send could not start"""
+        broadcast.fail()
+        self.broadcast_repository.update(broadcast)
+    
+    def count_recipients(self, broadcast: Broadcast) -> int:
+        """Count phone numbers the broadcast must be sent to"""
+        return self.contact_repository.count_recipients(broadcast.church_id, broadcast.audience())
+    
+    def iter_recipients(
+        self,
+        broadcast: Broadcast,
+        id_range: Optional[Tuple[int, int]] = None,
+        resume: bool = False
+    ) -> Iterator[Recipient]:
+        """Stream contacts the broadcast must be sent to, leaving out those already reached when resuming"""
+        return self.contact_repository.iter_recipients(
+            broadcast.church_id,
+            broadcast.audience(),
+            id_range=id_range,
+            skip_settled_for=broadcast.id if resume else None
+        )
+    
+    def recipient_chunks(
+        self,
+        broadcast: Broadcast,
+        chunk_size: int,
+        resume: bool = False
+    ) -> List[Tuple[int, int, int]]:
+        """Split the broadcast audience into (first_id, last_id, size) contact ranges
+
+        When resuming, contacts already reached are left out of the sizes.
+        """
+        return self.contact_repository.recipient_chunks(
+            broadcast.church_id,
+            broadcast.audience(),
+            chunk_size,
+            skip_settled_for=broadcast.id if resume else None
+        )
+    
+    def send_chunk(
+        self,
+        broadcast: Broadcast,
+        church: Church,
+        id_range: Tuple[int, int],
+        progress: Optional[IProgressReporter] = None
+    ) -> dict:
+        """Send one contact ID range of a claimed broadcast
+
+        Contacts the ledger already records as delivered are skipped, so a
+        chunk that runs again after a crash only sends what is left.
+        """
+        recipients = self.iter_recipients(broadcast, id_range=id_range, resume=True)
+        return self.broadcast_sender.send_broadcast(
+            broadcast, church, recipients, progress, self.delivery_ledger
+        )
+    
+    def retry(
+        self,
+        broadcast: Broadcast,
+        church: Church,
+        contact_ids: List[int],
+        progress: Optional[IProgressReporter] = None
+    ) -> dict:
+        """Send again to contacts whose last attempt failed transiently
+
+        Contacts settled since (sent, or failed for good) are skipped, and
+        no longer count as retrying in progress.
+        """
+        recipients = self.contact_repository.iter_recipients(
+            broadcast.church_id,
+            broadcast.audience(),
+            contact_ids=contact_ids,
+            skip_settled_for=broadcast.id
+        )
+        result = self.broadcast_sender.send_broadcast(
+            broadcast, church, recipients, progress, self.delivery_ledger
+        )
+        skipped = len(contact_ids) - result["total"]
+        if progress and skipped > 0:
+            progress.advance(retrying=-skipped)
+        return result
+    
+    def execute(
+        self,
+        church_id: int,
+        broadcast_id: int,
+        progress: Optional[IProgressReporter] = None,
+        resume: bool = False
+    ) -> dict:
+        """Execute the use case"""
+        broadcast, church = self.prepare(church_id, broadcast_id, resume)
+        
+        if progress:
+            progress.set_total(self.count_recipients(broadcast))
+        
+        # Send messages, streaming recipients from the database
+        result = self.broadcast_sender.send_broadcast(
+            broadcast,
+            church,
+            self.iter_recipients(broadcast, resume=resume),
+            progress,
+            self.delivery_ledger
+        )
         
         # Update broadcast
-        broadcast.update_total_sent(success_count)
+        already_sent = broadcast.total_sent if resume else 0
+        broadcast.update_total_sent(already_sent + result["success"])
         broadcast.send()
         self.broadcast_repository.update(broadcast)
         
-        return {
-            "success": success_count,
-            "failed": failed_count,
-            "total": len(contacts)
-        }
-
+        return result
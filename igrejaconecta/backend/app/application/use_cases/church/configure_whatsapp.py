@@ -3,10 +3,12 @@ Use case: Configure WhatsApp Business
 UC03: Configurar WhatsApp Business (RF02)
 """
 
+import asyncio
 from app.domain.entities.church import Church
-from app.application.interfaces.repositories.church_repository import IChurchRepository
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
 from app.application.interfaces.services.whatsapp_service import IWhatsAppService
 from app.application.dto.church_dto import WhatsAppConfigDTO, WhatsAppConfigResponseDTO
+from app.core.config import settings
 from app.core.exceptions import ChurchNotFoundException, WhatsAppConfigurationException
 
 
@@ -15,31 +17,39 @@ class ConfigureWhatsAppUseCase:
     
     def __init__(
         self,
-        church_repository: IChurchRepository,
+        church_repository: IAsyncChurchRepository,
         whatsapp_service: IWhatsAppService
     ):
         self.church_repository = church_repository
         self.whatsapp_service = whatsapp_service
     
-    def execute(self, church_id: int, dto: WhatsAppConfigDTO) -> WhatsAppConfigResponseDTO:
+    async def execute(self, church_id: int, dto: WhatsAppConfigDTO) -> WhatsAppConfigResponseDTO:
         """Execute the use case"""
         # Get church
-        church = self.church_repository.get_by_id(church_id)
+        church = await self.church_repository.get_by_id(church_id)
         if not church:
             raise ChurchNotFoundException(f"Church with id {church_id} not found")
         
+        # Validate messaging tier
+        if dto.messaging_tier and dto.messaging_tier not in settings.WHATSAPP_RATE_TIERS:
+            raise WhatsAppConfigurationException(f"Unknown messaging tier {dto.messaging_tier}")
+        
         # Validate credentials
-        if not self.whatsapp_service.validate_credentials(dto.phone_id, dto.access_token):
+        # The WhatsApp client is blocking, so keep it off the event loop
+        valid = await asyncio.to_thread(self.whatsapp_service.validate_credentials, dto.phone_id, dto.access_token)
+        if not valid:
             raise WhatsAppConfigurationException("Invalid WhatsApp credentials")
         
         # Configure WhatsApp
-        church.configure_whatsapp(dto.phone_id, dto.access_token)
+        church.configure_whatsapp(dto.phone_id, dto.access_token, dto.messaging_tier, dto.business_account_id)
         
         # Update church
-        updated_church = self.church_repository.update(church)
+        updated_church = await self.church_repository.update(church)
         
         return WhatsAppConfigResponseDTO(
             phone_id=updated_church.whatsapp_phone_id,
-            is_configured=updated_church.is_whatsapp_configured()
+            is_configured=updated_church.is_whatsapp_configured(),
+            messaging_tier=updated_church.messaging_tier,
+            business_account_id=updated_church.whatsapp_business_account_id
         )
 
@@ -0,0 +1,58 @@
+"""
+Use case: Bulk Create Contacts
+"""
+
+from datetime import datetime
+from typing import List
+from app.domain.entities.contact import Contact
+from app.domain.value_objects.phone import Phone
+from app.application.interfaces.repositories.contact_repository import IAsyncContactRepository
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
+from app.application.dto.contact_dto import ContactBulkCreateDTO, ContactResponseDTO
+from app.core.exceptions import ChurchNotFoundException
+
+
+class BulkCreateContactsUseCase:
+    """Use case for creating many contacts in one batch"""
+    
+    def __init__(
+        self,
+        contact_repository: IAsyncContactRepository,
+        church_repository: IAsyncChurchRepository
+    ):
+        self.contact_repository = contact_repository
+        self.church_repository = church_repository
+    
+    async def execute(self, church_id: int, dto: ContactBulkCreateDTO) -> List[ContactResponseDTO]:
+        """Execute the use case, skipping phones already registered"""
+        # Verify church exists
+        church = await self.church_repository.get_by_id(church_id)
+        if not church:
+            raise ChurchNotFoundException(f"Church with id {church_id} not found")
+        
+        now = datetime.utcnow()
+        contacts = {}
+        for item in dto.contacts:
+            phone = Phone(item.phone)
+            contacts.setdefault(phone.value, Contact(
+                id=None,
+                church_id=church_id,
+                name=item.name,
+                phone=phone,
+                tags=item.tags or [],
+                created_at=now
+            ))
+        
+        created_contacts = await self.contact_repository.bulk_create(list(contacts.values()), skip_duplicates=True)
+        
+        return [
+            ContactResponseDTO(
+                id=c.id,
+                church_id=c.church_id,
+                name=c.name,
+                phone=c.phone.value,
+                tags=c.tags,
+                created_at=c.created_at
+            )
+            for c in created_contacts
+        ]
@@ -6,8 +6,8 @@ UC05: Criar Contato
 from datetime import datetime
 from app.domain.entities.contact import Contact
 from app.domain.value_objects.phone import Phone
-from app.application.interfaces.repositories.contact_repository import IContactRepository
-from app.application.interfaces.repositories.church_repository import IChurchRepository
+from app.application.interfaces.repositories.contact_repository import IAsyncContactRepository
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
 from app.application.dto.contact_dto import ContactCreateDTO, ContactResponseDTO
 from app.core.exceptions import ChurchNotFoundException, RepositoryException
 
@@ -17,22 +17,22 @@ class CreateContactUseCase:
     
     def __init__(
         self,
-        contact_repository: IContactRepository,
-        church_repository: IChurchRepository
+        contact_repository: IAsyncContactRepository,
+        church_repository: IAsyncChurchRepository
     ):
         self.contact_repository = contact_repository
         self.church_repository = church_repository
     
-    def execute(self, church_id: int, dto: ContactCreateDTO) -> ContactResponseDTO:
+    async def execute(self, church_id: int, dto: ContactCreateDTO) -> ContactResponseDTO:
         """Execute the use case"""
         # Verify church exists
-        church = self.church_repository.get_by_id(church_id)
+        church = await self.church_repository.get_by_id(church_id)
         if not church:
             raise ChurchNotFoundException(f"Church with id {church_id} not found")
         
         # Check if contact with phone already exists
         phone_obj = Phone(dto.phone)
-        existing = self.contact_repository.get_by_phone(church_id, phone_obj.value)
+        existing = await self.contact_repository.get_by_phone(church_id, phone_obj.value)
         if existing:
             raise RepositoryException(f"Contact with phone {dto.phone} already exists")
         
@@ -47,7 +47,7 @@ class CreateContactUseCase:
         )
         
         # Save to repository
-        created_contact = self.contact_repository.create(contact)
+        created_contact = await self.contact_repository.create(contact)
         
         # Convert to response DTO
         return ContactResponseDTO(
@@ -0,0 +1,33 @@
+"""
+Use case: Enqueue Contact Import
+UC06: Importar Contatos via CSV (RF03) - execução em segundo plano
+"""
+
+import asyncio
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
+from app.application.interfaces.services.contact_import_queue import IContactImportQueue
+from app.application.dto.contact_dto import ContactImportJobDTO
+from app.core.exceptions import ChurchNotFoundException
+
+
+class EnqueueContactImportUseCase:
+    """Use case for handing a spooled CSV upload to a background import job"""
+    
+    def __init__(
+        self,
+        church_repository: IAsyncChurchRepository,
+        import_queue: IContactImportQueue
+    ):
+        self.church_repository = church_repository
+        self.import_queue = import_queue
+    
+    async def execute(self, church_id: int, file_path: str) -> ContactImportJobDTO:
+        """Execute the use case"""
+        # Verify church exists
+        church = await self.church_repository.get_by_id(church_id)
+        if not church:
+            raise ChurchNotFoundException(f"Church with id {church_id} not found")
+        
+        job_id = await asyncio.to_thread(self.import_queue.enqueue_import, church_id, file_path)
+        
+        return ContactImportJobDTO(job_id=job_id, state="queued")
@@ -0,0 +1,31 @@
+"""
+Use case: Get Audience Size
+UC12: Criar Transmissão (RF04) - tamanho do público ao compor
+"""
+
+from app.domain.value_objects.segment import Segment
+from app.application.interfaces.repositories.contact_repository import IAsyncContactRepository
+from app.application.dto.contact_dto import AudienceQueryDTO, AudienceSizeDTO
+
+
+class GetAudienceSizeUseCase:
+    """Use case for counting the contacts a tag segment selects"""
+    
+    def __init__(self, contact_repository: IAsyncContactRepository):
+        self.contact_repository = contact_repository
+    
+    async def execute(self, church_id: int, dto: AudienceQueryDTO) -> AudienceSizeDTO:
+        """Execute the use case"""
+        segment = Segment.from_dict(dto.segment) if dto.segment else Segment.everyone()
+        
+        # Whole church and single tags are read from the precomputed counts;
+        # other expressions are counted through the GIN index on tags
+        if segment.is_everyone():
+            contacts = await self.contact_repository.get_contact_total(church_id)
+        elif segment.op == Segment.TAG:
+            tag_counts = await self.contact_repository.get_tag_counts(church_id)
+            contacts = tag_counts.get(segment.tag, 0)
+        else:
+            contacts = await self.contact_repository.count_recipients(church_id, segment)
+        
+        return AudienceSizeDTO(contacts=contacts)
@@ -0,0 +1,40 @@
+"""
+Use case: Get Contact Import Progress
+UC06: Importar Contatos via CSV (RF03) - acompanhamento da importação
+"""
+
+from app.application.interfaces.services.contact_import_queue import IContactImportQueue
+from app.application.dto.contact_dto import ContactImportProgressDTO, ContactImportRejectionDTO
+from app.core.exceptions import JobNotFoundException
+
+
+class GetContactImportProgressUseCase:
+    """Use case for polling the progress and rejection report of a contact import"""
+    
+    def __init__(self, import_queue: IContactImportQueue):
+        self.import_queue = import_queue
+    
+    def execute(self, church_id: int, job_id: str) -> ContactImportProgressDTO:
+        """Execute the use case"""
+        progress = self.import_queue.get_progress(job_id)
+        
+        # Jobs are only visible to the church that created them
+        if not progress or int(progress.get("church_id", 0)) != church_id:
+            raise JobNotFoundException(f"Job {job_id} not found")
+        
+        imported = progress["imported"]
+        duplicates = progress["duplicates"]
+        rejected = progress["rejected"]
+        
+        return ContactImportProgressDTO(
+            job_id=job_id,
+            state=progress["state"],
+            processed=imported + duplicates + rejected,
+            imported=imported,
+            duplicates=duplicates,
+            rejected=rejected,
+            rejections=[
+                ContactImportRejectionDTO(**rejection)
+                for rejection in self.import_queue.get_rejections(job_id)
+            ]
+        )
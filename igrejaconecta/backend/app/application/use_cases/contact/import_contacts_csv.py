@@ -4,87 +4,132 @@ UC06: Importar Contatos via CSV (RF03)
 """
 
 import pandas as pd
-from io import StringIO
-from typing import List
+from typing import List, Dict, Any, Optional, Tuple, Union, IO
 from datetime import datetime
 from app.domain.entities.contact import Contact
 from app.domain.value_objects.phone import Phone
 from app.application.interfaces.repositories.contact_repository import IContactRepository
 from app.application.interfaces.repositories.church_repository import IChurchRepository
-from app.application.dto.contact_dto import ContactResponseDTO
+from app.application.interfaces.services.import_reporter import IImportReporter
+from app.application.interfaces.unit_of_work import IUnitOfWork
+from app.application.dto.contact_dto import ContactImportResultDTO
+from app.core.config import settings
 from app.core.exceptions import ChurchNotFoundException, RepositoryException
 
 
+def normalize_contacts(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+    """Normalize a contacts spreadsheet into phone/name/tags columns
+
+    Uses the same rules as the Phone value object (digits only, 10-15 long),
+    applied to the whole column at once. Returns the valid rows, keeping the
+    first row of each phone, and a rejection entry for every other row.
+    Rows are numbered as in the spreadsheet, the header being row 1.
+    """
+    raw_phones = df['phone'].astype('string')
+    phones = raw_phones.str.replace(r'\D', '', regex=True)
+    valid = phones.str.len().between(10, 15).fillna(False).astype(bool)
+    repeated = valid & phones.duplicated(keep='first')
+
+    names = df['name'] if 'name' in df.columns else pd.Series(None, index=df.index, dtype='object')
+    tags = df['tags'] if 'tags' in df.columns else pd.Series('', index=df.index, dtype='object')
+
+    contacts = pd.DataFrame({
+        'phone': phones,
+        'name': names.astype('object').where(names.notna(), None),
+        'tags': tags.fillna('').astype(str).str.split(','),
+    })[valid & ~repeated]
+    contacts['tags'] = contacts['tags'].map(lambda values: [tag.strip() for tag in values if tag.strip()])
+
+    rejections = [
+        {"row": int(index) + 2, "phone": None if pd.isna(phone) else phone, "reason": reason}
+        for mask, reason in ((~valid, "invalid phone"), (repeated, "duplicate phone in file"))
+        for index, phone in raw_phones[mask].items()
+    ]
+    return contacts, sorted(rejections, key=lambda rejection: rejection["row"])
+
+
 class ImportContactsCSVUseCase:
     """Use case for importing contacts from CSV"""
-    
+
     def __init__(
         self,
         contact_repository: IContactRepository,
-        church_repository: IChurchRepository
+        church_repository: IChurchRepository,
+        unit_of_work: Optional[IUnitOfWork] = None
     ):
         self.contact_repository = contact_repository
         self.church_repository = church_repository
-    
-    def execute(self, church_id: int, csv_content: str) -> List[ContactResponseDTO]:
-        """Execute the use case"""
+        self.unit_of_work = unit_of_work
+
+    def execute(
+        self,
+        church_id: int,
+        source: Union[str, IO],
+        reporter: Optional[IImportReporter] = None
+    ) -> ContactImportResultDTO:
+        """Execute the use case, reading the CSV file path or buffer in chunks"""
         # Verify church exists
         church = self.church_repository.get_by_id(church_id)
         if not church:
             raise ChurchNotFoundException(f"Church with id {church_id} not found")
-        
+
+        result = ContactImportResultDTO(imported=0, duplicates=0, rejected=0)
+        batch_size = settings.CONTACT_IMPORT_BATCH_SIZE
         try:
-            # Parse CSV
-            df = pd.read_csv(StringIO(csv_content))
-            
-            # Validate required columns
-            required_columns = ['phone']
-            if not all(col in df.columns for col in required_columns):
-                raise RepositoryException(f"CSV must contain columns: {required_columns}")
-            
-            # Create contacts
-            contacts = []
-            for _, row in df.iterrows():
-                try:
-                    phone = Phone(str(row['phone']))
-                    name = row.get('name', None)
-                    tags = row.get('tags', '').split(',') if 'tags' in row else []
-                    tags = [tag.strip() for tag in tags if tag.strip()]
-                    
-                    # Check if contact already exists
-                    existing = self.contact_repository.get_by_phone(church_id, phone.value)
-                    if existing:
-                        continue  # Skip duplicates
-                    
-                    contact = Contact(
-                        id=None,
-                        church_id=church_id,
-                        name=name,
-                        phone=phone,
-                        tags=tags,
-                        created_at=datetime.utcnow()
-                    )
-                    contacts.append(contact)
-                except Exception as e:
-                    # Skip invalid rows
-                    continue
-            
-            # Bulk create
-            if contacts:
-                created_contacts = self.contact_repository.bulk_create(contacts)
-                return [
-                    ContactResponseDTO(
-                        id=c.id,
-                        church_id=c.church_id,
-                        name=c.name,
-                        phone=c.phone.value,
-                        tags=c.tags,
-                        created_at=c.created_at
-                    )
-                    for c in created_contacts
-                ]
-            
-            return []
+            # Parse CSV as text so phone numbers keep their digits; only one
+            # chunk is held in memory at a time, whatever the file size
+            with pd.read_csv(source, dtype=str, chunksize=batch_size) as reader:
+                for df in reader:
+                    # Validate required columns
+                    required_columns = ['phone']
+                    if not all(col in df.columns for col in required_columns):
+                        raise RepositoryException(f"CSV must contain columns: {required_columns}")
+
+                    self._import_chunk(church_id, df, result, reporter)
+
+            return result
+        except RepositoryException:
+            raise
         except Exception as e:
             raise RepositoryException(f"Error importing CSV: {str(e)}")
 
+    def _import_chunk(
+        self,
+        church_id: int,
+        df: pd.DataFrame,
+        result: ContactImportResultDTO,
+        reporter: Optional[IImportReporter]
+    ) -> None:
+        """Insert one chunk of rows, skipping phones already registered"""
+        contacts, rejections = normalize_contacts(df)
+
+        # One query per chunk instead of one per row
+        existing = self.contact_repository.get_existing_phones(church_id, contacts['phone'].tolist())
+        new_rows = contacts[~contacts['phone'].isin(existing)]
+
+        now = datetime.utcnow()
+        created = self.contact_repository.bulk_create([
+            Contact(
+                id=None,
+                church_id=church_id,
+                name=name,
+                phone=Phone(phone),
+                tags=tags,
+                created_at=now
+            )
+            for phone, name, tags in zip(new_rows['phone'], new_rows['name'], new_rows['tags'])
+        ], skip_duplicates=True)  # ON CONFLICT DO NOTHING covers concurrent inserts and earlier chunks
+
+        imported = len(created)
+        duplicates = len(contacts) - imported
+        result.imported += imported
+        result.duplicates += duplicates
+        result.rejected += len(rejections)
+
+        # Commit each chunk so reported progress matches what is stored
+        if self.unit_of_work:
+            self.unit_of_work.commit()
+
+        if reporter:
+            reporter.reject(rejections)
+            reporter.advance(imported=imported, duplicates=duplicates, rejected=len(rejections))
@@ -5,9 +5,10 @@ UC18: Criar Template (RF08)
 
 from datetime import datetime
 from app.domain.entities.template import Template
-from app.application.interfaces.repositories.template_repository import ITemplateRepository
-from app.application.interfaces.repositories.church_repository import IChurchRepository
+from app.application.interfaces.repositories.template_repository import IAsyncTemplateRepository
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
 from app.application.dto.template_dto import TemplateCreateDTO, TemplateResponseDTO
+from app.domain.value_objects.message_renderer import validate_message
 from app.core.exceptions import ChurchNotFoundException
 
 
@@ -16,19 +17,22 @@ class CreateTemplateUseCase:
     
     def __init__(
         self,
-        template_repository: ITemplateRepository,
-        church_repository: IChurchRepository
+        template_repository: IAsyncTemplateRepository,
+        church_repository: IAsyncChurchRepository
     ):
         self.template_repository = template_repository
         self.church_repository = church_repository
     
-    def execute(self, church_id: int, dto: TemplateCreateDTO) -> TemplateResponseDTO:
+    async def execute(self, church_id: int, dto: TemplateCreateDTO) -> TemplateResponseDTO:
         """Execute the use case"""
         # Verify church exists
-        church = self.church_repository.get_by_id(church_id)
+        church = await self.church_repository.get_by_id(church_id)
         if not church:
             raise ChurchNotFoundException(f"Church with id {church_id} not found")
         
+        # Reject unknown placeholders now rather than when sending
+        validate_message(dto.message)
+        
         # Create domain entity
         template = Template(
             id=None,
@@ -41,7 +45,7 @@ class CreateTemplateUseCase:
         )
         
         # Save to repository
-        created_template = self.template_repository.create(template)
+        created_template = await self.template_repository.create(template)
         
         # Convert to response DTO
         return TemplateResponseDTO(
@@ -2,16 +2,9 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
-
-# Create database engine
-engine = create_engine(settings.DATABASE_URL)
-
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Reuse the application engine instead of opening a second pool
+from app.infrastructure.database.database import SessionLocal
 
 # Base class for models
 Base = declarative_base()
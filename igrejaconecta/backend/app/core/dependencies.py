@@ -2,62 +2,87 @@
 Dependency injection for the application
 """
 
-from typing import Generator
-from sqlalchemy.orm import Session
-from app.infrastructure.database.database import SessionLocal, get_db_session
-from app.infrastructure.database.repositories.church_repository_impl import ChurchRepositoryImpl
-from app.infrastructure.database.repositories.contact_repository_impl import ContactRepositoryImpl
-from app.infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
-from app.infrastructure.database.repositories.template_repository_impl import TemplateRepositoryImpl
-from app.application.interfaces.repositories.church_repository import IChurchRepository
-from app.application.interfaces.repositories.contact_repository import IContactRepository
-from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository
-from app.application.interfaces.repositories.template_repository import ITemplateRepository
+from functools import lru_cache
+from typing import AsyncGenerator
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.database.unit_of_work import AsyncSqlAlchemyUnitOfWork
+from app.infrastructure.database.repositories.async_church_repository_impl import AsyncChurchRepositoryImpl
+from app.infrastructure.database.repositories.async_contact_repository_impl import AsyncContactRepositoryImpl
+from app.infrastructure.database.repositories.async_broadcast_repository_impl import AsyncBroadcastRepositoryImpl
+from app.infrastructure.database.repositories.async_template_repository_impl import AsyncTemplateRepositoryImpl
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
+from app.application.interfaces.repositories.contact_repository import IAsyncContactRepository
+from app.application.interfaces.repositories.broadcast_repository import IAsyncBroadcastRepository
+from app.application.interfaces.repositories.template_repository import IAsyncTemplateRepository
 from app.infrastructure.external.whatsapp.whatsapp_client import WhatsAppClient
+from app.infrastructure.tasks.broadcast_queue import CeleryBroadcastQueue
+from app.infrastructure.tasks.contact_import_queue import CeleryContactImportQueue
+from app.infrastructure.cache.status_event_stream import RedisStatusEventPublisher
 from app.infrastructure.external.firebase.firebase_auth import FirebaseAuth
 from app.application.interfaces.services.whatsapp_service import IWhatsAppService
 from app.application.interfaces.services.firebase_service import IFirebaseService
+from app.application.interfaces.services.broadcast_queue import IBroadcastQueue
+from app.application.interfaces.services.contact_import_queue import IContactImportQueue
+from app.application.interfaces.services.status_event_publisher import IStatusEventPublisher
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Dependency for getting database session"""
-    yield from get_db_session()
+async def get_unit_of_work() -> AsyncGenerator[AsyncSqlAlchemyUnitOfWork, None]:
+    """Dependency for the request unit of work, committed when the endpoint returns"""
+    async with AsyncSqlAlchemyUnitOfWork() as uow:
+        yield uow
 
 
-def get_church_repository(db: Session = None) -> IChurchRepository:
+async def get_db(uow: AsyncSqlAlchemyUnitOfWork = Depends(get_unit_of_work)) -> AsyncSession:
+    """Dependency for getting the request database session"""
+    # FastAPI resolves get_unit_of_work once per request, so every repository
+    # built from this session shares one connection and one transaction
+    return uow.session
+
+
+def get_church_repository(db: AsyncSession) -> IAsyncChurchRepository:
     """Dependency for church repository"""
-    if db is None:
-        db = next(get_db())
-    return ChurchRepositoryImpl(db)
+    return AsyncChurchRepositoryImpl(db)
 
 
-def get_contact_repository(db: Session = None) -> IContactRepository:
+def get_contact_repository(db: AsyncSession) -> IAsyncContactRepository:
     """Dependency for contact repository"""
-    if db is None:
-        db = next(get_db())
-    return ContactRepositoryImpl(db)
+    return AsyncContactRepositoryImpl(db)
 
 
-def get_broadcast_repository(db: Session = None) -> IBroadcastRepository:
+def get_broadcast_repository(db: AsyncSession) -> IAsyncBroadcastRepository:
     """Dependency for broadcast repository"""
-    if db is None:
-        db = next(get_db())
-    return BroadcastRepositoryImpl(db)
+    return AsyncBroadcastRepositoryImpl(db)
 
 
-def get_template_repository(db: Session = None) -> ITemplateRepository:
+def get_template_repository(db: AsyncSession) -> IAsyncTemplateRepository:
     """Dependency for template repository"""
-    if db is None:
-        db = next(get_db())
-    return TemplateRepositoryImpl(db)
+    return AsyncTemplateRepositoryImpl(db)
 
 
+@lru_cache(maxsize=1)
 def get_whatsapp_service() -> IWhatsAppService:
-    """Dependency for WhatsApp service"""
+    """Dependency for WhatsApp service (one pooled client per process)"""
     return WhatsAppClient()
 
 
+def get_broadcast_queue() -> IBroadcastQueue:
+    """Dependency for background broadcast queue"""
+    return CeleryBroadcastQueue()
+
+
+def get_contact_import_queue() -> IContactImportQueue:
+    """Dependency for background contact import queue"""
+    return CeleryContactImportQueue()
+
+
+def get_status_event_publisher() -> IStatusEventPublisher:
+    """Dependency for queueing WhatsApp status callbacks"""
+    return RedisStatusEventPublisher()
+
+
+@lru_cache(maxsize=1)
 def get_firebase_service() -> IFirebaseService:
-    """Dependency for Firebase service"""
+    """Dependency for Firebase service (one instance per process)"""
     return FirebaseAuth()
 
@@ -2,6 +2,8 @@
 Custom exceptions for the application
 """
 
+from typing import Optional
+
 
 class DomainException(Exception):
     """Base exception for domain layer"""
@@ -28,6 +30,11 @@ class TemplateNotFoundException(DomainException):
     pass
 
 
+class JobNotFoundException(DomainException):
+    """Raised when background job is not found"""
+    pass
+
+
 class InvalidPhoneNumberException(DomainException):
     """Raised when phone number is invalid"""
     pass
@@ -38,6 +45,45 @@ class WhatsAppConfigurationException(DomainException):
     pass
 
 
+class WhatsAppDeliveryException(WhatsAppConfigurationException):
+    """Raised when the WhatsApp API does not accept a message"""
+    
+    def __init__(self, message: str, code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.code = code
+        self.retry_after = retry_after
+
+
+class WhatsAppTransientException(WhatsAppDeliveryException):
+    """Raised for failures a later retry can fix: throttling, 5xx, timeouts"""
+    pass
+
+
+class WhatsAppPermanentException(WhatsAppDeliveryException):
+    """Raised for failures a retry cannot fix, such as an invalid number"""
+    pass
+
+
+class InvalidSegmentException(DomainException):
+    """Raised when a tag segment expression is malformed"""
+    pass
+
+
+class InvalidMessageTemplateException(DomainException):
+    """Raised when a message has unknown or malformed placeholders, or does not fit its WhatsApp template"""
+    pass
+
+
+class InvalidMediaException(DomainException):
+    """Raised when a broadcast media file is of an unsupported type or too large"""
+    pass
+
+
+class InvalidCursorException(DomainException):
+    """Raised when a pagination cursor cannot be decoded"""
+    pass
+
+
 class AuthenticationException(Exception):
     """Raised when authentication fails"""
     pass
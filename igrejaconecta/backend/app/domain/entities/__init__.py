@@ -6,6 +6,7 @@ from app.domain.entities.church import Church
 from app.domain.entities.contact import Contact
 from app.domain.entities.broadcast import Broadcast, BroadcastStatus
 from app.domain.entities.template import Template
+from app.domain.entities.delivery import Delivery, DeliveryStatus
 
-__all__ = ["Church", "Contact", "Broadcast", "BroadcastStatus", "Template"]
+__all__ = ["Church", "Contact", "Broadcast", "BroadcastStatus", "Template", "Delivery", "DeliveryStatus"]
 
@@ -2,15 +2,18 @@
 Broadcast domain entity
 """
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Optional, List
 from enum import Enum
+from app.domain.value_objects.segment import Segment
+from app.domain.value_objects.media import Media
 
 
 class BroadcastStatus(Enum):
     """Broadcast status enumeration"""
     PENDING = "pending"
+    SENDING = "sending"  # Claimed by a worker; messages are going out
     SENT = "sent"
     FAILED = "failed"
     CANCELLED = "cancelled"
@@ -31,6 +34,15 @@ class Broadcast:
     status: BroadcastStatus
     total_sent: int
     created_at: datetime
+    segment: Optional[Segment] = None
+    total_delivered: int = 0  # From status webhooks
+    total_read: int = 0
+    total_failed: int = 0  # Accepted, then reported failed by WhatsApp
+    whatsapp_template: Optional[str] = None  # Approved template sent instead of message
+    whatsapp_template_language: Optional[str] = None
+    template_parameters: List[str] = field(default_factory=list)  # Body variables, may use placeholders
+    media: Optional[Media] = None  # Image, document or video sent with message as caption
+    claimed_at: Optional[datetime] = None  # Lease of a send: set when claimed, renewed as chunks finish
     
     def __post_init__(self):
         """Validate entity after initialization"""
@@ -40,6 +52,8 @@ class Broadcast:
             raise ValueError("Message is required")
         if isinstance(self.status, str):
             self.status = BroadcastStatus(self.status)
+        if self.whatsapp_template and not self.whatsapp_template_language:
+            raise ValueError("Template language is required")
     
     def schedule(self, scheduled_at: datetime) -> None:
         """Schedule broadcast for a specific time"""
@@ -59,8 +73,8 @@ class Broadcast:
     
     def cancel(self) -> None:
         """Cancel scheduled broadcast"""
-        if self.status == BroadcastStatus.SENT:
-            raise ValueError("Cannot cancel already sent broadcast")
+        if self.status in (BroadcastStatus.SENDING, BroadcastStatus.SENT):
+            raise ValueError("Cannot cancel broadcast that is being sent or was sent")
         self.status = BroadcastStatus.CANCELLED
     
     def update_total_sent(self, count: int) -> None:
@@ -69,6 +83,18 @@ class Broadcast:
             raise ValueError("Total sent cannot be negative")
         self.total_sent = count
     
+    def uses_whatsapp_template(self) -> bool:
+        """Check if the broadcast is sent as an approved WhatsApp template"""
+        return bool(self.whatsapp_template)
+    
+    def message_texts(self) -> List[str]:
+        """Get the texts rendered per recipient: template parameters, or the message"""
+        return self.template_parameters if self.uses_whatsapp_template() else [self.message]
+    
+    def audience(self) -> Segment:
+        """Get the segment of contacts the broadcast is sent to"""
+        return self.segment or Segment.any_of(self.contact_tags)
+    
     def is_scheduled(self) -> bool:
         """Check if broadcast is scheduled"""
         return self.scheduled_at is not None and self.status == BroadcastStatus.PENDING
@@ -76,4 +102,16 @@ class Broadcast:
     def can_be_sent(self) -> bool:
         """Check if broadcast can be sent"""
         return self.status == BroadcastStatus.PENDING
+    
+    def send_lease_expired(self, lease: timedelta) -> bool:
+        """Check if a send stopped renewing its claim, so its workers are presumed dead"""
+        return (
+            self.status == BroadcastStatus.SENDING
+            and self.claimed_at is not None
+            and self.claimed_at < datetime.utcnow() - lease
+        )
+    
+    def can_be_resumed(self, lease: Optional[timedelta] = None) -> bool:
+        """Check if a failed send, or one whose lease expired, can be resumed for the contacts not yet reached"""
+        return self.status == BroadcastStatus.FAILED or (lease is not None and self.send_lease_expired(lease))
 
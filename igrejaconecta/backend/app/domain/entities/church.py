@@ -19,6 +19,8 @@ class Church:
     whatsapp_access_token: Optional[str]  # Encrypted
     created_at: datetime
     is_active: bool
+    messaging_tier: Optional[str] = None  # WhatsApp throughput tier
+    whatsapp_business_account_id: Optional[str] = None  # WABA owning the approved templates
     
     def __post_init__(self):
         """Validate entity after initialization"""
@@ -27,7 +29,13 @@ class Church:
         if not self.email:
             raise ValueError("Church email is required")
     
-    def configure_whatsapp(self, phone_id: str, access_token: str) -> None:
+    def configure_whatsapp(
+        self,
+        phone_id: str,
+        access_token: str,
+        messaging_tier: Optional[str] = None,
+        business_account_id: Optional[str] = None
+    ) -> None:
         """Configure WhatsApp Business credentials"""
         if not phone_id:
             raise ValueError("WhatsApp phone ID is required")
@@ -36,6 +44,10 @@ class Church:
         
         self.whatsapp_phone_id = phone_id
         self.whatsapp_access_token = access_token
+        if messaging_tier:
+            self.messaging_tier = messaging_tier
+        if business_account_id:
+            self.whatsapp_business_account_id = business_account_id
     
     def is_whatsapp_configured(self) -> bool:
         """Check if WhatsApp is configured"""
@@ -4,10 +4,20 @@ Contact domain entity
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Iterable
 from app.domain.value_objects.phone import Phone
 
 
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """Strip tags, dropping blank and repeated ones"""
+    normalized = []
+    for tag in tags or []:
+        tag = tag.strip() if isinstance(tag, str) else ""
+        if tag and tag not in normalized:
+            normalized.append(tag)
+    return normalized
+
+
 @dataclass
 class Contact:
     """Contact domain entity"""
@@ -24,9 +34,11 @@ class Contact:
             raise ValueError("Church ID is required")
         if not self.phone:
             raise ValueError("Phone is required")
+        self.tags = normalize_tags(self.tags)
     
     def add_tag(self, tag: str) -> None:
         """Add a tag to the contact"""
+        tag = tag.strip()
         if tag and tag not in self.tags:
             self.tags.append(tag)
     
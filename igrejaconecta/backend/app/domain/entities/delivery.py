@@ -0,0 +1,63 @@
+"""
+Delivery domain entity
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from enum import Enum
+
+
+class DeliveryStatus(Enum):
+    """Delivery status enumeration"""
+    SENT = "sent"  # Accepted by the WhatsApp API
+    RETRYING = "retrying"  # Transient failure; a retry is scheduled
+    FAILED = "failed"  # Permanent failure or out of retries (dead letter)
+    DELIVERED = "delivered"  # Reported by a status webhook
+    READ = "read"  # Reported by a status webhook
+    
+    def supersedes(self, other: "DeliveryStatus") -> bool:
+        """Check if moving from other to this status is progress
+
+        Webhook callbacks arrive out of order and more than once; statuses
+        only ever move forward, so a late "delivered" never hides a "read".
+        """
+        return STATUS_RANK[self] > STATUS_RANK[other]
+
+
+STATUS_RANK = {
+    DeliveryStatus.RETRYING: 0,
+    DeliveryStatus.SENT: 1,
+    DeliveryStatus.DELIVERED: 2,
+    DeliveryStatus.FAILED: 2,
+    DeliveryStatus.READ: 3,
+}
+# Accepted by the API, whatever the webhooks reported later
+ACCEPTED_STATUSES = (DeliveryStatus.SENT, DeliveryStatus.DELIVERED, DeliveryStatus.READ)
+# No further attempt will be made for the contact
+SETTLED_STATUSES = ACCEPTED_STATUSES + (DeliveryStatus.FAILED,)
+
+
+@dataclass
+class Delivery:
+    """Outcome of sending a broadcast to one contact"""
+    broadcast_id: int
+    contact_id: int
+    status: DeliveryStatus
+    whatsapp_message_id: Optional[str] = None
+    error: Optional[str] = None
+    error_code: Optional[int] = None  # Graph API error code
+    attempted_at: datetime = field(default_factory=datetime.utcnow)
+    
+    def __post_init__(self):
+        """Validate entity after initialization"""
+        if isinstance(self.status, str):
+            self.status = DeliveryStatus(self.status)
+    
+    def is_sent(self) -> bool:
+        """Check if the message was accepted"""
+        return self.status in ACCEPTED_STATUSES
+    
+    def is_settled(self) -> bool:
+        """Check if no further attempt will be made for this contact"""
+        return self.status in SETTLED_STATUSES
@@ -3,6 +3,12 @@ Domain value objects
 """
 
 from app.domain.value_objects.phone import Phone
+from app.domain.value_objects.segment import Segment
+from app.domain.value_objects.recipient import Recipient
+from app.domain.value_objects.status_event import StatusEvent
+from app.domain.value_objects.message_renderer import MessageRenderer, compile_message, validate_message
+from app.domain.value_objects.whatsapp_template import WhatsAppTemplate
+from app.domain.value_objects.media import Media
 
-__all__ = ["Phone"]
+__all__ = ["Phone", "Segment", "Recipient", "StatusEvent", "MessageRenderer", "compile_message", "validate_message", "WhatsAppTemplate", "Media"]
 
@@ -0,0 +1,78 @@
+"""
+Media value object
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from app.core.exceptions import InvalidMediaException
+
+MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Media:
+    """A file sent with a broadcast, identified by the SHA-256 of its content
+    
+    The hash names the stored file and keys the cached WhatsApp media ID, so
+    the same flyer is uploaded once per phone number however many broadcasts
+    send it.
+    """
+    
+    IMAGE = "image"
+    DOCUMENT = "document"
+    VIDEO = "video"
+    # MIME types and sizes the WhatsApp Cloud API accepts
+    MIME_TYPES = {
+        "image/jpeg": IMAGE,
+        "image/png": IMAGE,
+        "video/mp4": VIDEO,
+        "video/3gpp": VIDEO,
+        "application/pdf": DOCUMENT,
+        "application/msword": DOCUMENT,
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": DOCUMENT,
+        "application/vnd.ms-powerpoint": DOCUMENT,
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation": DOCUMENT,
+        "text/plain": DOCUMENT,
+    }
+    MAX_BYTES = {IMAGE: 5 * MB, VIDEO: 16 * MB, DOCUMENT: 100 * MB}
+    
+    kind: str
+    sha256: str
+    mime_type: str
+    filename: Optional[str] = None  # Shown to recipients of documents
+    
+    def __post_init__(self):
+        """Validate value object after initialization"""
+        if self.MIME_TYPES.get(self.mime_type) != self.kind:
+            raise InvalidMediaException(f"Unsupported {self.kind} type {self.mime_type}")
+        if not re.fullmatch(r"[0-9a-f]{64}", self.sha256 or ""):
+            raise InvalidMediaException("Media hash must be a hex SHA-256 digest")
+    
+    @classmethod
+    def kind_of(cls, mime_type: Optional[str]) -> str:
+        """Get the media kind of a MIME type WhatsApp accepts"""
+        kind = cls.MIME_TYPES.get(mime_type)
+        if not kind:
+            raise InvalidMediaException(f"Unsupported media type {mime_type}")
+        return kind
+    
+    @classmethod
+    def from_upload(cls, sha256: str, mime_type: Optional[str], filename: Optional[str], size: int) -> "Media":
+        """Describe an uploaded file, checking WhatsApp's type and size limits"""
+        kind = cls.kind_of(mime_type)
+        if size > cls.MAX_BYTES[kind]:
+            raise InvalidMediaException(f"{kind.capitalize()} files cannot exceed {cls.MAX_BYTES[kind] // MB} MB")
+        return cls(kind, sha256, mime_type, filename)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Media":
+        """Parse a media reference"""
+        try:
+            return cls(data["kind"], data["sha256"], data["mime_type"], data.get("filename"))
+        except (KeyError, TypeError):
+            raise InvalidMediaException("Media needs kind, sha256 and mime_type")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the media reference"""
+        return {"kind": self.kind, "sha256": self.sha256, "mime_type": self.mime_type, "filename": self.filename}
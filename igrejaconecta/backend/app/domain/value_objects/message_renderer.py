@@ -0,0 +1,75 @@
+"""
+Message renderer value object
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, Dict, Optional, Tuple
+from app.domain.value_objects.recipient import Recipient
+from app.core.exceptions import InvalidMessageTemplateException
+
+Placeholder = Callable[[Recipient, str], str]
+
+# Values available to messages, from the recipient and the church name
+PLACEHOLDERS: Dict[str, Placeholder] = {
+    "nome": lambda recipient, church_name: recipient.name or "",
+    "primeiro_nome": lambda recipient, church_name: (recipient.name or "").split(" ", 1)[0],
+    "igreja": lambda recipient, church_name: church_name,
+    "tags": lambda recipient, church_name: ", ".join(recipient.tags),
+}
+
+
+@dataclass(frozen=True)
+class MessageRenderer:
+    """A message split once into literal text and placeholders
+    
+    Placeholders are written {nome}, {primeiro_nome}, {igreja} and {tags};
+    {nome:irmão} falls back to "irmão" when the value is empty. Literal braces
+    are doubled, as in str.format. Rendering only joins strings, so it costs
+    the same whatever the message looks like.
+    """
+    
+    parts: Tuple[Tuple[str, Optional[Placeholder], str], ...]  # (literal, placeholder, fallback)
+    
+    def is_static(self) -> bool:
+        """Check if every recipient gets the same text"""
+        return all(placeholder is None for _, placeholder, _ in self.parts)
+    
+    def render(self, recipient: Optional[Recipient] = None, church_name: str = "") -> str:
+        """Render the message for one recipient"""
+        return "".join([
+            literal + (placeholder(recipient, church_name) or fallback if placeholder else "")
+            for literal, placeholder, fallback in self.parts
+        ])
+
+
+@lru_cache(maxsize=256)
+def compile_message(message: str) -> MessageRenderer:
+    """Compile a message into a renderer, cached in this process by message content
+
+    Senders compile each message once per send, before the recipient loop;
+    the renderer is not stored with the broadcast.
+    """
+    try:
+        parsed = list(Formatter().parse(message))
+    except ValueError as e:
+        raise InvalidMessageTemplateException(f"Invalid placeholder in message: {e}")
+    
+    parts = []
+    for literal, field, fallback, conversion in parsed:
+        if field is None:
+            parts.append((literal, None, ""))
+            continue
+        if field not in PLACEHOLDERS or conversion or "{" in (fallback or ""):
+            raise InvalidMessageTemplateException(
+                f"Unknown placeholder {{{field}}}; use one of: "
+                + ", ".join(f"{{{name}}}" for name in PLACEHOLDERS)
+            )
+        parts.append((literal, PLACEHOLDERS[field], fallback or ""))
+    return MessageRenderer(tuple(parts))
+
+
+def validate_message(message: str) -> None:
+    """Reject unknown placeholders and malformed braces, without keeping the renderer"""
+    compile_message(message)
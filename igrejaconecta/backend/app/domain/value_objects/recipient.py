@@ -0,0 +1,15 @@
+"""
+Recipient value object
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Recipient:
+    """A contact a broadcast is sent to, identified for the delivery ledger"""
+    contact_id: int
+    phone: str
+    name: Optional[str] = None  # For message placeholders
+    tags: Tuple[str, ...] = ()
@@ -0,0 +1,82 @@
+"""
+Segment value object
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+from app.core.exceptions import InvalidSegmentException
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Tag expression selecting part of a church's contacts
+    
+    Written as nested dicts: {"tag": "jovens"}, {"and": [...]}, {"or": [...]}
+    and {"not": {...}}. An "and" with no terms selects every contact.
+    """
+    
+    TAG = "tag"
+    AND = "and"
+    OR = "or"
+    NOT = "not"
+    MAX_TERMS = 100  # Keeps compiled SQL bounded
+    
+    op: str
+    tag: str = ""
+    terms: Tuple["Segment", ...] = ()
+    
+    @classmethod
+    def everyone(cls) -> "Segment":
+        """Segment matching every contact"""
+        return cls(cls.AND)
+    
+    @classmethod
+    def any_of(cls, tags: List[str]) -> "Segment":
+        """Segment matching contacts with at least one of the tags, or everyone if none"""
+        if not tags:
+            return cls.everyone()
+        return cls(cls.OR, terms=tuple(cls(cls.TAG, tag=tag) for tag in tags))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Segment":
+        """Parse a segment expression"""
+        segment = cls._parse(data)
+        if segment.size() > cls.MAX_TERMS:
+            raise InvalidSegmentException(f"Segment cannot have more than {cls.MAX_TERMS} terms")
+        return segment
+    
+    @classmethod
+    def _parse(cls, data: Any) -> "Segment":
+        if not isinstance(data, dict) or len(data) != 1:
+            raise InvalidSegmentException("Each segment term must be an object with a single key")
+        op, value = next(iter(data.items()))
+        
+        if op == cls.TAG:
+            if not isinstance(value, str) or not value.strip():
+                raise InvalidSegmentException("Tag must be a non-empty string")
+            return cls(cls.TAG, tag=value.strip())
+        if op in (cls.AND, cls.OR):
+            if not isinstance(value, list):
+                raise InvalidSegmentException(f"'{op}' expects a list of terms")
+            if op == cls.OR and not value:
+                raise InvalidSegmentException("'or' needs at least one term")
+            return cls(op, terms=tuple(cls._parse(term) for term in value))
+        if op == cls.NOT:
+            return cls(cls.NOT, terms=(cls._parse(value),))
+        raise InvalidSegmentException(f"Unknown segment operator '{op}'")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the segment expression"""
+        if self.op == self.TAG:
+            return {self.TAG: self.tag}
+        if self.op == self.NOT:
+            return {self.NOT: self.terms[0].to_dict()}
+        return {self.op: [term.to_dict() for term in self.terms]}
+    
+    def is_everyone(self) -> bool:
+        """Check if the segment matches every contact"""
+        return self.op == self.AND and not self.terms
+    
+    def size(self) -> int:
+        """Count the terms of the expression"""
+        return 1 + sum(term.size() for term in self.terms)
@@ -0,0 +1,18 @@
+"""
+Status event value object
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from app.domain.entities.delivery import DeliveryStatus
+
+
+@dataclass(frozen=True)
+class StatusEvent:
+    """A message status reported by a WhatsApp webhook callback"""
+    whatsapp_message_id: str
+    status: DeliveryStatus
+    timestamp: datetime
+    error_code: Optional[int] = None
+    error: Optional[str] = None
@@ -0,0 +1,27 @@
+"""
+WhatsApp template value object
+"""
+
+from dataclasses import dataclass
+from typing import List
+from app.core.exceptions import InvalidMessageTemplateException
+
+
+@dataclass(frozen=True)
+class WhatsAppTemplate:
+    """A message template WhatsApp approved for a business account
+    
+    Template messages can be sent outside the 24h customer service window,
+    unlike free-form text and interactive messages.
+    """
+    name: str
+    language: str
+    parameter_count: int = 0  # Body variables {{1}} .. {{n}}
+    
+    def check_parameters(self, parameters: List[str]) -> None:
+        """Validate the parameters a broadcast binds to the template"""
+        if len(parameters) != self.parameter_count:
+            raise InvalidMessageTemplateException(
+                f"Template {self.name} ({self.language}) takes {self.parameter_count} "
+                f"parameters, got {len(parameters)}"
+            )
@@ -0,0 +1,3 @@
+"""
+Cache and shared state (Redis)
+"""
@@ -0,0 +1,127 @@
+"""
+Job progress store backed by Redis hashes
+"""
+
+import json
+from typing import Optional, Dict, Any, List
+import redis
+from app.application.interfaces.services.progress_reporter import IProgressReporter
+from app.application.interfaces.services.import_reporter import IImportReporter
+from app.core.config import settings
+from app.infrastructure.cache.redis_client import get_redis
+
+COUNTER_FIELDS = ("total", "sent", "failed", "retrying", "imported", "duplicates", "rejected")
+
+# Completes a job once its chunks are done and no retries are pending; run
+# by whichever of the two finishes last, atomically so neither is missed
+_COMPLETE_IF_SETTLED = """
+if redis.call('HGET', KEYS[1], 'state') ~= 'running' then return 0 end
+if redis.call('HGET', KEYS[1], 'chunks_done') ~= '1' then return 0 end
+if tonumber(redis.call('HGET', KEYS[1], 'retrying') or '0') > 0 then return 0 end
+redis.call('HSET', KEYS[1], 'state', 'completed')
+return 1
+"""
+
+
+class JobProgressStore:
+    """Stores state and counters of background jobs so the API can poll them"""
+
+    def __init__(self, client: Optional[redis.Redis] = None):
+        self.client = client or get_redis()
+        self.ttl = settings.JOB_PROGRESS_TTL_SECONDS
+
+    def _key(self, job_id: str) -> str:
+        return f"job:{job_id}"
+
+    def _rejections_key(self, job_id: str) -> str:
+        return f"job:{job_id}:rejections"
+
+    def create(self, job_id: str, state: str = "queued", **fields: Any) -> None:
+        """Register a new job"""
+        mapping = {"state": state, "total": 0, "sent": 0, "failed": 0, "retrying": 0, **fields}
+        pipe = self.client.pipeline()
+        pipe.hset(self._key(job_id), mapping=mapping)
+        pipe.expire(self._key(job_id), self.ttl)
+        pipe.execute()
+
+    def set_state(self, job_id: str, state: str, error: Optional[str] = None) -> None:
+        """Update job state"""
+        mapping = {"state": state}
+        if error:
+            mapping["error"] = error
+        self.client.hset(self._key(job_id), mapping=mapping)
+
+    def set_total(self, job_id: str, total: int) -> None:
+        """Set the number of items the job will process"""
+        self.client.hset(self._key(job_id), "total", total)
+
+    def increment(self, job_id: str, **counters: int) -> None:
+        """Atomically add to the job counters"""
+        pipe = self.client.pipeline()
+        for field, amount in counters.items():
+            if amount:
+                pipe.hincrby(self._key(job_id), field, amount)
+        pipe.execute()
+
+    def finish_chunks(self, job_id: str) -> bool:
+        """Record that every chunk of a send ran; the job completes once its retries settle too"""
+        self.client.hset(self._key(job_id), "chunks_done", 1)
+        return self.complete_if_settled(job_id)
+
+    def complete_if_settled(self, job_id: str) -> bool:
+        """Mark a running job completed if its chunks are done and no retries are pending"""
+        return bool(self.client.eval(_COMPLETE_IF_SETTLED, 1, self._key(job_id)))
+
+    def add_rejections(self, job_id: str, rejections: List[Dict[str, Any]]) -> None:
+        """Append rejected items to the job report, keeping at most CONTACT_IMPORT_MAX_REJECTIONS"""
+        if not rejections:
+            return
+        key = self._rejections_key(job_id)
+        pipe = self.client.pipeline()
+        pipe.rpush(key, *(json.dumps(rejection) for rejection in rejections))
+        pipe.ltrim(key, 0, settings.CONTACT_IMPORT_MAX_REJECTIONS - 1)
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def get_rejections(self, job_id: str) -> List[Dict[str, Any]]:
+        """Get rejected items of a job"""
+        return [json.loads(item) for item in self.client.lrange(self._rejections_key(job_id), 0, -1)]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job state and counters"""
+        data = self.client.hgetall(self._key(job_id))
+        if not data:
+            return None
+        for field in COUNTER_FIELDS:
+            data[field] = int(data.get(field, 0))
+        return data
+
+
+class JobProgressReporter(IProgressReporter):
+    """Progress reporter that writes into a JobProgressStore entry"""
+
+    def __init__(self, store: JobProgressStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+        self.reported = 0  # Items this reporter settled or handed to a retry
+
+    def set_total(self, total: int) -> None:
+        self.store.set_total(self.job_id, total)
+
+    def advance(self, sent: int = 0, failed: int = 0, retrying: int = 0) -> None:
+        self.store.increment(self.job_id, sent=sent, failed=failed, retrying=retrying)
+        self.reported += sent + failed + max(retrying, 0)
+
+
+class JobImportReporter(IImportReporter):
+    """Import reporter that writes into a JobProgressStore entry"""
+
+    def __init__(self, store: JobProgressStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+
+    def advance(self, imported: int = 0, duplicates: int = 0, rejected: int = 0) -> None:
+        self.store.increment(self.job_id, imported=imported, duplicates=duplicates, rejected=rejected)
+
+    def reject(self, rejections: List[Dict[str, Any]]) -> None:
+        self.store.add_rejections(self.job_id, rejections)
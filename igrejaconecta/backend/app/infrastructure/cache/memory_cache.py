@@ -0,0 +1,64 @@
+"""
+Bounded in-process caches for hot request paths
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from app.core.config import settings
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after their own TTL"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value for at most ttl seconds (the cache default if not given)"""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a value"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every value"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Decoded Firebase ID tokens, keyed by SHA-256 of the token
+token_cache = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE, settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
+
+# Firebase UID -> church ID. Invalidated by the church repositories in this
+# process when their change commits; the TTL bounds staleness in other processes.
+church_id_cache = TTLCache(settings.CHURCH_ID_CACHE_SIZE, settings.CHURCH_ID_CACHE_TTL_SECONDS)
+
+# (church ID, business account ID) -> approved WhatsApp templates by (name, language)
+whatsapp_template_cache = TTLCache(settings.WHATSAPP_TEMPLATE_CACHE_SIZE, settings.WHATSAPP_TEMPLATE_CACHE_TTL_SECONDS)
@@ -0,0 +1,80 @@
+"""
+Token bucket rate limiter shared by every worker through Redis
+"""
+
+import asyncio
+import time
+from typing import Optional, Tuple
+import redis
+import redis.asyncio as aioredis
+from app.core.config import settings
+from app.infrastructure.cache.redis_client import get_redis
+
+# Reserves tokens atomically and returns how long the caller must wait for them.
+# The bucket may go into debt, so concurrent callers queue up in arrival order
+# instead of polling. Redis TIME keeps every worker on the same clock.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - requested
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+
+def _bucket(phone_id: str, tier: Optional[str]) -> Tuple[str, float]:
+    """Get Redis key and messages per second for a phone number"""
+    rates = settings.WHATSAPP_RATE_TIERS
+    rate = rates.get(tier or settings.WHATSAPP_DEFAULT_TIER, rates[settings.WHATSAPP_DEFAULT_TIER])
+    return f"ratelimit:whatsapp:{phone_id}", float(rate)
+
+
+class RateLimiter:
+    """Blocking token bucket per WhatsApp phone number"""
+
+    def __init__(self, client: Optional[redis.Redis] = None):
+        self.client = client or get_redis()
+        self.script = self.client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def acquire(self, phone_id: str, tier: Optional[str] = None, tokens: int = 1) -> float:
+        """Take tokens from the phone number bucket, sleeping until they are available"""
+        key, rate = _bucket(phone_id, tier)
+        wait = float(self.script(keys=[key], args=[rate, rate, tokens]))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class AsyncRateLimiter:
+    """Asyncio token bucket per WhatsApp phone number"""
+
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+        self.script = self.client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @classmethod
+    def from_settings(cls) -> "AsyncRateLimiter":
+        """Create a limiter with its own connection pool for the running event loop"""
+        return cls(aioredis.Redis.from_url(settings.REDIS_URL, decode_responses=True))
+
+    async def acquire(self, phone_id: str, tier: Optional[str] = None, tokens: int = 1) -> float:
+        """Take tokens from the phone number bucket, sleeping until they are available"""
+        key, rate = _bucket(phone_id, tier)
+        wait = float(await self.script(keys=[key], args=[rate, rate, tokens]))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    async def close(self) -> None:
+        """Release the connection pool"""
+        await self.client.aclose()
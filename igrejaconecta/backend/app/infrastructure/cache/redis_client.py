@@ -0,0 +1,20 @@
+"""
+Redis client shared by the process
+"""
+
+from functools import lru_cache
+import redis
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """Get the process-wide Redis client (connection pooled)"""
+    return redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+@lru_cache(maxsize=1)
+def get_async_redis() -> aioredis.Redis:
+    """Get the Redis client for the API event loop (connection pooled)"""
+    return aioredis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
@@ -0,0 +1,79 @@
+"""
+Redis stream of WhatsApp status callbacks
+"""
+
+from typing import Optional, List, Tuple
+import redis
+import redis.asyncio as aioredis
+from app.application.interfaces.services.status_event_publisher import IStatusEventPublisher
+from app.core.config import settings
+from app.infrastructure.cache.redis_client import get_redis, get_async_redis
+
+
+class RedisStatusEventPublisher(IStatusEventPublisher):
+    """Appends callbacks to a capped Redis stream, one XADD per request"""
+
+    def __init__(self, client: Optional[aioredis.Redis] = None):
+        self.client = client or get_async_redis()
+
+    async def publish(self, payload: str) -> None:
+        """Queue a callback body for processing; must return without waiting on it"""
+        # Approximate trimming keeps XADD O(1) while bounding memory after a burst
+        await self.client.xadd(
+            settings.STATUS_STREAM_KEY,
+            {"payload": payload},
+            maxlen=settings.STATUS_STREAM_MAXLEN,
+            approximate=True
+        )
+
+
+class StatusEventStream:
+    """Consumer group side of the status stream
+
+    Every entry stays pending until acknowledged; entries a consumer leaves
+    unacknowledged (it crashed, or their messages were not recorded yet) are
+    claimed again once idle for STATUS_CONSUMER_RETRY_IDLE_MS.
+    """
+
+    def __init__(self, client: Optional[redis.Redis] = None):
+        self.client = client or get_redis()
+        self.key = settings.STATUS_STREAM_KEY
+        self.group = settings.STATUS_CONSUMER_GROUP
+        self._claim_cursor = "0-0"
+
+    def ensure_group(self) -> None:
+        """Create the consumer group (and the stream) if missing"""
+        try:
+            self.client.xgroup_create(self.key, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def read(self, consumer: str, count: int, block_ms: int) -> List[Tuple[str, Optional[str]]]:
+        """Get (entry_id, payload) pairs: idle pending entries first, then new ones
+
+        payload is None for an entry trimmed from the stream while pending.
+        """
+        claimed = self.client.xautoclaim(
+            self.key,
+            self.group,
+            consumer,
+            min_idle_time=settings.STATUS_CONSUMER_RETRY_IDLE_MS,
+            start_id=self._claim_cursor,
+            count=count
+        )
+        self._claim_cursor = claimed[0]
+        if claimed[1]:
+            return [(entry_id, (fields or {}).get("payload")) for entry_id, fields in claimed[1]]
+
+        response = self.client.xreadgroup(self.group, consumer, {self.key: ">"}, count=count, block=block_ms)
+        return [
+            (entry_id, fields.get("payload"))
+            for _, entries in response or []
+            for entry_id, fields in entries
+        ]
+
+    def ack(self, entry_ids: List[str]) -> None:
+        """Acknowledge processed entries"""
+        if entry_ids:
+            self.client.xack(self.key, self.group, *entry_ids)
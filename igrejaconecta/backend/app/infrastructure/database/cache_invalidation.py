@@ -0,0 +1,30 @@
+"""
+In-process cache invalidation tied to the outcome of the session's transaction
+"""
+
+from typing import Hashable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.infrastructure.cache.memory_cache import TTLCache
+
+_PENDING = "pending_cache_invalidations"
+
+
+def invalidate_after_commit(session: Session, cache: TTLCache, key: Hashable) -> None:
+    """Drop a cache entry once the session's transaction commits
+
+    Dropping it at flush would let a concurrent request cache the old row
+    again before the commit, and a rollback would drop it for nothing.
+    """
+    session.info.setdefault(_PENDING, []).append((cache, key))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for cache, key in session.info.pop(_PENDING, ()):
+        cache.delete(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -2,26 +2,38 @@
 Database configuration for infrastructure layer
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.infrastructure.database.engine import create_database_engine, create_async_database_engine
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
-)
+# Create database engine. Pools connect lazily, so a process only holds
+# connections for the engine it actually uses.
+engine = create_database_engine()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the API, so queries do not block the event loop.
+# Celery workers keep using the sync engine above.
+async_engine = create_async_database_engine()
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
 
+def dispose_inherited_pools() -> None:
+    """Drop pooled connections inherited from a parent process after fork
+
+    close=False leaves the parent's sockets alone; the child opens its own.
+    """
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+
+
 def get_db_session():
     """Get database session"""
     db = SessionLocal()
@@ -30,3 +42,8 @@ def get_db_session():
     finally:
         db.close()
 
+
+async def get_async_db_session():
+    """Get async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,28 @@
+"""
+Delivery ledger backed by the broadcast_deliveries table
+"""
+
+from typing import List
+from app.domain.entities.delivery import Delivery
+from app.application.interfaces.services.delivery_ledger import IDeliveryLedger
+from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+
+class SqlAlchemyDeliveryLedger(IDeliveryLedger):
+    """Commits every batch of outcomes in a short transaction of its own
+
+    The sending task streams its recipients through a server-side cursor,
+    which a commit on its own session would close, so batches go through a
+    separate session. Once a batch commits it survives a crash of the worker.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+
+    def record(self, deliveries: List[Delivery]) -> None:
+        """Persist a batch of outcomes in its own transaction, independent of the caller's"""
+        if not deliveries:
+            return
+        with SqlAlchemyUnitOfWork(self.session_factory) as uow:
+            uow.deliveries.record(deliveries)
@@ -0,0 +1,61 @@
+"""
+Database engine factory shared by the API, Celery workers and migrations
+"""
+
+from typing import Dict, Any
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from app.core.config import Settings, settings as default_settings
+
+
+def engine_options(settings: Settings, use_asyncpg: bool = False, null_pool: bool = False) -> Dict[str, Any]:
+    """Build create_engine keyword arguments from settings"""
+    options: Dict[str, Any] = {"pool_pre_ping": True}
+    connect_args: Dict[str, Any] = {}
+    
+    if null_pool or settings.DB_NULL_POOL:
+        # PgBouncer owns the pooling; every checkout opens a fresh connection
+        options["poolclass"] = NullPool
+        if use_asyncpg:
+            # Prepared statements do not survive PgBouncer transaction mode
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+    else:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        )
+    
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if use_asyncpg:
+            connect_args["server_settings"] = {"statement_timeout": timeout}
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+    
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def database_url(settings: Settings, use_asyncpg: bool = False) -> URL:
+    """Get the database URL, switched to the asyncpg driver if requested"""
+    url = make_url(settings.DATABASE_URL)
+    return url.set(drivername="postgresql+asyncpg") if use_asyncpg else url
+
+
+def create_database_engine(settings: Settings = default_settings, null_pool: bool = False) -> Engine:
+    """Create the sync engine used by Celery workers and migrations"""
+    return create_engine(database_url(settings), **engine_options(settings, null_pool=null_pool))
+
+
+def create_async_database_engine(settings: Settings = default_settings) -> AsyncEngine:
+    """Create the async engine used by the API"""
+    return create_async_engine(
+        database_url(settings, use_asyncpg=True),
+        **engine_options(settings, use_asyncpg=True)
+    )
@@ -6,6 +6,8 @@ from app.infrastructure.database.models.church_model import ChurchModel
 from app.infrastructure.database.models.contact_model import ContactModel
 from app.infrastructure.database.models.broadcast_model import BroadcastModel
 from app.infrastructure.database.models.template_model import TemplateModel
+from app.infrastructure.database.models.tag_count_model import TagCountModel
+from app.infrastructure.database.models.delivery_model import DeliveryModel
 
 # Import all models for Alembic
-__all__ = ["ChurchModel", "ContactModel", "BroadcastModel", "TemplateModel"]
+__all__ = ["ChurchModel", "ContactModel", "BroadcastModel", "TemplateModel", "TagCountModel", "DeliveryModel"]
@@ -2,7 +2,8 @@
 Broadcast SQLAlchemy model
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, ARRAY
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, ARRAY, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.infrastructure.database.database import Base
@@ -11,6 +12,14 @@ from app.infrastructure.database.database import Base
 class BroadcastModel(Base):
     """Broadcast SQLAlchemy model"""
     __tablename__ = "broadcasts"
+    __table_args__ = (
+        Index("idx_broadcasts_church_created", "church_id", "created_at", "id"),  # Keyset pagination
+        Index(
+            "idx_broadcasts_pending_schedule",
+            "scheduled_at",
+            postgresql_where=text("status = 'pending' AND scheduled_at IS NOT NULL")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     church_id = Column(Integer, ForeignKey("churches.id"), nullable=False)
@@ -19,10 +28,20 @@ class BroadcastModel(Base):
     link_url = Column(Text)
     button_text = Column(String(50))
     contact_tags = Column(ARRAY(String))  # Array of tags to filter contacts
+    segment = Column(JSONB)  # Tag expression; takes precedence over contact_tags
     scheduled_at = Column(DateTime)
+    dispatched_at = Column(DateTime)  # When a scheduled send was handed to the queue
+    claimed_at = Column(DateTime)  # Lease of a send in progress, renewed as chunks finish
     sent_at = Column(DateTime)
-    status = Column(String(20), default="pending")  # pending, sent, failed, cancelled
+    status = Column(String(20), default="pending")  # pending, sending, sent, failed, cancelled
     total_sent = Column(Integer, default=0)
+    total_delivered = Column(Integer, default=0)  # Counters rolled up from status webhooks
+    total_read = Column(Integer, default=0)
+    total_failed = Column(Integer, default=0)
+    whatsapp_template = Column(String(512))  # Approved WhatsApp template name
+    whatsapp_template_language = Column(String(15))
+    template_parameters = Column(ARRAY(Text))
+    media = Column(JSONB)  # {"kind", "sha256", "mime_type", "filename"}
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationship
@@ -20,6 +20,8 @@ class ChurchModel(Base):
     phone = Column(String(20))
     whatsapp_phone_id = Column(Text)
     whatsapp_access_token = Column(Text)  # Encrypted
+    messaging_tier = Column(String(20))  # WhatsApp throughput tier
+    whatsapp_business_account_id = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
     is_active = Column(Boolean, default=True)
     
@@ -2,7 +2,7 @@
 Contact SQLAlchemy model
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, ARRAY, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.infrastructure.database.database import Base
@@ -11,6 +11,10 @@ from app.infrastructure.database.database import Base
 class ContactModel(Base):
     """Contact SQLAlchemy model"""
     __tablename__ = "contacts"
+    __table_args__ = (
+        UniqueConstraint("church_id", "phone", name="unique_church_phone"),
+        Index("idx_contacts_church_id_id", "church_id", "id"),  # Keyset pagination
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     church_id = Column(Integer, ForeignKey("churches.id"), nullable=False)
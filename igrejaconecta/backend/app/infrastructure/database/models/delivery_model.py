@@ -0,0 +1,32 @@
+"""
+Delivery SQLAlchemy model
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, text
+from datetime import datetime
+from app.infrastructure.database.database import Base
+
+
+class DeliveryModel(Base):
+    """Per-recipient outcome of a broadcast, written in batches by the send engine"""
+    __tablename__ = "broadcast_deliveries"
+    __table_args__ = (
+        Index(
+            "idx_broadcast_deliveries_failed",
+            "broadcast_id",
+            postgresql_where=text("status = 'failed'")
+        ),  # Dead letters of a broadcast
+        Index(
+            "idx_broadcast_deliveries_message",
+            "whatsapp_message_id",
+            postgresql_where=text("whatsapp_message_id IS NOT NULL")
+        ),
+    )
+    
+    broadcast_id = Column(Integer, ForeignKey("broadcasts.id", ondelete="CASCADE"), primary_key=True)
+    contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String(20), nullable=False)  # sent, retrying, failed
+    whatsapp_message_id = Column(String(128))
+    error = Column(Text)
+    error_code = Column(Integer)  # Graph API error code
+    attempted_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,18 @@
+"""
+Tag count SQLAlchemy model
+"""
+
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.infrastructure.database.database import Base
+
+
+class TagCountModel(Base):
+    """Contacts per tag of a church, kept current by the contact repositories"""
+    __tablename__ = "church_tag_counts"
+    
+    # Row holding the church's total contact count; contact tags are never blank
+    ALL_CONTACTS = ""
+    
+    church_id = Column(Integer, ForeignKey("churches.id"), primary_key=True)
+    tag = Column(String, primary_key=True)
+    contact_count = Column(Integer, nullable=False, default=0)
@@ -2,7 +2,7 @@
 Template SQLAlchemy model
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.infrastructure.database.database import Base
@@ -11,6 +11,9 @@ from app.infrastructure.database.database import Base
 class TemplateModel(Base):
     """Template SQLAlchemy model"""
     __tablename__ = "templates"
+    __table_args__ = (
+        Index("idx_templates_church_created", "church_id", "created_at", "id"),  # Keyset pagination
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     church_id = Column(Integer, ForeignKey("churches.id"), nullable=False)
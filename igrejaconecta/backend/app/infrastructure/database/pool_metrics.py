@@ -0,0 +1,49 @@
+"""
+Connection pool checkout metrics
+"""
+
+import threading
+from typing import Dict, Any
+from sqlalchemy.pool import Pool
+
+
+class PoolMetrics:
+    """Counts pool checkouts made by units of work and how long they waited"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        """Record a connection checkout that took `wait` seconds"""
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up because the pool was exhausted"""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Get current pool usage together with the checkout counters"""
+        with self._lock:
+            stats = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.wait_max * 1000, 3),
+            }
+        # Pools without a fixed size (e.g. NullPool) do not report usage
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            if hasattr(pool, name):
+                stats[name] = getattr(pool, name)()
+        return stats
+
+
+sync_pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
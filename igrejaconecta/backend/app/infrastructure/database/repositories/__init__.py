@@ -6,11 +6,21 @@ from app.infrastructure.database.repositories.church_repository_impl import Chur
 from app.infrastructure.database.repositories.contact_repository_impl import ContactRepositoryImpl
 from app.infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
 from app.infrastructure.database.repositories.template_repository_impl import TemplateRepositoryImpl
+from app.infrastructure.database.repositories.delivery_repository_impl import DeliveryRepositoryImpl
+from app.infrastructure.database.repositories.async_church_repository_impl import AsyncChurchRepositoryImpl
+from app.infrastructure.database.repositories.async_contact_repository_impl import AsyncContactRepositoryImpl
+from app.infrastructure.database.repositories.async_broadcast_repository_impl import AsyncBroadcastRepositoryImpl
+from app.infrastructure.database.repositories.async_template_repository_impl import AsyncTemplateRepositoryImpl
 
 __all__ = [
     "ChurchRepositoryImpl",
     "ContactRepositoryImpl",
     "BroadcastRepositoryImpl",
     "TemplateRepositoryImpl",
+    "DeliveryRepositoryImpl",
+    "AsyncChurchRepositoryImpl",
+    "AsyncContactRepositoryImpl",
+    "AsyncBroadcastRepositoryImpl",
+    "AsyncTemplateRepositoryImpl",
 ]
 
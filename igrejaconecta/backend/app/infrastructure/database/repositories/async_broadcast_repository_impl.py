@@ -0,0 +1,128 @@
+"""
+Async broadcast repository implementation
+"""
+
+from typing import Optional, List, Tuple
+from datetime import datetime
+from sqlalchemy import select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.broadcast import Broadcast, BroadcastStatus
+from app.application.interfaces.repositories.broadcast_repository import IAsyncBroadcastRepository
+from app.infrastructure.database.models.broadcast_model import BroadcastModel
+from app.infrastructure.database.repositories.broadcast_repository_impl import BroadcastModelMapper
+from app.core.exceptions import BroadcastNotFoundException, RepositoryException
+
+
+class AsyncBroadcastRepositoryImpl(BroadcastModelMapper, IAsyncBroadcastRepository):
+    """Broadcast repository implementation on an AsyncSession"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def _to_model(self, entity: Broadcast) -> BroadcastModel:
+        """Convert domain entity to SQLAlchemy model"""
+        if entity.id:
+            model = await self.db.get(BroadcastModel, entity.id)
+            if not model:
+                raise BroadcastNotFoundException(f"Broadcast with id {entity.id} not found")
+        else:
+            model = BroadcastModel()
+        
+        return self._fill_model(model, entity)
+    
+    async def create(self, broadcast: Broadcast) -> Broadcast:
+        """Create a new broadcast"""
+        try:
+            model = await self._to_model(broadcast)
+            self.db.add(model)
+            await self.db.flush()
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error creating broadcast: {str(e)}")
+    
+    async def get_by_id(self, broadcast_id: int) -> Optional[Broadcast]:
+        """Get broadcast by ID"""
+        model = await self.db.get(BroadcastModel, broadcast_id)
+        return self._to_domain(model) if model else None
+    
+    async def list_by_church(
+        self, 
+        church_id: int, 
+        limit: int = 100,
+        status: Optional[BroadcastStatus] = None,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Broadcast]:
+        """List broadcasts by church, newest first, starting after a (created_at, id) key"""
+        query = self._page_query(church_id, limit, status, after)
+        models = (await self.db.execute(query)).scalars().all()
+        return [self._to_domain(model) for model in models]
+    
+    async def list_scheduled(self, before: Optional[datetime] = None) -> List[Broadcast]:
+        """List scheduled broadcasts"""
+        query = select(BroadcastModel).where(
+            BroadcastModel.status == BroadcastStatus.PENDING.value,
+            BroadcastModel.scheduled_at.isnot(None)
+        )
+        
+        if before:
+            query = query.where(BroadcastModel.scheduled_at <= before)
+        
+        models = (await self.db.execute(query.order_by(BroadcastModel.scheduled_at.asc()))).scalars().all()
+        return [self._to_domain(model) for model in models]
+    
+    async def mark_dispatched(self, broadcast_id: int, dispatched_at: datetime) -> None:
+        """Record that a scheduled send was handed to the queue"""
+        await self.db.execute(
+            update(BroadcastModel).where(BroadcastModel.id == broadcast_id).values(dispatched_at=dispatched_at)
+        )
+    
+    async def update(self, broadcast: Broadcast) -> Broadcast:
+        """Update broadcast"""
+        try:
+            model = await self._to_model(broadcast)
+            await self.db.flush()
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error updating broadcast: {str(e)}")
+    
+    async def delete(self, broadcast_id: int) -> None:
+        """Delete broadcast"""
+        try:
+            model = await self.db.get(BroadcastModel, broadcast_id)
+            if not model:
+                raise BroadcastNotFoundException(f"Broadcast with id {broadcast_id} not found")
+            await self.db.delete(model)
+            await self.db.flush()
+        except BroadcastNotFoundException:
+            raise
+        except Exception as e:
+            raise RepositoryException(f"Error deleting broadcast: {str(e)}")
+    
+    async def get_statistics(self, church_id: int) -> dict:
+        """Get broadcast statistics for church"""
+        query = select(
+            BroadcastModel.status,
+            func.count(BroadcastModel.id).label('count'),
+            func.sum(BroadcastModel.total_sent).label('total_sent')
+        ).where(
+            BroadcastModel.church_id == church_id
+        ).group_by(BroadcastModel.status)
+        stats = (await self.db.execute(query)).all()
+        
+        result = {
+            'total': 0,
+            'pending': 0,
+            'sending': 0,
+            'sent': 0,
+            'failed': 0,
+            'cancelled': 0,
+            'total_messages_sent': 0
+        }
+        
+        for status, count, total_sent in stats:
+            result[status] = count
+            result['total'] += count
+            if total_sent:
+                result['total_messages_sent'] += total_sent
+        
+        return result
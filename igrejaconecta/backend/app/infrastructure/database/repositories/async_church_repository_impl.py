@@ -0,0 +1,97 @@
+"""
+Async church repository implementation
+"""
+
+from typing import Optional, List
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.church import Church
+from app.application.interfaces.repositories.church_repository import IAsyncChurchRepository
+from app.infrastructure.database.models.church_model import ChurchModel
+from app.infrastructure.database.repositories.church_repository_impl import ChurchModelMapper
+from app.core.exceptions import ChurchNotFoundException, RepositoryException
+from app.infrastructure.cache.memory_cache import church_id_cache
+from app.infrastructure.database.cache_invalidation import invalidate_after_commit
+
+
+class AsyncChurchRepositoryImpl(ChurchModelMapper, IAsyncChurchRepository):
+    """Church repository implementation on an AsyncSession"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def _to_model(self, entity: Church) -> ChurchModel:
+        """Convert domain entity to SQLAlchemy model"""
+        if entity.id:
+            model = await self.db.get(ChurchModel, entity.id)
+            if not model:
+                raise ChurchNotFoundException(f"Church with id {entity.id} not found")
+        else:
+            model = ChurchModel()
+        
+        return self._fill_model(model, entity)
+    
+    async def _first(self, *criteria) -> Optional[Church]:
+        model = (await self.db.execute(select(ChurchModel).where(*criteria).limit(1))).scalar_one_or_none()
+        return self._to_domain(model) if model else None
+    
+    async def create(self, church: Church) -> Church:
+        """Create a new church"""
+        try:
+            model = await self._to_model(church)
+            self.db.add(model)
+            await self.db.flush()
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error creating church: {str(e)}")
+    
+    async def get_by_id(self, church_id: int) -> Optional[Church]:
+        """Get church by ID"""
+        return await self._first(ChurchModel.id == church_id)
+    
+    async def get_by_email(self, email: str) -> Optional[Church]:
+        """Get church by email"""
+        return await self._first(ChurchModel.email == email)
+    
+    async def get_by_firebase_uid(self, firebase_uid: str) -> Optional[Church]:
+        """Get church by Firebase UID"""
+        return await self._first(ChurchModel.firebase_uid == firebase_uid)
+    
+    async def set_firebase_uid(self, church_id: int, firebase_uid: str) -> None:
+        """Link church to the Firebase user that owns it"""
+        try:
+            await self.db.execute(
+                update(ChurchModel).where(ChurchModel.id == church_id).values(firebase_uid=firebase_uid)
+            )
+            await self.db.flush()
+        except Exception as e:
+            raise RepositoryException(f"Error updating church: {str(e)}")
+    
+    async def update(self, church: Church) -> Church:
+        """Update church"""
+        try:
+            model = await self._to_model(church)
+            await self.db.flush()
+            invalidate_after_commit(self.db.sync_session, church_id_cache, model.firebase_uid)
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error updating church: {str(e)}")
+    
+    async def delete(self, church_id: int) -> None:
+        """Delete church"""
+        try:
+            model = await self.db.get(ChurchModel, church_id)
+            if not model:
+                raise ChurchNotFoundException(f"Church with id {church_id} not found")
+            await self.db.delete(model)
+            await self.db.flush()
+            invalidate_after_commit(self.db.sync_session, church_id_cache, model.firebase_uid)
+        except ChurchNotFoundException:
+            raise
+        except Exception as e:
+            raise RepositoryException(f"Error deleting church: {str(e)}")
+    
+    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Church]:
+        """List all churches"""
+        models = (await self.db.execute(select(ChurchModel).offset(skip).limit(limit))).scalars().all()
+        return [self._to_domain(model) for model in models]
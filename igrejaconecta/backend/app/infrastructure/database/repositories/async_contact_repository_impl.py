@@ -0,0 +1,157 @@
+"""
+Async contact repository implementation
+"""
+
+from collections import Counter
+from typing import Optional, List, Set, Dict, AsyncIterator
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.contact import Contact
+from app.domain.value_objects.segment import Segment
+from app.application.interfaces.repositories.contact_repository import IAsyncContactRepository
+from app.infrastructure.database.models.contact_model import ContactModel
+from app.infrastructure.database.models.tag_count_model import TagCountModel
+from app.infrastructure.database.repositories.contact_repository_impl import ContactModelMapper
+from app.core.exceptions import ContactNotFoundException, RepositoryException
+
+
+class AsyncContactRepositoryImpl(ContactModelMapper, IAsyncContactRepository):
+    """Contact repository implementation on an AsyncSession"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def _to_model(self, entity: Contact) -> ContactModel:
+        """Convert domain entity to SQLAlchemy model"""
+        if entity.id:
+            model = await self.db.get(ContactModel, entity.id)
+            if not model:
+                raise ContactNotFoundException(f"Contact with id {entity.id} not found")
+        else:
+            model = ContactModel()
+        
+        return self._fill_model(model, entity)
+    
+    async def _apply_tag_deltas(self, deltas: Counter) -> None:
+        """Add tag count changes in the current transaction"""
+        stmt = self._tag_count_statement(deltas)
+        if stmt is not None:
+            await self.db.execute(stmt)
+    
+    async def create(self, contact: Contact) -> Contact:
+        """Create a new contact"""
+        try:
+            model = await self._to_model(contact)
+            self.db.add(model)
+            await self.db.flush()
+            await self._apply_tag_deltas(self._tag_deltas(contact.church_id, None, contact.tags))
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error creating contact: {str(e)}")
+    
+    async def get_by_id(self, contact_id: int) -> Optional[Contact]:
+        """Get contact by ID"""
+        model = await self.db.get(ContactModel, contact_id)
+        return self._to_domain(model) if model else None
+    
+    async def get_by_phone(self, church_id: int, phone: str) -> Optional[Contact]:
+        """Get contact by phone number"""
+        query = select(ContactModel).where(
+            ContactModel.church_id == church_id,
+            ContactModel.phone == phone
+        ).limit(1)
+        model = (await self.db.execute(query)).scalar_one_or_none()
+        return self._to_domain(model) if model else None
+    
+    async def get_existing_phones(self, church_id: int, phones: List[str]) -> Set[str]:
+        """Get which of the given phone numbers already exist in a church"""
+        if not phones:
+            return set()
+        query = select(ContactModel.phone).where(
+            ContactModel.church_id == church_id,
+            ContactModel.phone == func.any(phones)
+        )
+        return set((await self.db.execute(query)).scalars())
+    
+    async def list_by_church(self, church_id: int, limit: int = 100, after_id: Optional[int] = None) -> List[Contact]:
+        """List contacts by church in ID order, starting after a contact ID"""
+        models = (await self.db.execute(self._page_query(church_id, limit, after_id))).scalars().all()
+        return [self._to_domain(model) for model in models]
+    
+    async def iter_by_church(self, church_id: int, batch_size: int = 1000) -> AsyncIterator[Contact]:
+        """Stream every contact of a church in ID order"""
+        query = select(ContactModel).where(ContactModel.church_id == church_id).order_by(ContactModel.id)
+        # stream() reads through a server-side cursor, batch_size rows at a time
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        async for model in result.scalars():
+            yield self._to_domain(model)
+    
+    async def list_by_tags(self, church_id: int, tags: List[str]) -> List[Contact]:
+        """List contacts by tags"""
+        query = select(ContactModel).where(*self._audience_filter(church_id, Segment.any_of(tags)))
+        models = (await self.db.execute(query)).scalars().all()
+        return [self._to_domain(model) for model in models]
+    
+    async def count_recipients(self, church_id: int, segment: Optional[Segment] = None) -> int:
+        """Count contacts of a church audience"""
+        query = select(func.count(ContactModel.id)).where(*self._audience_filter(church_id, segment))
+        return (await self.db.execute(query)).scalar_one()
+    
+    async def get_tag_counts(self, church_id: int) -> Dict[str, int]:
+        """Get how many contacts of a church carry each tag"""
+        query = select(TagCountModel.tag, TagCountModel.contact_count).where(
+            TagCountModel.church_id == church_id,
+            TagCountModel.tag != TagCountModel.ALL_CONTACTS,
+            TagCountModel.contact_count > 0
+        ).order_by(TagCountModel.tag)
+        return dict((await self.db.execute(query)).all())
+    
+    async def get_contact_total(self, church_id: int) -> int:
+        """Get how many contacts a church has"""
+        query = select(TagCountModel.contact_count).where(
+            TagCountModel.church_id == church_id,
+            TagCountModel.tag == TagCountModel.ALL_CONTACTS
+        )
+        return (await self.db.execute(query)).scalar_one_or_none() or 0
+    
+    async def update(self, contact: Contact) -> Contact:
+        """Update contact"""
+        try:
+            model = await self._to_model(contact)
+            deltas = self._tag_deltas(contact.church_id, self._previous_tags(model), contact.tags)
+            await self.db.flush()
+            await self._apply_tag_deltas(deltas)
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error updating contact: {str(e)}")
+    
+    async def delete(self, contact_id: int) -> None:
+        """Delete contact"""
+        try:
+            model = await self.db.get(ContactModel, contact_id)
+            if not model:
+                raise ContactNotFoundException(f"Contact with id {contact_id} not found")
+            deltas = self._tag_deltas(model.church_id, model.tags, None)
+            await self.db.delete(model)
+            await self.db.flush()
+            await self._apply_tag_deltas(deltas)
+        except ContactNotFoundException:
+            raise
+        except Exception as e:
+            raise RepositoryException(f"Error deleting contact: {str(e)}")
+    
+    async def bulk_create(self, contacts: List[Contact], skip_duplicates: bool = False) -> List[Contact]:
+        """Bulk create contacts with one multi-row INSERT ... RETURNING per batch"""
+        if not contacts:
+            return []
+        try:
+            created = []
+            for start in range(0, len(contacts), self.BULK_INSERT_BATCH_SIZE):
+                batch = contacts[start:start + self.BULK_INSERT_BATCH_SIZE]
+                rows = await self.db.execute(self._bulk_insert_statement(batch, skip_duplicates))
+                created.extend(self._hydrate_inserted(batch, rows))
+            await self._apply_tag_deltas(self._created_tag_deltas(created))
+            await self.db.flush()
+            return created
+        except Exception as e:
+            raise RepositoryException(f"Error bulk creating contacts: {str(e)}")
@@ -0,0 +1,77 @@
+"""
+Async template repository implementation
+"""
+
+from typing import Optional, List, Tuple
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.template import Template
+from app.application.interfaces.repositories.template_repository import IAsyncTemplateRepository
+from app.infrastructure.database.models.template_model import TemplateModel
+from app.infrastructure.database.repositories.template_repository_impl import TemplateModelMapper
+from app.core.exceptions import TemplateNotFoundException, RepositoryException
+
+
+class AsyncTemplateRepositoryImpl(TemplateModelMapper, IAsyncTemplateRepository):
+    """Template repository implementation on an AsyncSession"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def _to_model(self, entity: Template) -> TemplateModel:
+        """Convert domain entity to SQLAlchemy model"""
+        if entity.id:
+            model = await self.db.get(TemplateModel, entity.id)
+            if not model:
+                raise TemplateNotFoundException(f"Template with id {entity.id} not found")
+        else:
+            model = TemplateModel()
+        
+        return self._fill_model(model, entity)
+    
+    async def create(self, template: Template) -> Template:
+        """Create a new template"""
+        try:
+            model = await self._to_model(template)
+            self.db.add(model)
+            await self.db.flush()
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error creating template: {str(e)}")
+    
+    async def get_by_id(self, template_id: int) -> Optional[Template]:
+        """Get template by ID"""
+        model = await self.db.get(TemplateModel, template_id)
+        return self._to_domain(model) if model else None
+    
+    async def list_by_church(
+        self,
+        church_id: int,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Template]:
+        """List templates by church, newest first, starting after a (created_at, id) key"""
+        models = (await self.db.execute(self._page_query(church_id, limit, after))).scalars().all()
+        return [self._to_domain(model) for model in models]
+    
+    async def update(self, template: Template) -> Template:
+        """Update template"""
+        try:
+            model = await self._to_model(template)
+            await self.db.flush()
+            return self._to_domain(model)
+        except Exception as e:
+            raise RepositoryException(f"Error updating template: {str(e)}")
+    
+    async def delete(self, template_id: int) -> None:
+        """Delete template"""
+        try:
+            model = await self.db.get(TemplateModel, template_id)
+            if not model:
+                raise TemplateNotFoundException(f"Template with id {template_id} not found")
+            await self.db.delete(model)
+            await self.db.flush()
+        except TemplateNotFoundException:
+            raise
+        except Exception as e:
+            raise RepositoryException(f"Error deleting template: {str(e)}")
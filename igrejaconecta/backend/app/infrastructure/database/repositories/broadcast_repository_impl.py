@@ -2,21 +2,22 @@
 Broadcast repository implementation
 """
 
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple
+from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update, tuple_, or_, and_
 from app.domain.entities.broadcast import Broadcast, BroadcastStatus
+from app.domain.entities.delivery import ACCEPTED_STATUSES
+from app.domain.value_objects.segment import Segment
+from app.domain.value_objects.media import Media
 from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository
 from app.infrastructure.database.models.broadcast_model import BroadcastModel
+from app.infrastructure.database.models.delivery_model import DeliveryModel
 from app.core.exceptions import BroadcastNotFoundException, RepositoryException
 
 
-class BroadcastRepositoryImpl(IBroadcastRepository):
-    """Broadcast repository implementation"""
-    
-    def __init__(self, db: Session):
-        self.db = db
+class BroadcastModelMapper:
+    """Maps broadcast entities to and from SQLAlchemy models"""
     
     def _to_domain(self, model: BroadcastModel) -> Broadcast:
         """Convert SQLAlchemy model to domain entity"""
@@ -32,41 +33,97 @@ class BroadcastRepositoryImpl(IBroadcastRepository):
             sent_at=model.sent_at,
             status=BroadcastStatus(model.status),
             total_sent=model.total_sent,
-            created_at=model.created_at
+            created_at=model.created_at,
+            segment=Segment.from_dict(model.segment) if model.segment else None,
+            total_delivered=model.total_delivered or 0,
+            total_read=model.total_read or 0,
+            total_failed=model.total_failed or 0,
+            whatsapp_template=model.whatsapp_template,
+            whatsapp_template_language=model.whatsapp_template_language,
+            template_parameters=model.template_parameters or [],
+            media=Media.from_dict(model.media) if model.media else None,
+            claimed_at=model.claimed_at
         )
     
-    def _to_model(self, entity: Broadcast) -> BroadcastModel:
-        """Convert domain entity to SQLAlchemy model"""
-        if entity.id:
-            model = self.db.query(BroadcastModel).filter(BroadcastModel.id == entity.id).first()
-            if not model:
-                raise BroadcastNotFoundException(f"Broadcast with id {entity.id} not found")
-        else:
-            model = BroadcastModel()
-        
+    def _fill_model(self, model: BroadcastModel, entity: Broadcast) -> BroadcastModel:
+        """Copy domain entity fields onto a SQLAlchemy model"""
         model.church_id = entity.church_id
         model.title = entity.title
         model.message = entity.message
         model.link_url = entity.link_url
         model.button_text = entity.button_text
         model.contact_tags = entity.contact_tags
+        model.segment = entity.segment.to_dict() if entity.segment else None
         model.scheduled_at = entity.scheduled_at
         model.sent_at = entity.sent_at
         model.status = entity.status.value
         model.total_sent = entity.total_sent
+        model.whatsapp_template = entity.whatsapp_template
+        model.whatsapp_template_language = entity.whatsapp_template_language
+        model.template_parameters = entity.template_parameters
+        model.media = entity.media.to_dict() if entity.media else None
+        # Webhook counters are only ever incremented in place by the delivery
+        # repository, and claimed_at is only written by claims
         
         return model
     
+    def _page_query(
+        self,
+        church_id: int,
+        limit: int,
+        status: Optional[BroadcastStatus],
+        after: Optional[Tuple[datetime, int]]
+    ):
+        """Build a keyset page query on (church_id, created_at, id), newest first"""
+        query = select(BroadcastModel).where(BroadcastModel.church_id == church_id)
+        if status:
+            query = query.where(BroadcastModel.status == status.value)
+        if after:
+            query = query.where(tuple_(BroadcastModel.created_at, BroadcastModel.id) < tuple_(*after))
+        return query.order_by(BroadcastModel.created_at.desc(), BroadcastModel.id.desc()).limit(limit)
+
+
+    def _claim_due_statement(self, now: datetime, horizon: timedelta, lease: timedelta, limit: int):
+        """Build the UPDATE ... RETURNING that claims due scheduled broadcasts"""
+        # SKIP LOCKED lets concurrent sweeps split the due rows instead of
+        # waiting on each other or claiming the same ones
+        due = select(BroadcastModel.id).where(
+            BroadcastModel.status == BroadcastStatus.PENDING.value,
+            BroadcastModel.scheduled_at.isnot(None),
+            BroadcastModel.scheduled_at <= now + horizon,
+            or_(BroadcastModel.dispatched_at.is_(None), BroadcastModel.dispatched_at < now - lease)
+        ).order_by(BroadcastModel.scheduled_at).limit(limit).with_for_update(skip_locked=True)
+        
+        return update(BroadcastModel).where(BroadcastModel.id.in_(due)).values(
+            dispatched_at=func.greatest(BroadcastModel.scheduled_at, now)
+        ).returning(BroadcastModel.id, BroadcastModel.scheduled_at)
+
+
+class BroadcastRepositoryImpl(BroadcastModelMapper, IBroadcastRepository):
+    """Broadcast repository implementation"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _to_model(self, entity: Broadcast) -> BroadcastModel:
+        """Convert domain entity to SQLAlchemy model"""
+        if entity.id:
+            model = self.db.query(BroadcastModel).filter(BroadcastModel.id == entity.id).first()
+            if not model:
+                raise BroadcastNotFoundException(f"Broadcast with id {entity.id} not found")
+        else:
+            model = BroadcastModel()
+        
+        return self._fill_model(model, entity)
+    
     def create(self, broadcast: Broadcast) -> Broadcast:
         """Create a new broadcast"""
         try:
             model = self._to_model(broadcast)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error creating broadcast: {str(e)}")
     
     def get_by_id(self, broadcast_id: int) -> Optional[Broadcast]:
@@ -77,17 +134,13 @@ class BroadcastRepositoryImpl(IBroadcastRepository):
     def list_by_church(
         self, 
         church_id: int, 
-        skip: int = 0, 
         limit: int = 100,
-        status: Optional[BroadcastStatus] = None
+        status: Optional[BroadcastStatus] = None,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> List[Broadcast]:
-        """List broadcasts by church"""
-        query = self.db.query(BroadcastModel).filter(BroadcastModel.church_id == church_id)
-        
-        if status:
-            query = query.filter(BroadcastModel.status == status.value)
-        
-        models = query.order_by(BroadcastModel.created_at.desc()).offset(skip).limit(limit).all()
+        """List broadcasts by church, newest first, starting after a (created_at, id) key"""
+        query = self._page_query(church_id, limit, status, after)
+        models = self.db.execute(query).scalars().all()
         return [self._to_domain(model) for model in models]
     
     def list_scheduled(self, before: Optional[datetime] = None) -> List[Broadcast]:
@@ -103,15 +156,75 @@ class BroadcastRepositoryImpl(IBroadcastRepository):
         models = query.order_by(BroadcastModel.scheduled_at.asc()).all()
         return [self._to_domain(model) for model in models]
     
+    def claim_for_sending(
+        self,
+        broadcast_id: int,
+        resume: bool = False,
+        lease: Optional[timedelta] = None
+    ) -> Optional[Broadcast]:
+        """Atomically move a pending broadcast, or a failed one when resuming, to sending"""
+        # The WHERE on status is re-checked after any concurrent claim commits,
+        # so exactly one caller gets the row back
+        now = datetime.utcnow()
+        if not resume:
+            claimable = BroadcastModel.status == BroadcastStatus.PENDING.value
+        elif lease:
+            # A send whose workers died stays sending; take it over once its lease lapsed
+            claimable = or_(
+                BroadcastModel.status == BroadcastStatus.FAILED.value,
+                and_(
+                    BroadcastModel.status == BroadcastStatus.SENDING.value,
+                    BroadcastModel.claimed_at < now - lease
+                )
+            )
+        else:
+            claimable = BroadcastModel.status == BroadcastStatus.FAILED.value
+        stmt = update(BroadcastModel).where(
+            BroadcastModel.id == broadcast_id,
+            claimable
+        ).values(status=BroadcastStatus.SENDING.value, claimed_at=now).returning(BroadcastModel)
+        model = self.db.execute(stmt).scalar_one_or_none()
+        return self._to_domain(model) if model else None
+    
+    def renew_claim(self, broadcast_id: int) -> None:
+        """Extend the lease of a broadcast still being sent"""
+        self.db.execute(
+            update(BroadcastModel).where(
+                BroadcastModel.id == broadcast_id,
+                BroadcastModel.status == BroadcastStatus.SENDING.value
+            ).values(claimed_at=datetime.utcnow())
+        )
+    
+    def refresh_total_sent(self, broadcast_id: int) -> None:
+        """Recount total_sent from the delivery ledger in a single statement"""
+        # Retries finish at any time, also after finalize; a single UPDATE
+        # cannot overwrite a status or count written concurrently
+        sent = select(func.count()).select_from(DeliveryModel).where(
+            DeliveryModel.broadcast_id == broadcast_id,
+            DeliveryModel.status.in_([status.value for status in ACCEPTED_STATUSES])
+        ).scalar_subquery()
+        self.db.execute(
+            update(BroadcastModel).where(BroadcastModel.id == broadcast_id).values(total_sent=sent)
+        )
+    
+    def claim_due_scheduled(
+        self,
+        now: datetime,
+        horizon: timedelta,
+        lease: timedelta,
+        limit: int
+    ) -> List[Tuple[int, datetime]]:
+        """Claim pending broadcasts scheduled before now + horizon that no dispatch owns"""
+        rows = self.db.execute(self._claim_due_statement(now, horizon, lease, limit))
+        return [(row.id, row.scheduled_at) for row in rows]
+    
     def update(self, broadcast: Broadcast) -> Broadcast:
         """Update broadcast"""
         try:
             model = self._to_model(broadcast)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error updating broadcast: {str(e)}")
     
     def delete(self, broadcast_id: int) -> None:
@@ -121,11 +234,10 @@ class BroadcastRepositoryImpl(IBroadcastRepository):
             if not model:
                 raise BroadcastNotFoundException(f"Broadcast with id {broadcast_id} not found")
             self.db.delete(model)
-            self.db.commit()
+            self.db.flush()
         except BroadcastNotFoundException:
             raise
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error deleting broadcast: {str(e)}")
     
     def get_statistics(self, church_id: int) -> dict:
@@ -141,6 +253,7 @@ class BroadcastRepositoryImpl(IBroadcastRepository):
         result = {
             'total': 0,
             'pending': 0,
+            'sending': 0,
             'sent': 0,
             'failed': 0,
             'cancelled': 0,
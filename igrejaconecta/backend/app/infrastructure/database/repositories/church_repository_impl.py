@@ -8,14 +8,13 @@ from app.domain.entities.church import Church
 from app.application.interfaces.repositories.church_repository import IChurchRepository
 from app.infrastructure.database.models.church_model import ChurchModel
 from app.core.exceptions import ChurchNotFoundException, RepositoryException
+from app.infrastructure.cache.memory_cache import church_id_cache
+from app.infrastructure.database.cache_invalidation import invalidate_after_commit
 from datetime import datetime
 
 
-class ChurchRepositoryImpl(IChurchRepository):
-    """Church repository implementation"""
-    
-    def __init__(self, db: Session):
-        self.db = db
+class ChurchModelMapper:
+    """Maps church entities to and from SQLAlchemy models"""
     
     def _to_domain(self, model: ChurchModel) -> Church:
         """Convert SQLAlchemy model to domain entity"""
@@ -30,18 +29,13 @@ class ChurchRepositoryImpl(IChurchRepository):
             whatsapp_phone_id=model.whatsapp_phone_id,
             whatsapp_access_token=model.whatsapp_access_token,
             created_at=model.created_at,
-            is_active=model.is_active
+            is_active=model.is_active,
+            messaging_tier=model.messaging_tier,
+            whatsapp_business_account_id=model.whatsapp_business_account_id
         )
     
-    def _to_model(self, entity: Church) -> ChurchModel:
-        """Convert domain entity to SQLAlchemy model"""
-        if entity.id:
-            model = self.db.query(ChurchModel).filter(ChurchModel.id == entity.id).first()
-            if not model:
-                raise ChurchNotFoundException(f"Church with id {entity.id} not found")
-        else:
-            model = ChurchModel()
-        
+    def _fill_model(self, model: ChurchModel, entity: Church) -> ChurchModel:
+        """Copy domain entity fields onto a SQLAlchemy model"""
         model.name = entity.name
         model.admin_name = entity.admin_name
         model.email = entity.email
@@ -49,20 +43,38 @@ class ChurchRepositoryImpl(IChurchRepository):
         model.whatsapp_phone_id = entity.whatsapp_phone_id
         model.whatsapp_access_token = entity.whatsapp_access_token
         model.is_active = entity.is_active
+        model.messaging_tier = entity.messaging_tier
+        model.whatsapp_business_account_id = entity.whatsapp_business_account_id
         # Note: firebase_uid should be set separately during creation
         
         return model
+
+
+class ChurchRepositoryImpl(ChurchModelMapper, IChurchRepository):
+    """Church repository implementation"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _to_model(self, entity: Church) -> ChurchModel:
+        """Convert domain entity to SQLAlchemy model"""
+        if entity.id:
+            model = self.db.query(ChurchModel).filter(ChurchModel.id == entity.id).first()
+            if not model:
+                raise ChurchNotFoundException(f"Church with id {entity.id} not found")
+        else:
+            model = ChurchModel()
+        
+        return self._fill_model(model, entity)
     
     def create(self, church: Church) -> Church:
         """Create a new church"""
         try:
             model = self._to_model(church)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error creating church: {str(e)}")
     
     def get_by_id(self, church_id: int) -> Optional[Church]:
@@ -84,11 +96,10 @@ class ChurchRepositoryImpl(IChurchRepository):
         """Update church"""
         try:
             model = self._to_model(church)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
+            invalidate_after_commit(self.db, church_id_cache, model.firebase_uid)
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error updating church: {str(e)}")
     
     def delete(self, church_id: int) -> None:
@@ -98,11 +109,11 @@ class ChurchRepositoryImpl(IChurchRepository):
             if not model:
                 raise ChurchNotFoundException(f"Church with id {church_id} not found")
             self.db.delete(model)
-            self.db.commit()
+            self.db.flush()
+            invalidate_after_commit(self.db, church_id_cache, model.firebase_uid)
         except ChurchNotFoundException:
             raise
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error deleting church: {str(e)}")
     
     def list_all(self, skip: int = 0, limit: int = 100) -> List[Church]:
@@ -2,21 +2,28 @@
 Contact repository implementation
 """
 
-from typing import Optional, List
+from collections import Counter
+from typing import Optional, List, Iterator, Tuple, Set
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from app.domain.entities.contact import Contact
+from sqlalchemy import and_, select, func, inspect, exists
+from sqlalchemy.dialects.postgresql import insert
+from app.domain.entities.contact import Contact, normalize_tags
 from app.domain.value_objects.phone import Phone
+from app.domain.value_objects.segment import Segment
+from app.domain.value_objects.recipient import Recipient
+from app.domain.entities.delivery import SETTLED_STATUSES
 from app.application.interfaces.repositories.contact_repository import IContactRepository
 from app.infrastructure.database.models.contact_model import ContactModel
+from app.infrastructure.database.models.tag_count_model import TagCountModel
+from app.infrastructure.database.models.delivery_model import DeliveryModel
+from app.infrastructure.database.segment_compiler import compile_segment
 from app.core.exceptions import ContactNotFoundException, RepositoryException
 
 
-class ContactRepositoryImpl(IContactRepository):
-    """Contact repository implementation"""
+class ContactModelMapper:
+    """Maps contact entities to and from SQLAlchemy models"""
     
-    def __init__(self, db: Session):
-        self.db = db
+    BULK_INSERT_BATCH_SIZE = 1000  # Rows per multi-row INSERT
     
     def _to_domain(self, model: ContactModel) -> Contact:
         """Convert SQLAlchemy model to domain entity"""
@@ -29,6 +36,124 @@ class ContactRepositoryImpl(IContactRepository):
             created_at=model.created_at
         )
     
+    def _fill_model(self, model: ContactModel, entity: Contact) -> ContactModel:
+        """Copy domain entity fields onto a SQLAlchemy model"""
+        model.church_id = entity.church_id
+        model.name = entity.name
+        model.phone = entity.phone.value
+        model.tags = normalize_tags(entity.tags)
+        
+        return model
+    
+    def _audience_filter(self, church_id: int, segment: Optional[Segment]) -> list:
+        """Build WHERE clauses for a church audience"""
+        clauses = [ContactModel.church_id == church_id]
+        if segment and not segment.is_everyone():
+            clauses.append(compile_segment(segment, ContactModel.tags))
+        return clauses
+    
+    def _unsettled_filter(self, broadcast_id: int):
+        """Build a WHERE clause leaving out contacts the broadcast is settled for"""
+        # Anti-join on the ledger's primary key, one index probe per contact
+        return ~exists().where(
+            DeliveryModel.broadcast_id == broadcast_id,
+            DeliveryModel.contact_id == ContactModel.id,
+            DeliveryModel.status.in_([status.value for status in SETTLED_STATUSES])
+        )
+    
+    def _tag_deltas(
+        self,
+        church_id: int,
+        previous: Optional[List[str]],
+        current: Optional[List[str]]
+    ) -> Counter:
+        """Count changes per (church_id, tag) when a contact goes from previous to current tags
+
+        None stands for a contact that does not exist, before a create or after a delete.
+        Blank tags are dropped, so no tag lands on the ALL_CONTACTS total row.
+        """
+        deltas = Counter()
+        if previous is None:
+            deltas[(church_id, TagCountModel.ALL_CONTACTS)] += 1
+        if current is None:
+            deltas[(church_id, TagCountModel.ALL_CONTACTS)] -= 1
+        for tag in normalize_tags(current):
+            deltas[(church_id, tag)] += 1
+        for tag in normalize_tags(previous):
+            deltas[(church_id, tag)] -= 1
+        return deltas
+    
+    def _previous_tags(self, model: ContactModel) -> List[str]:
+        """Get the tags a loaded contact had before its pending changes"""
+        history = inspect(model).attrs.tags.history
+        previous = history.deleted or history.unchanged
+        return list(previous[0] or []) if previous else []
+    
+    def _tag_count_statement(self, deltas: Counter):
+        """Build an upsert adding deltas to church_tag_counts, or None if nothing changed"""
+        # Sorted rows lock in the same order in every transaction, avoiding deadlocks
+        rows = [
+            {"church_id": church_id, "tag": tag, "contact_count": delta}
+            for (church_id, tag), delta in sorted(deltas.items())
+            if delta
+        ]
+        if not rows:
+            return None
+        stmt = insert(TagCountModel).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[TagCountModel.church_id, TagCountModel.tag],
+            set_={"contact_count": TagCountModel.contact_count + stmt.excluded.contact_count}
+        )
+    
+    def _page_query(self, church_id: int, limit: int, after_id: Optional[int]):
+        """Build a keyset page query on (church_id, id)"""
+        query = select(ContactModel).where(ContactModel.church_id == church_id)
+        if after_id is not None:
+            query = query.where(ContactModel.id > after_id)
+        return query.order_by(ContactModel.id).limit(limit)
+    
+    def _bulk_insert_statement(self, contacts: List[Contact], skip_duplicates: bool):
+        """Build a multi-row INSERT ... RETURNING for a batch of contacts"""
+        stmt = insert(ContactModel).values([
+            {
+                "church_id": contact.church_id,
+                "name": contact.name,
+                "phone": contact.phone.value,
+                "tags": contact.tags,
+                "created_at": contact.created_at,
+            }
+            for contact in contacts
+        ])
+        if skip_duplicates:
+            stmt = stmt.on_conflict_do_nothing(constraint="unique_church_phone")
+        return stmt.returning(ContactModel.id, ContactModel.church_id, ContactModel.phone, ContactModel.created_at)
+    
+    def _created_tag_deltas(self, created: List[Contact]) -> Counter:
+        """Sum tag count changes for newly inserted contacts"""
+        deltas = Counter()
+        for contact in created:
+            deltas.update(self._tag_deltas(contact.church_id, None, contact.tags))
+        return deltas
+    
+    def _hydrate_inserted(self, contacts: List[Contact], rows) -> List[Contact]:
+        """Write returned IDs back onto the inserted entities"""
+        # Skipped duplicates return no row, so match rows back by (church, phone)
+        by_phone = {(contact.church_id, contact.phone.value): contact for contact in contacts}
+        created = []
+        for row in rows:
+            contact = by_phone[(row.church_id, row.phone)]
+            contact.id = row.id
+            contact.created_at = row.created_at
+            created.append(contact)
+        return created
+
+
+class ContactRepositoryImpl(ContactModelMapper, IContactRepository):
+    """Contact repository implementation"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
     def _to_model(self, entity: Contact) -> ContactModel:
         """Convert domain entity to SQLAlchemy model"""
         if entity.id:
@@ -38,23 +163,23 @@ class ContactRepositoryImpl(IContactRepository):
         else:
             model = ContactModel()
         
-        model.church_id = entity.church_id
-        model.name = entity.name
-        model.phone = entity.phone.value
-        model.tags = entity.tags
-        
-        return model
+        return self._fill_model(model, entity)
+    
+    def _apply_tag_deltas(self, deltas: Counter) -> None:
+        """Add tag count changes in the current transaction"""
+        stmt = self._tag_count_statement(deltas)
+        if stmt is not None:
+            self.db.execute(stmt)
     
     def create(self, contact: Contact) -> Contact:
         """Create a new contact"""
         try:
             model = self._to_model(contact)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
+            self._apply_tag_deltas(self._tag_deltas(contact.church_id, None, contact.tags))
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error creating contact: {str(e)}")
     
     def get_by_id(self, contact_id: int) -> Optional[Contact]:
@@ -72,33 +197,92 @@ class ContactRepositoryImpl(IContactRepository):
         ).first()
         return self._to_domain(model) if model else None
     
-    def list_by_church(self, church_id: int, skip: int = 0, limit: int = 100) -> List[Contact]:
-        """List contacts by church"""
-        models = self.db.query(ContactModel).filter(
-            ContactModel.church_id == church_id
-        ).offset(skip).limit(limit).all()
+    def get_existing_phones(self, church_id: int, phones: List[str]) -> Set[str]:
+        """Get which of the given phone numbers already exist in a church"""
+        if not phones:
+            return set()
+        query = select(ContactModel.phone).where(
+            ContactModel.church_id == church_id,
+            ContactModel.phone == func.any(phones)
+        )
+        return set(self.db.execute(query).scalars())
+    
+    def list_by_church(self, church_id: int, limit: int = 100, after_id: Optional[int] = None) -> List[Contact]:
+        """List contacts by church in ID order, starting after a contact ID"""
+        models = self.db.execute(self._page_query(church_id, limit, after_id)).scalars().all()
         return [self._to_domain(model) for model in models]
     
     def list_by_tags(self, church_id: int, tags: List[str]) -> List[Contact]:
         """List contacts by tags"""
-        # PostgreSQL array overlap operator
         models = self.db.query(ContactModel).filter(
-            and_(
-                ContactModel.church_id == church_id,
-                ContactModel.tags.op('&&')(tags)  # Array overlap
-            )
+            *self._audience_filter(church_id, Segment.any_of(tags))
         ).all()
         return [self._to_domain(model) for model in models]
     
+    def iter_recipients(
+        self,
+        church_id: int,
+        segment: Optional[Segment] = None,
+        id_range: Optional[Tuple[int, int]] = None,
+        skip_settled_for: Optional[int] = None,
+        contact_ids: Optional[List[int]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Recipient]:
+        """Stream contacts of a church audience, optionally within an ID range or ID list"""
+        clauses = self._audience_filter(church_id, segment)
+        if id_range:
+            clauses.append(ContactModel.id.between(*id_range))
+        if contact_ids is not None:
+            clauses.append(ContactModel.id == func.any(contact_ids))
+        if skip_settled_for is not None:
+            clauses.append(self._unsettled_filter(skip_settled_for))
+        
+        # yield_per streams through a server-side cursor, fetching batch_size rows at a time
+        query = select(
+            ContactModel.id, ContactModel.phone, ContactModel.name, ContactModel.tags
+        ).where(*clauses).order_by(ContactModel.id)
+        result = self.db.execute(query.execution_options(yield_per=batch_size))
+        for contact_id, phone, name, tags in result:
+            yield Recipient(contact_id=contact_id, phone=phone, name=name, tags=tuple(tags or ()))
+    
+    def count_recipients(self, church_id: int, segment: Optional[Segment] = None) -> int:
+        """Count contacts of a church audience"""
+        query = select(func.count(ContactModel.id)).where(*self._audience_filter(church_id, segment))
+        return self.db.execute(query).scalar_one()
+    
+    def recipient_chunks(
+        self,
+        church_id: int,
+        segment: Optional[Segment],
+        chunk_size: int,
+        skip_settled_for: Optional[int] = None
+    ) -> List[Tuple[int, int, int]]:
+        """Split a church audience into (first_id, last_id, size) ranges of chunk_size contacts"""
+        clauses = self._audience_filter(church_id, segment)
+        if skip_settled_for is not None:
+            # Size chunks by the contacts they will actually send to
+            clauses.append(self._unsettled_filter(skip_settled_for))
+        numbered = select(
+            ContactModel.id,
+            ((func.row_number().over(order_by=ContactModel.id) - 1) // chunk_size).label('bucket')
+        ).where(*clauses).subquery()
+        
+        query = select(
+            func.min(numbered.c.id),
+            func.max(numbered.c.id),
+            func.count()
+        ).group_by(numbered.c.bucket).order_by(numbered.c.bucket)
+        return [tuple(row) for row in self.db.execute(query).all()]
+    
     def update(self, contact: Contact) -> Contact:
         """Update contact"""
         try:
             model = self._to_model(contact)
-            self.db.commit()
-            self.db.refresh(model)
+            deltas = self._tag_deltas(contact.church_id, self._previous_tags(model), contact.tags)
+            self.db.flush()
+            self._apply_tag_deltas(deltas)
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error updating contact: {str(e)}")
     
     def delete(self, contact_id: int) -> None:
@@ -107,24 +291,36 @@ class ContactRepositoryImpl(IContactRepository):
             model = self.db.query(ContactModel).filter(ContactModel.id == contact_id).first()
             if not model:
                 raise ContactNotFoundException(f"Contact with id {contact_id} not found")
+            deltas = self._tag_deltas(model.church_id, model.tags, None)
             self.db.delete(model)
-            self.db.commit()
+            self.db.flush()
+            self._apply_tag_deltas(deltas)
         except ContactNotFoundException:
             raise
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error deleting contact: {str(e)}")
     
-    def bulk_create(self, contacts: List[Contact]) -> List[Contact]:
-        """Bulk create contacts"""
+    def bulk_create(self, contacts: List[Contact], skip_duplicates: bool = False) -> List[Contact]:
+        """Bulk create contacts, optionally skipping phones already in the church
+
+        Each batch is a single multi-row INSERT ... RETURNING, and the returned
+        IDs are written back onto the given entities, so no row is re-read.
+        """
+        if not contacts:
+            return []
         try:
-            models = [self._to_model(contact) for contact in contacts]
-            self.db.add_all(models)
-            self.db.commit()
-            for model in models:
-                self.db.refresh(model)
-            return [self._to_domain(model) for model in models]
+            created = []
+            for start in range(0, len(contacts), self.BULK_INSERT_BATCH_SIZE):
+                created.extend(
+                    self._insert_batch(contacts[start:start + self.BULK_INSERT_BATCH_SIZE], skip_duplicates)
+                )
+            self._apply_tag_deltas(self._created_tag_deltas(created))
+            self.db.flush()
+            return created
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error bulk creating contacts: {str(e)}")
-
+    
+    def _insert_batch(self, contacts: List[Contact], skip_duplicates: bool) -> List[Contact]:
+        """Insert one batch of contacts and hydrate them from the returned rows"""
+        rows = self.db.execute(self._bulk_insert_statement(contacts, skip_duplicates))
+        return self._hydrate_inserted(contacts, rows)
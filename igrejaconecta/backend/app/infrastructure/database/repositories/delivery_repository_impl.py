@@ -0,0 +1,143 @@
+"""
+Delivery repository implementation
+"""
+
+from collections import Counter
+from typing import List, Set, Dict
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, update, bindparam
+from sqlalchemy.dialects.postgresql import insert
+from app.domain.entities.delivery import Delivery, DeliveryStatus, ACCEPTED_STATUSES
+from app.domain.value_objects.status_event import StatusEvent
+from app.application.interfaces.repositories.delivery_repository import IDeliveryRepository
+from app.infrastructure.database.models.delivery_model import DeliveryModel
+from app.infrastructure.database.models.broadcast_model import BroadcastModel
+
+
+class DeliveryRepositoryImpl(IDeliveryRepository):
+    """Delivery repository implementation"""
+    
+    # Broadcast counter -> delivery statuses it counts
+    COUNTERS = {
+        "total_delivered": (DeliveryStatus.DELIVERED, DeliveryStatus.READ),
+        "total_read": (DeliveryStatus.READ,),
+        "total_failed": (DeliveryStatus.FAILED,),
+    }
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def _record_statement(self, deliveries: List[Delivery]):
+        """Build a multi-row upsert of delivery outcomes"""
+        # Sorted rows lock in the same order in every transaction, avoiding deadlocks
+        rows = [
+            {
+                "broadcast_id": delivery.broadcast_id,
+                "contact_id": delivery.contact_id,
+                "status": delivery.status.value,
+                "whatsapp_message_id": delivery.whatsapp_message_id,
+                "error": delivery.error,
+                "error_code": delivery.error_code,
+                "attempted_at": delivery.attempted_at,
+            }
+            for delivery in sorted(deliveries, key=lambda d: (d.broadcast_id, d.contact_id))
+        ]
+        stmt = insert(DeliveryModel).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[DeliveryModel.broadcast_id, DeliveryModel.contact_id],
+            set_={
+                "status": stmt.excluded.status,
+                "whatsapp_message_id": stmt.excluded.whatsapp_message_id,
+                "error": stmt.excluded.error,
+                "error_code": stmt.excluded.error_code,
+                "attempted_at": stmt.excluded.attempted_at,
+            },
+            # A retry that fails must not hide an earlier successful delivery
+            where=DeliveryModel.status.notin_([status.value for status in ACCEPTED_STATUSES])
+        )
+    
+    def _latest_statuses(self, events: List[StatusEvent]) -> Dict[str, StatusEvent]:
+        """Keep the most advanced event of each message"""
+        latest = {}
+        for event in sorted(events, key=lambda e: e.timestamp):
+            current = latest.get(event.whatsapp_message_id)
+            if current is None or event.status.supersedes(current.status):
+                latest[event.whatsapp_message_id] = event
+        return latest
+    
+    def _counter_deltas(self, broadcast_id: int, previous: DeliveryStatus, current: DeliveryStatus) -> Counter:
+        """Count changes per (broadcast_id, counter) when a delivery moves from previous to current"""
+        deltas = Counter()
+        for counter, statuses in self.COUNTERS.items():
+            deltas[(broadcast_id, counter)] += (current in statuses) - (previous in statuses)
+        return deltas
+    
+    def _counter_params(self, deltas: Counter) -> List[dict]:
+        """Build one parameter set per broadcast with counter changes, in ID order"""
+        broadcast_ids = sorted({broadcast_id for (broadcast_id, _), delta in deltas.items() if delta})
+        return [
+            {"b_id": broadcast_id, **{counter: deltas[(broadcast_id, counter)] for counter in self.COUNTERS}}
+            for broadcast_id in broadcast_ids
+        ]
+    
+    def record(self, deliveries: List[Delivery]) -> None:
+        """Insert or update delivery outcomes; a contact already sent to stays sent"""
+        if deliveries:
+            self.db.execute(self._record_statement(deliveries))
+    
+    def count_sent(self, broadcast_id: int) -> int:
+        """Count contacts the broadcast was delivered to"""
+        query = select(func.count()).select_from(DeliveryModel).where(
+            DeliveryModel.broadcast_id == broadcast_id,
+            DeliveryModel.status.in_([status.value for status in ACCEPTED_STATUSES])
+        )
+        return self.db.execute(query).scalar_one()
+    
+    def apply_status_events(self, events: List[StatusEvent]) -> Set[str]:
+        """Move deliveries forward to reported statuses, rolling the changes up into broadcast counters"""
+        if not events:
+            return set()
+        latest = self._latest_statuses(events)
+        
+        # Locked in key order, like the ledger upsert, so concurrent consumers cannot deadlock
+        query = select(
+            DeliveryModel.broadcast_id,
+            DeliveryModel.contact_id,
+            DeliveryModel.whatsapp_message_id,
+            DeliveryModel.status
+        ).where(
+            DeliveryModel.whatsapp_message_id == func.any(list(latest))
+        ).order_by(DeliveryModel.broadcast_id, DeliveryModel.contact_id).with_for_update()
+        rows = self.db.execute(query).all()
+        
+        changes = []
+        deltas = Counter()
+        for row in rows:
+            previous = DeliveryStatus(row.status)
+            event = latest[row.whatsapp_message_id]
+            if not event.status.supersedes(previous):
+                continue
+            changes.append({
+                "broadcast_id": row.broadcast_id,
+                "contact_id": row.contact_id,
+                "status": event.status.value,
+                "error": event.error,
+                "error_code": event.error_code,
+            })
+            deltas.update(self._counter_deltas(row.broadcast_id, previous, event.status))
+        
+        if changes:
+            # Bulk UPDATE by primary key, sent as one executemany
+            self.db.execute(update(DeliveryModel), changes)
+        counter_params = self._counter_params(deltas)
+        if counter_params:
+            self.db.execute(
+                update(BroadcastModel)
+                .where(BroadcastModel.id == bindparam("b_id"))
+                .values({
+                    counter: getattr(BroadcastModel, counter) + bindparam(counter)
+                    for counter in self.COUNTERS
+                }),
+                counter_params
+            )
+        return {row.whatsapp_message_id for row in rows}
@@ -2,19 +2,18 @@
 Template repository implementation
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
 from app.domain.entities.template import Template
 from app.application.interfaces.repositories.template_repository import ITemplateRepository
 from app.infrastructure.database.models.template_model import TemplateModel
 from app.core.exceptions import TemplateNotFoundException, RepositoryException
 
 
-class TemplateRepositoryImpl(ITemplateRepository):
-    """Template repository implementation"""
-    
-    def __init__(self, db: Session):
-        self.db = db
+class TemplateModelMapper:
+    """Maps template entities to and from SQLAlchemy models"""
     
     def _to_domain(self, model: TemplateModel) -> Template:
         """Convert SQLAlchemy model to domain entity"""
@@ -28,6 +27,30 @@ class TemplateRepositoryImpl(ITemplateRepository):
             created_at=model.created_at
         )
     
+    def _fill_model(self, model: TemplateModel, entity: Template) -> TemplateModel:
+        """Copy domain entity fields onto a SQLAlchemy model"""
+        model.church_id = entity.church_id
+        model.name = entity.name
+        model.message = entity.message
+        model.link_url = entity.link_url
+        model.button_text = entity.button_text
+        
+        return model
+    
+    def _page_query(self, church_id: int, limit: int, after: Optional[Tuple[datetime, int]]):
+        """Build a keyset page query on (church_id, created_at, id), newest first"""
+        query = select(TemplateModel).where(TemplateModel.church_id == church_id)
+        if after:
+            query = query.where(tuple_(TemplateModel.created_at, TemplateModel.id) < tuple_(*after))
+        return query.order_by(TemplateModel.created_at.desc(), TemplateModel.id.desc()).limit(limit)
+
+
+class TemplateRepositoryImpl(TemplateModelMapper, ITemplateRepository):
+    """Template repository implementation"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
     def _to_model(self, entity: Template) -> TemplateModel:
         """Convert domain entity to SQLAlchemy model"""
         if entity.id:
@@ -37,24 +60,16 @@ class TemplateRepositoryImpl(ITemplateRepository):
         else:
             model = TemplateModel()
         
-        model.church_id = entity.church_id
-        model.name = entity.name
-        model.message = entity.message
-        model.link_url = entity.link_url
-        model.button_text = entity.button_text
-        
-        return model
+        return self._fill_model(model, entity)
     
     def create(self, template: Template) -> Template:
         """Create a new template"""
         try:
             model = self._to_model(template)
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error creating template: {str(e)}")
     
     def get_by_id(self, template_id: int) -> Optional[Template]:
@@ -62,22 +77,23 @@ class TemplateRepositoryImpl(ITemplateRepository):
         model = self.db.query(TemplateModel).filter(TemplateModel.id == template_id).first()
         return self._to_domain(model) if model else None
     
-    def list_by_church(self, church_id: int, skip: int = 0, limit: int = 100) -> List[Template]:
-        """List templates by church"""
-        models = self.db.query(TemplateModel).filter(
-            TemplateModel.church_id == church_id
-        ).order_by(TemplateModel.created_at.desc()).offset(skip).limit(limit).all()
+    def list_by_church(
+        self,
+        church_id: int,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[Template]:
+        """List templates by church, newest first, starting after a (created_at, id) key"""
+        models = self.db.execute(self._page_query(church_id, limit, after)).scalars().all()
         return [self._to_domain(model) for model in models]
     
     def update(self, template: Template) -> Template:
         """Update template"""
         try:
             model = self._to_model(template)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
             return self._to_domain(model)
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error updating template: {str(e)}")
     
     def delete(self, template_id: int) -> None:
@@ -87,10 +103,9 @@ class TemplateRepositoryImpl(ITemplateRepository):
             if not model:
                 raise TemplateNotFoundException(f"Template with id {template_id} not found")
             self.db.delete(model)
-            self.db.commit()
+            self.db.flush()
         except TemplateNotFoundException:
             raise
         except Exception as e:
-            self.db.rollback()
             raise RepositoryException(f"Error deleting template: {str(e)}")
 
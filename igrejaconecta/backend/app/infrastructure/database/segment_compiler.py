@@ -0,0 +1,31 @@
+"""
+Compiles tag segments to SQL on a PostgreSQL array column
+"""
+
+from sqlalchemy import and_, or_, not_, true
+from app.domain.value_objects.segment import Segment
+
+
+def compile_segment(segment: Segment, column):
+    """Build a WHERE clause selecting the rows whose tags match the segment
+
+    Sibling tags are merged into one array operator, "all of" into @> and
+    "any of" into &&, both of which the GIN index on the column answers.
+    """
+    if segment.op == Segment.TAG:
+        return column.op('@>')([segment.tag])
+    
+    if segment.op == Segment.NOT:
+        # Rows without tags match every negation
+        return or_(column.is_(None), not_(compile_segment(segment.terms[0], column)))
+    
+    tags = [term.tag for term in segment.terms if term.op == Segment.TAG]
+    clauses = [compile_segment(term, column) for term in segment.terms if term.op != Segment.TAG]
+    if segment.op == Segment.AND:
+        if tags:
+            clauses.insert(0, column.op('@>')(tags))
+        return and_(*clauses) if clauses else true()
+    
+    if tags:
+        clauses.insert(0, column.op('&&')(tags))
+    return or_(*clauses)
@@ -0,0 +1,103 @@
+"""
+SQLAlchemy units of work
+"""
+
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.application.interfaces.unit_of_work import IUnitOfWork, IAsyncUnitOfWork
+from app.infrastructure.database.database import SessionLocal, AsyncSessionLocal
+from app.infrastructure.database.pool_metrics import sync_pool_metrics, async_pool_metrics
+from app.infrastructure.database.repositories.church_repository_impl import ChurchRepositoryImpl
+from app.infrastructure.database.repositories.contact_repository_impl import ContactRepositoryImpl
+from app.infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
+from app.infrastructure.database.repositories.template_repository_impl import TemplateRepositoryImpl
+from app.infrastructure.database.repositories.delivery_repository_impl import DeliveryRepositoryImpl
+from app.infrastructure.database.repositories.async_church_repository_impl import AsyncChurchRepositoryImpl
+from app.infrastructure.database.repositories.async_contact_repository_impl import AsyncContactRepositoryImpl
+from app.infrastructure.database.repositories.async_broadcast_repository_impl import AsyncBroadcastRepositoryImpl
+from app.infrastructure.database.repositories.async_template_repository_impl import AsyncTemplateRepositoryImpl
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    """Unit of work for Celery tasks on the sync engine"""
+    
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+    
+    def __enter__(self) -> "SqlAlchemyUnitOfWork":
+        self.session = self.session_factory()
+        # Check out the connection now so time spent waiting on the pool is measured
+        started = time.perf_counter()
+        try:
+            self.session.connection()
+        except PoolTimeoutError:
+            sync_pool_metrics.record_timeout()
+            self.session.close()
+            raise
+        sync_pool_metrics.record_checkout(time.perf_counter() - started)
+        
+        self.churches = ChurchRepositoryImpl(self.session)
+        self.contacts = ContactRepositoryImpl(self.session)
+        self.broadcasts = BroadcastRepositoryImpl(self.session)
+        self.templates = TemplateRepositoryImpl(self.session)
+        self.deliveries = DeliveryRepositoryImpl(self.session)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.session.close()
+    
+    def commit(self) -> None:
+        """Commit the current transaction and start a new one"""
+        self.session.commit()
+    
+    def rollback(self) -> None:
+        """Roll back the current transaction"""
+        self.session.rollback()
+
+
+class AsyncSqlAlchemyUnitOfWork(IAsyncUnitOfWork):
+    """Unit of work for API requests on the async engine"""
+    
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self.session_factory = session_factory
+    
+    async def __aenter__(self) -> "AsyncSqlAlchemyUnitOfWork":
+        self.session = self.session_factory()
+        # Check out the connection now so time spent waiting on the pool is measured
+        started = time.perf_counter()
+        try:
+            await self.session.connection()
+        except PoolTimeoutError:
+            async_pool_metrics.record_timeout()
+            await self.session.close()
+            raise
+        async_pool_metrics.record_checkout(time.perf_counter() - started)
+        
+        self.churches = AsyncChurchRepositoryImpl(self.session)
+        self.contacts = AsyncContactRepositoryImpl(self.session)
+        self.broadcasts = AsyncBroadcastRepositoryImpl(self.session)
+        self.templates = AsyncTemplateRepositoryImpl(self.session)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+    
+    async def commit(self) -> None:
+        """Commit the current transaction and start a new one"""
+        await self.session.commit()
+    
+    async def rollback(self) -> None:
+        """Roll back the current transaction"""
+        await self.session.rollback()
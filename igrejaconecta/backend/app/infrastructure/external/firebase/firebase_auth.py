@@ -4,12 +4,15 @@ Firebase Authentication client
 
 import json
 import base64
+import hashlib
+import time
 from typing import Optional, Dict, Any
 import firebase_admin
 from firebase_admin import credentials, auth
 from app.application.interfaces.services.firebase_service import IFirebaseService
 from app.core.config import settings
 from app.core.exceptions import AuthenticationException
+from app.infrastructure.cache.memory_cache import token_cache
 
 
 class FirebaseAuth(IFirebaseService):
@@ -41,9 +44,19 @@ class FirebaseAuth(IFirebaseService):
             raise AuthenticationException(f"Failed to initialize Firebase: {str(e)}")
     
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """Verify Firebase ID token and return decoded token"""
+        """Verify Firebase ID token and return decoded token
+
+        Verified tokens are cached until their exp, so repeated requests with
+        the same token skip signature checks.
+        """
+        key = hashlib.sha256(token.encode()).hexdigest()
+        cached = token_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             decoded_token = auth.verify_id_token(token)
+            token_cache.set(key, decoded_token, ttl=decoded_token.get('exp', 0) - time.time())
             return decoded_token
         except auth.InvalidIdTokenError:
             raise AuthenticationException("Invalid Firebase token")
@@ -0,0 +1,87 @@
+"""
+Graph API batch requests: many WhatsApp messages in one HTTP call
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote_plus
+import orjson
+from app.core.config import settings
+from app.core.exceptions import WhatsAppDeliveryException, WhatsAppTransientException
+from app.infrastructure.external.whatsapp.errors import classify_status
+
+# Operations the Graph API accepts in one batch request
+GRAPH_BATCH_LIMIT = 50
+
+BatchResult = Tuple[Optional[Dict[str, Any]], Optional[WhatsAppDeliveryException]]
+
+
+def batch_size(tier: Optional[str] = None) -> int:
+    """Get how many messages to send per request for a messaging tier
+
+    A batch takes one rate limit token per message all at once, so it must
+    fit in the tier's bucket; slower tiers send one message per request.
+    """
+    size = min(settings.WHATSAPP_BATCH_SIZE, GRAPH_BATCH_LIMIT)
+    rates = settings.WHATSAPP_RATE_TIERS
+    rate = rates.get(tier or settings.WHATSAPP_DEFAULT_TIER, rates[settings.WHATSAPP_DEFAULT_TIER])
+    return size if rate >= size else 1
+
+
+def encode_batch(relative_url: str, bodies: Sequence[bytes]) -> bytes:
+    """Encode form-encoded message bodies as one batch request body"""
+    operations = [
+        {"method": "POST", "relative_url": relative_url, "body": body.decode()}
+        for body in bodies
+    ]
+    return b"batch=" + quote_plus(orjson.dumps(operations)).encode()
+
+
+def _retry_after(item: Dict[str, Any]) -> Optional[float]:
+    """Get an operation's Retry-After header in seconds, if present"""
+    for header in item.get("headers") or ():
+        if str(header.get("name", "")).lower() == "retry-after":
+            try:
+                return float(header["value"])
+            except (KeyError, ValueError, TypeError):
+                return None
+    return None
+
+
+def parse_batch_response(content: bytes, count: int) -> List[BatchResult]:
+    """Split a batch response into each operation's parsed body or delivery failure
+
+    Operations the Graph API did not get to (null or missing items) fail
+    transiently so they can be retried.
+    """
+    try:
+        items = orjson.loads(content)
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        items = []
+
+    results: List[BatchResult] = []
+    for index in range(count):
+        item = items[index] if index < len(items) else None
+        if not isinstance(item, dict):
+            results.append((None, WhatsAppTransientException("WhatsApp API error: batch operation not processed")))
+            continue
+        status_code = int(item.get("code") or 0)
+        body = item.get("body") or ""
+        if 200 <= status_code < 300:
+            try:
+                results.append((orjson.loads(body), None))
+            except ValueError:
+                results.append(({}, None))
+            continue
+        message = f"WhatsApp API error: batch operation returned {status_code}"
+        results.append((None, classify_status(status_code, body, message, _retry_after(item))))
+    return results
+
+
+def message_id(body: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Get the WhatsApp message ID from a parsed send response, if present"""
+    try:
+        return body["messages"][0]["id"]
+    except (KeyError, IndexError, TypeError):
+        return None
@@ -0,0 +1,73 @@
+"""
+WhatsApp Cloud API error classification
+"""
+
+from typing import Optional, Union
+import httpx
+import orjson
+from app.core.exceptions import (
+    WhatsAppDeliveryException,
+    WhatsAppTransientException,
+    WhatsAppPermanentException,
+)
+
+# Graph API error codes that mean "slow down" or "try again later"
+TRANSIENT_ERROR_CODES = {
+    1,       # API unknown (temporary)
+    2,       # API service (temporary)
+    4,       # Application request limit
+    17,      # User request limit
+    341,     # Application limit
+    80007,   # WhatsApp Business Account rate limit
+    130429,  # Cloud API throughput reached
+    131000,  # Something went wrong
+    131016,  # Service unavailable
+    131048,  # Spam rate limit
+    131056,  # Pair rate limit (too many messages to one number)
+    133004,  # Server temporarily unavailable
+}
+TRANSIENT_STATUS_CODES = {408, 425, 429}
+
+
+def _error_code(content: Union[bytes, str]) -> Optional[int]:
+    """Get the Graph API error code from an error response body, if present"""
+    try:
+        return int(orjson.loads(content)["error"]["code"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Get the Retry-After header in seconds, if present"""
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def classify_status(
+    status_code: int,
+    content: Union[bytes, str],
+    message: str,
+    retry_after: Optional[float] = None
+) -> WhatsAppDeliveryException:
+    """Turn an error status and body into a transient or permanent delivery exception"""
+    code = _error_code(content)
+    if (
+        status_code in TRANSIENT_STATUS_CODES
+        or status_code >= 500
+        or code in TRANSIENT_ERROR_CODES
+    ):
+        return WhatsAppTransientException(message, code=code, retry_after=retry_after)
+    return WhatsAppPermanentException(message, code=code)
+
+
+def classify_http_error(error: httpx.HTTPError) -> WhatsAppDeliveryException:
+    """Turn an httpx error into a transient or permanent delivery exception"""
+    message = f"WhatsApp API error: {str(error)}"
+    if not isinstance(error, httpx.HTTPStatusError):
+        # Timeouts, dropped connections and other transport failures
+        return WhatsAppTransientException(message)
+    
+    response = error.response
+    return classify_status(response.status_code, response.content, message, _retry_after(response))
@@ -0,0 +1,72 @@
+"""
+Long-lived HTTP clients for the WhatsApp Cloud API
+"""
+
+import asyncio
+import os
+import threading
+from functools import lru_cache
+from typing import Awaitable, TypeVar
+import httpx
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.WHATSAPP_POOL_SIZE,
+        max_keepalive_connections=settings.WHATSAPP_POOL_SIZE,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Get the process-wide blocking client (thread-safe, keep-alive pooled)"""
+    return httpx.Client(
+        http2=settings.WHATSAPP_HTTP2,
+        limits=_limits(),
+        timeout=settings.WHATSAPP_REQUEST_TIMEOUT,
+    )
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the asyncio client bound to this thread's worker loop"""
+    client = getattr(_local, "client", None)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=settings.WHATSAPP_HTTP2,
+            limits=_limits(),
+            timeout=settings.WHATSAPP_REQUEST_TIMEOUT,
+        )
+        _local.client = client
+    return client
+
+
+def run_in_worker_loop(coro: Awaitable[T]) -> T:
+    """Run a coroutine on a persistent event loop owned by the calling thread
+
+    Unlike asyncio.run, the loop survives between calls, so connections opened
+    by get_async_http_client are reused by every later send in the same
+    Celery worker process instead of paying a new TLS handshake each time.
+    """
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+        _local.client = None
+    return loop.run_until_complete(coro)
+
+
+def _reset_after_fork() -> None:
+    # Sockets and event loops must not be shared with a forked child
+    # (Celery prefork); the child lazily builds its own
+    global _local
+    get_http_client.cache_clear()
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
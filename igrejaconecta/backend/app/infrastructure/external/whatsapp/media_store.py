@@ -0,0 +1,57 @@
+"""
+WhatsApp media IDs cached in Redis
+"""
+
+import os
+from typing import Optional
+import redis
+from app.application.interfaces.services.whatsapp_media_store import IWhatsAppMediaStore
+from app.application.interfaces.services.whatsapp_service import IWhatsAppService
+from app.domain.entities.church import Church
+from app.domain.value_objects.media import Media
+from app.core.config import settings
+from app.core.exceptions import InvalidMediaException
+from app.infrastructure.cache.redis_client import get_redis
+from app.infrastructure.storage.media_files import media_path
+
+
+class RedisWhatsAppMediaStore(IWhatsAppMediaStore):
+    """Media store that uploads each file once per phone number and shares its ID through Redis
+
+    Media IDs belong to the phone number that uploaded them, so the cache is
+    keyed by phone number and content hash; every worker and every broadcast
+    sending the same file reuses the ID until shortly before WhatsApp
+    expires it.
+    """
+
+    def __init__(self, whatsapp_service: IWhatsAppService, client: Optional[redis.Redis] = None):
+        self.whatsapp_service = whatsapp_service
+        self.client = client or get_redis()
+        self.ttl = settings.WHATSAPP_MEDIA_ID_TTL_SECONDS
+
+    def _key(self, phone_id: str, sha256: str) -> str:
+        return f"whatsapp:media:{phone_id}:{sha256}"
+
+    def media_id(self, church: Church, media: Media) -> str:
+        """Get the media ID for the church's phone number, uploading the file only if it has none"""
+        key = self._key(church.whatsapp_phone_id, media.sha256)
+        cached = self.client.get(key)
+        if cached:
+            return cached
+
+        path = media_path(media.sha256)
+        if not os.path.exists(path):
+            # Stored by the API; missing here when UPLOAD_DIR is not shared with the workers
+            raise InvalidMediaException(
+                f"Media file {media.filename or media.sha256} not found in UPLOAD_DIR; "
+                "it must be storage shared by the API and the workers"
+            )
+        media_id = self.whatsapp_service.upload_media(
+            church.whatsapp_phone_id,
+            church.whatsapp_access_token,
+            path,
+            media.mime_type,
+            media.filename or media.sha256
+        )
+        self.client.set(key, media_id, ex=self.ttl)
+        return media_id
@@ -0,0 +1,72 @@
+"""
+WhatsApp Cloud API message payloads
+"""
+
+from typing import Dict, Any, List, Optional
+
+
+def build_text_payload(to: str, message: str) -> Dict[str, Any]:
+    """Build payload for a simple text message"""
+    return {
+        "messaging_product": "whatsapp",
+        "to": to,
+        "type": "text",
+        "text": {"body": message}
+    }
+
+
+def build_interactive_payload(to: str, body: str, button_text: str, url: str) -> Dict[str, Any]:
+    """Build payload for an interactive message with URL button"""
+    return {
+        "messaging_product": "whatsapp",
+        "to": to,
+        "type": "interactive",
+        "interactive": {
+            "type": "button",
+            "body": {"text": body},
+            "action": {
+                "buttons": [
+                    {
+                        "type": "url",
+                        "url": url,
+                        "title": button_text[:20]  # Max 20 characters
+                    }
+                ]
+            }
+        }
+    }
+
+
+def build_template_payload(to: str, name: str, language: str, parameters: List[str]) -> Dict[str, Any]:
+    """Build payload for an approved template message, binding body variables in order"""
+    template: Dict[str, Any] = {"name": name, "language": {"code": language}}
+    if parameters:
+        template["components"] = [{
+            "type": "body",
+            "parameters": [{"type": "text", "text": text} for text in parameters]
+        }]
+    return {
+        "messaging_product": "whatsapp",
+        "to": to,
+        "type": "template",
+        "template": template
+    }
+
+
+def build_media_payload(
+    to: str,
+    kind: str,
+    media_id: str,
+    caption: str,
+    filename: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build payload for an image, document or video message referencing uploaded media"""
+    media: Dict[str, Any] = {"id": media_id, "caption": caption}
+    if filename and kind == "document":
+        media["filename"] = filename
+    return {
+        "messaging_product": "whatsapp",
+        "to": to,
+        "type": kind,
+        kind: media
+    }
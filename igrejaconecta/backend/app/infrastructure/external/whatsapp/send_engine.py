@@ -0,0 +1,278 @@
+"""
+Concurrent WhatsApp broadcast send engine
+"""
+
+import asyncio
+from itertools import islice
+from typing import Iterable, Dict, Optional, List
+import httpx
+import orjson
+from app.application.interfaces.services.broadcast_sender import IBroadcastSender
+from app.application.interfaces.services.progress_reporter import IProgressReporter
+from app.application.interfaces.services.delivery_ledger import IDeliveryLedger
+from app.application.interfaces.services.message_retry_queue import IMessageRetryQueue
+from app.application.interfaces.services.whatsapp_media_store import IWhatsAppMediaStore
+from app.domain.entities.broadcast import Broadcast
+from app.domain.entities.church import Church
+from app.domain.entities.delivery import Delivery, DeliveryStatus
+from app.domain.value_objects.recipient import Recipient
+from app.domain.value_objects.message_renderer import MessageRenderer, compile_message
+from app.core.config import settings
+from app.core.exceptions import (
+    InvalidMessageTemplateException,
+    WhatsAppConfigurationException,
+    WhatsAppDeliveryException,
+    WhatsAppTransientException,
+)
+from app.infrastructure.external.whatsapp.prepared_message import (
+    PreparedMessage,
+    PreparedFormMessage,
+    text_placeholder,
+    build_broadcast_payload,
+)
+from app.infrastructure.external.whatsapp.errors import classify_http_error
+from app.infrastructure.external.whatsapp import batch
+from app.infrastructure.cache.rate_limiter import AsyncRateLimiter
+from app.infrastructure.external.whatsapp.http_client import (
+    get_async_http_client,
+    run_in_worker_loop,
+)
+
+
+def message_id(response: httpx.Response) -> Optional[str]:
+    """Get the WhatsApp message ID from a send response, if present"""
+    try:
+        return orjson.loads(response.content)["messages"][0]["id"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
+
+def message_renderer(message: str) -> MessageRenderer:
+    """Compile a broadcast message; ones saved before placeholders existed are sent as is"""
+    try:
+        return compile_message(message)
+    except InvalidMessageTemplateException:
+        return MessageRenderer(((message, None, ""),))
+
+
+class WhatsAppSendEngine(IBroadcastSender):
+    """Broadcast sender that keeps a bounded number of requests in flight per phone number
+
+    Tiers fast enough for it send up to WHATSAPP_BATCH_SIZE messages per
+    Graph API batch request. Transient failures are handed to the retry
+    queue, if one is given, in batches; the engine itself never waits to
+    retry. attempt is the retry number this send is (0 for the first send).
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        retry_queue: Optional[IMessageRetryQueue] = None,
+        attempt: int = 0,
+        media_store: Optional[IWhatsAppMediaStore] = None
+    ):
+        self.api_version = settings.WHATSAPP_API_VERSION
+        self.base_url = f"https://graph.facebook.com/{self.api_version}"
+        self.max_in_flight = max_in_flight
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.retry_queue = retry_queue
+        self.attempt = attempt
+        self.media_store = media_store
+
+    def in_flight_limit(self, phone_id: str) -> int:
+        """Get the concurrency limit for a WhatsApp phone number"""
+        if self.max_in_flight:
+            return self.max_in_flight
+        return settings.WHATSAPP_MAX_IN_FLIGHT_OVERRIDES.get(phone_id, settings.WHATSAPP_MAX_IN_FLIGHT)
+
+    def can_retry(self) -> bool:
+        """Check if a transient failure of this send can still be retried"""
+        return self.retry_queue is not None and self.attempt < settings.MESSAGE_RETRY_MAX_ATTEMPTS
+
+    async def media_id(self, broadcast: Broadcast, church: Church) -> Optional[str]:
+        """Get the WhatsApp media ID of the broadcast's file, once for every recipient"""
+        if not broadcast.media or broadcast.uses_whatsapp_template():
+            return None
+        if not self.media_store:
+            raise WhatsAppConfigurationException("Media broadcasts need a media store")
+        return await asyncio.to_thread(self.media_store.media_id, church, broadcast.media)
+
+    def send_broadcast(
+        self,
+        broadcast: Broadcast,
+        church: Church,
+        recipients: Iterable[Recipient],
+        progress: Optional[IProgressReporter] = None,
+        ledger: Optional[IDeliveryLedger] = None
+    ) -> Dict[str, int]:
+        """Send broadcast to recipients, blocking until every message is settled"""
+        return run_in_worker_loop(self.send_broadcast_async(broadcast, church, recipients, progress, ledger))
+
+    async def send_broadcast_async(
+        self,
+        broadcast: Broadcast,
+        church: Church,
+        recipients: Iterable[Recipient],
+        progress: Optional[IProgressReporter] = None,
+        ledger: Optional[IDeliveryLedger] = None
+    ) -> Dict[str, int]:
+        """Send broadcast to recipients with bounded concurrency"""
+        if not church.is_whatsapp_configured():
+            raise WhatsAppConfigurationException("WhatsApp not configured for this church")
+
+        phone_id = church.whatsapp_phone_id
+        tier = church.messaging_tier
+        limit = self.in_flight_limit(phone_id)
+        size = batch.batch_size(tier)
+        # Encoded once; each send only splices in the recipient's phone, plus
+        # its rendered texts for the ones with placeholders
+        texts, renderers = [], []
+        for renderer in map(message_renderer, broadcast.message_texts()):
+            if renderer.is_static():
+                texts.append(renderer.render())
+            else:
+                texts.append(text_placeholder(len(renderers)))
+                renderers.append(renderer)
+        payload = build_broadcast_payload(broadcast, texts, await self.media_id(broadcast, church))
+        if size > 1:
+            # Batch operations carry form-encoded bodies and post to the API root
+            prepared = PreparedFormMessage(f"{self.base_url}/", church.whatsapp_access_token, payload)
+        else:
+            prepared = PreparedMessage(f"{self.base_url}/{phone_id}/messages", church.whatsapp_access_token, payload)
+        counts = {"success": 0, "failed": 0, "retrying": 0, "total": 0}
+        unreported = {"success": 0, "failed": 0, "retrying": 0}
+
+        def settle(outcome: str) -> None:
+            counts[outcome] += 1
+            unreported[outcome] += 1
+            if self.attempt:
+                # Every recipient of a retry was reported as retrying before
+                unreported["retrying"] -= 1
+            if progress and unreported["success"] + unreported["failed"] >= settings.BROADCAST_PROGRESS_EVERY:
+                flush_progress()
+
+        def flush_progress() -> None:
+            if progress and any(unreported.values()):
+                progress.advance(
+                    sent=unreported["success"], failed=unreported["failed"], retrying=unreported["retrying"]
+                )
+            unreported["success"] = unreported["failed"] = unreported["retrying"] = 0
+
+        deliveries: List[Delivery] = []
+        retries: List[int] = []
+        retry_after = {"seconds": None}
+
+        async def record(delivery: Delivery, wait: Optional[float] = None) -> None:
+            if ledger:
+                deliveries.append(delivery)
+            if delivery.status == DeliveryStatus.RETRYING:
+                retries.append(delivery.contact_id)
+                if wait:
+                    retry_after["seconds"] = max(retry_after["seconds"] or 0, wait)
+            if max(len(deliveries), len(retries)) >= settings.DELIVERY_LEDGER_BATCH_SIZE:
+                await flush_outcomes()
+
+        async def flush_outcomes() -> None:
+            # Both calls block on I/O; run them off the loop so sends keep flowing
+            if retries:
+                contact_ids, delay = retries[:], retry_after["seconds"]
+                retries.clear()
+                retry_after["seconds"] = None
+                await asyncio.to_thread(
+                    self.retry_queue.schedule_retry, broadcast.id, contact_ids, self.attempt + 1, delay
+                )
+                if progress and not self.attempt:
+                    # Retries of retries were counted the first time
+                    progress.advance(retrying=len(contact_ids))
+            if ledger and deliveries:
+                flushed = deliveries[:]
+                deliveries.clear()
+                await asyncio.to_thread(ledger.record, flushed)
+
+        # Workers pull from one shared iterator, so recipients are consumed lazily
+        # and never more than `limit` requests are outstanding at once
+        pending = iter(recipients)
+        rate_limiter = self.rate_limiter or AsyncRateLimiter.from_settings()
+
+        client = self.client or get_async_http_client()
+
+        def body(recipient: Recipient) -> bytes:
+            return prepared.body(recipient.phone, *[renderer.render(recipient, church.name) for renderer in renderers])
+
+        async def succeeded(recipient: Recipient, whatsapp_message_id: Optional[str]) -> None:
+            settle("success")
+            await record(Delivery(
+                broadcast_id=broadcast.id,
+                contact_id=recipient.contact_id,
+                status=DeliveryStatus.SENT,
+                whatsapp_message_id=whatsapp_message_id
+            ))
+
+        async def failed(recipient: Recipient, failure: WhatsAppDeliveryException) -> None:
+            if isinstance(failure, WhatsAppTransientException) and self.can_retry():
+                # Not settled yet; the retry task reports the outcome
+                counts["retrying"] += 1
+                status = DeliveryStatus.RETRYING
+            else:
+                settle("failed")
+                status = DeliveryStatus.FAILED
+            await record(Delivery(
+                broadcast_id=broadcast.id,
+                contact_id=recipient.contact_id,
+                status=status,
+                error=str(failure),
+                error_code=failure.code
+            ), failure.retry_after)
+
+        async def worker() -> None:
+            for recipient in pending:
+                counts["total"] += 1
+                try:
+                    await rate_limiter.acquire(phone_id, tier)
+                    response = await client.post(prepared.url, content=body(recipient), headers=prepared.headers)
+                    response.raise_for_status()
+                    await succeeded(recipient, message_id(response))
+                except httpx.HTTPError as e:
+                    await failed(recipient, classify_http_error(e))
+
+        async def batch_worker() -> None:
+            relative_url = f"{phone_id}/messages"
+            while True:
+                recipients_batch = list(islice(pending, size))
+                if not recipients_batch:
+                    return
+                counts["total"] += len(recipients_batch)
+                try:
+                    await rate_limiter.acquire(phone_id, tier, len(recipients_batch))
+                    response = await client.post(
+                        prepared.url,
+                        content=batch.encode_batch(relative_url, [body(recipient) for recipient in recipients_batch]),
+                        headers=prepared.headers
+                    )
+                    response.raise_for_status()
+                    results = batch.parse_batch_response(response.content, len(recipients_batch))
+                except httpx.HTTPError as e:
+                    # The whole request failed, so every message in it did
+                    failure = classify_http_error(e)
+                    results = [(None, failure)] * len(recipients_batch)
+                for recipient, (result, failure) in zip(recipients_batch, results):
+                    if failure:
+                        await failed(recipient, failure)
+                    else:
+                        await succeeded(recipient, batch.message_id(result))
+
+        try:
+            await asyncio.gather(*((batch_worker if size > 1 else worker)() for _ in range(limit)))
+        finally:
+            # Whatever was sent before a failure is still recorded and reported
+            try:
+                await flush_outcomes()
+            finally:
+                flush_progress()
+                if not self.rate_limiter:
+                    await rate_limiter.close()
+
+        return counts
@@ -0,0 +1,43 @@
+"""
+Cached catalog of approved WhatsApp templates
+"""
+
+from typing import Dict, Optional, Tuple
+from app.application.interfaces.services.whatsapp_template_catalog import IWhatsAppTemplateCatalog
+from app.application.interfaces.services.whatsapp_service import IWhatsAppService
+from app.domain.entities.church import Church
+from app.domain.value_objects.whatsapp_template import WhatsAppTemplate
+from app.core.exceptions import WhatsAppConfigurationException
+from app.infrastructure.cache.memory_cache import TTLCache, whatsapp_template_cache
+
+Templates = Dict[Tuple[str, str], WhatsAppTemplate]
+
+
+class CachedWhatsAppTemplateCatalog(IWhatsAppTemplateCatalog):
+    """Template catalog that lists a business account's templates once and keeps them in memory
+
+    A template missing from the cached list is looked up again once, so one
+    approved after the list was cached is found without waiting for the TTL.
+    """
+
+    def __init__(self, whatsapp_service: IWhatsAppService, cache: Optional[TTLCache] = None):
+        self.whatsapp_service = whatsapp_service
+        self.cache = cache or whatsapp_template_cache
+
+    def find(self, church: Church, name: str, language: str) -> Optional[WhatsAppTemplate]:
+        """Get an approved template by name and language, or None if not approved"""
+        if not church.whatsapp_business_account_id:
+            raise WhatsAppConfigurationException("WhatsApp Business account ID is required for template messages")
+
+        key = (church.id, church.whatsapp_business_account_id)
+        templates = self.cache.get(key)
+        if templates is None or (name, language) not in templates:
+            templates = self._load(church)
+            self.cache.set(key, templates)
+        return templates.get((name, language))
+
+    def _load(self, church: Church) -> Templates:
+        approved = self.whatsapp_service.get_approved_templates(
+            church.whatsapp_business_account_id, church.whatsapp_access_token
+        )
+        return {(template.name, template.language): template for template in approved}
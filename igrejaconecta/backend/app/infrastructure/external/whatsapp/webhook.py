@@ -0,0 +1,45 @@
+"""
+WhatsApp Cloud API webhook payloads
+"""
+
+import hashlib
+import hmac
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from app.domain.entities.delivery import DeliveryStatus
+from app.domain.value_objects.status_event import StatusEvent
+
+# Callback statuses tracked in the delivery ledger ("sent" is already known from the API response)
+TRACKED_STATUSES = {
+    "delivered": DeliveryStatus.DELIVERED,
+    "read": DeliveryStatus.READ,
+    "failed": DeliveryStatus.FAILED,
+}
+
+
+def is_valid_signature(body: bytes, signature: Optional[str], app_secret: str) -> bool:
+    """Check the X-Hub-Signature-256 header against an HMAC-SHA256 of the raw body"""
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(app_secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature[len("sha256="):], expected)
+
+
+def parse_status_events(payload: Dict[str, Any]) -> List[StatusEvent]:
+    """Extract message status events from a webhook callback, ignoring everything else"""
+    events = []
+    for entry in payload.get("entry") or []:
+        for change in entry.get("changes") or []:
+            for status in (change.get("value") or {}).get("statuses") or []:
+                tracked = TRACKED_STATUSES.get(status.get("status"))
+                if not tracked or not status.get("id"):
+                    continue
+                error = (status.get("errors") or [{}])[0]
+                events.append(StatusEvent(
+                    whatsapp_message_id=status["id"],
+                    status=tracked,
+                    timestamp=datetime.utcfromtimestamp(int(status.get("timestamp", 0))),
+                    error_code=error.get("code"),
+                    error=error.get("title") or error.get("message")
+                ))
+    return events
@@ -2,19 +2,52 @@
 WhatsApp Cloud API client
 """
 
-import requests
-from typing import List, Dict, Any
+import re
+import httpx
+import orjson
+from typing import List, Dict, Any, Optional
 from app.application.interfaces.services.whatsapp_service import IWhatsAppService
+from app.domain.value_objects.whatsapp_template import WhatsAppTemplate
 from app.core.config import settings
-from app.core.exceptions import WhatsAppConfigurationException
+from app.core.exceptions import WhatsAppTransientException
+from app.infrastructure.external.whatsapp.prepared_message import (
+    RECIPIENT_PLACEHOLDER,
+    PreparedMessage,
+    PreparedFormMessage,
+    prepare_text_message,
+    prepare_interactive_message,
+    prepare_template_message,
+)
+from app.infrastructure.cache.rate_limiter import RateLimiter
+from app.infrastructure.external.whatsapp.http_client import get_http_client
+from app.infrastructure.external.whatsapp.errors import classify_http_error
+from app.infrastructure.external.whatsapp.payloads import build_text_payload
+from app.infrastructure.external.whatsapp import batch
+
+# Body variables of a template, as {{1}}, {{2}}, ...
+TEMPLATE_VARIABLE = re.compile(r"\{\{(\d+)\}\}")
+
+
+def template_parameter_count(components: List[Dict[str, Any]]) -> int:
+    """Count the body variables of a template from its components"""
+    for component in components:
+        if component.get("type") == "BODY":
+            return max((int(n) for n in TEMPLATE_VARIABLE.findall(component.get("text", ""))), default=0)
+    return 0
 
 
 class WhatsAppClient(IWhatsAppService):
     """WhatsApp Cloud API service implementation"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_client: Optional[httpx.Client] = None
+    ):
         self.api_version = settings.WHATSAPP_API_VERSION
         self.base_url = f"https://graph.facebook.com/{self.api_version}"
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.http = http_client or get_http_client()
     
     def send_interactive_message(
         self,
@@ -23,93 +56,180 @@ class WhatsAppClient(IWhatsAppService):
         button_text: str,
         url: str,
         phone_id: str,
-        token: str
+        token: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
         """Send interactive message with button"""
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": to,
-            "type": "interactive",
-            "interactive": {
-                "type": "button",
-                "body": {"text": body},
-                "action": {
-                    "buttons": [
-                        {
-                            "type": "url",
-                            "url": url,
-                            "title": button_text[:20]  # Max 20 characters
-                        }
-                    ]
-                }
-            }
-        }
-        
-        api_url = f"{self.base_url}/{phone_id}/messages"
-        
-        try:
-            response = requests.post(api_url, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise WhatsAppConfigurationException(f"WhatsApp API error: {str(e)}")
+        prepared = prepare_interactive_message(self.messages_url(phone_id), token, body, button_text, url)
+        return self.send_prepared(prepared, to, phone_id, tier)
     
     def send_text_message(
         self,
         to: str,
         message: str,
         phone_id: str,
-        token: str
+        token: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
         """Send simple text message"""
+        prepared = prepare_text_message(self.messages_url(phone_id), token, message)
+        return self.send_prepared(prepared, to, phone_id, tier)
+    
+    def send_template_message(
+        self,
+        to: str,
+        template_name: str,
+        language: str,
+        parameters: List[str],
+        phone_id: str,
+        token: str,
+        tier: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send approved template message"""
+        prepared = prepare_template_message(self.messages_url(phone_id), token, template_name, language, parameters)
+        return self.send_prepared(prepared, to, phone_id, tier)
+    
+    def upload_media(self, phone_id: str, token: str, path: str, mime_type: str, filename: str) -> str:
+        """Upload a media file for a phone number to send, returning its WhatsApp media ID"""
         headers = {
             "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
         }
         
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": to,
-            "type": "text",
-            "text": {"body": message}
+        api_url = f"{self.base_url}/{phone_id}/media"
+        
+        try:
+            # httpx streams the open file into the multipart body
+            with open(path, "rb") as content:
+                response = self.http.post(
+                    api_url,
+                    data={"messaging_product": "whatsapp", "type": mime_type},
+                    files={"file": (filename, content, mime_type)},
+                    headers=headers
+                )
+            response.raise_for_status()
+            return orjson.loads(response.content)["id"]
+        except httpx.HTTPError as e:
+            raise classify_http_error(e)
+    
+    def get_approved_templates(self, business_account_id: str, token: str) -> List[WhatsAppTemplate]:
+        """List templates approved for a WhatsApp Business account, following pagination"""
+        headers = {
+            "Authorization": f"Bearer {token}",
         }
         
-        api_url = f"{self.base_url}/{phone_id}/messages"
+        api_url = f"{self.base_url}/{business_account_id}/message_templates"
+        params = {"fields": "name,language,status,components", "status": "APPROVED", "limit": 100}
         
+        templates = []
         try:
-            response = requests.post(api_url, json=payload, headers=headers, timeout=30)
+            while api_url:
+                response = self.http.get(api_url, params=params, headers=headers)
+                response.raise_for_status()
+                page = orjson.loads(response.content)
+                templates.extend(
+                    WhatsAppTemplate(
+                        name=item["name"],
+                        language=item["language"],
+                        parameter_count=template_parameter_count(item.get("components", []))
+                    )
+                    for item in page.get("data", [])
+                    if item.get("status") == "APPROVED"
+                )
+                # The next page URL already carries the query
+                api_url, params = page.get("paging", {}).get("next"), None
+        except httpx.HTTPError as e:
+            raise classify_http_error(e)
+        
+        return templates
+    
+    def messages_url(self, phone_id: str) -> str:
+        """Get the messages endpoint of a WhatsApp phone number"""
+        return f"{self.base_url}/{phone_id}/messages"
+    
+    def send_prepared(
+        self,
+        prepared: PreparedMessage,
+        to: str,
+        phone_id: str,
+        tier: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send a prepared message to one recipient, rate limited by the church's messaging tier"""
+        self.rate_limiter.acquire(phone_id, tier)
+        
+        try:
+            response = self.http.post(prepared.url, content=prepared.body(to), headers=prepared.headers)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise WhatsAppConfigurationException(f"WhatsApp API error: {str(e)}")
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            raise classify_http_error(e)
     
     def send_bulk_messages(
         self,
         recipients: List[str],
         message: str,
         phone_id: str,
-        token: str
+        token: str,
+        tier: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Send bulk messages"""
+        """Send bulk messages, in Graph API batches when the tier's rate limit allows"""
         results = {
             "success": [],
             "failed": []
         }
         
+        size = batch.batch_size(tier)
+        if size > 1:
+            # Same message for everyone: encode it once, as batch operation bodies
+            prepared = PreparedFormMessage(f"{self.base_url}/", token, build_text_payload(RECIPIENT_PLACEHOLDER, message))
+            for start in range(0, len(recipients), size):
+                chunk = recipients[start:start + size]
+                for recipient, (result, error) in zip(chunk, self.send_batch(prepared, chunk, phone_id, tier)):
+                    if error:
+                        results["failed"].append({
+                            "to": recipient,
+                            "error": str(error),
+                            "retryable": isinstance(error, WhatsAppTransientException)
+                        })
+                    else:
+                        results["success"].append({"to": recipient, "result": result})
+            return results
+        
+        prepared = prepare_text_message(self.messages_url(phone_id), token, message)
+        
         for recipient in recipients:
             try:
-                result = self.send_text_message(recipient, message, phone_id, token)
+                result = self.send_prepared(prepared, recipient, phone_id, tier)
                 results["success"].append({"to": recipient, "result": result})
             except Exception as e:
-                results["failed"].append({"to": recipient, "error": str(e)})
+                results["failed"].append({
+                    "to": recipient,
+                    "error": str(e),
+                    "retryable": isinstance(e, WhatsAppTransientException)
+                })
         
         return results
     
+    def send_batch(
+        self,
+        prepared: PreparedFormMessage,
+        recipients: List[str],
+        phone_id: str,
+        tier: Optional[str] = None
+    ) -> List[batch.BatchResult]:
+        """Send a prepared message to up to 50 recipients in one Graph API batch request"""
+        self.rate_limiter.acquire(phone_id, tier, tokens=len(recipients))
+        
+        try:
+            response = self.http.post(
+                prepared.url,
+                content=batch.encode_batch(f"{phone_id}/messages", [prepared.body(to) for to in recipients]),
+                headers=prepared.headers
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return [(None, classify_http_error(e))] * len(recipients)
+        return batch.parse_batch_response(response.content, len(recipients))
+    
     def validate_credentials(self, phone_id: str, token: str) -> bool:
         """Validate WhatsApp credentials by sending a test message"""
         # Try to get phone number info as validation
@@ -120,8 +240,8 @@ class WhatsAppClient(IWhatsAppService):
         api_url = f"{self.base_url}/{phone_id}"
         
         try:
-            response = requests.get(api_url, headers=headers, timeout=10)
+            response = self.http.get(api_url, headers=headers, timeout=10)
             return response.status_code == 200
-        except requests.exceptions.RequestException:
+        except httpx.HTTPError:
             return False
 
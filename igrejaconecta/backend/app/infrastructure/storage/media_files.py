@@ -0,0 +1,40 @@
+"""
+Content-addressed storage for broadcast media
+"""
+
+import hashlib
+import os
+from typing import Tuple
+from uuid import uuid4
+from fastapi import UploadFile
+from app.core.config import settings
+from app.infrastructure.storage.upload_spool import SPOOL_CHUNK_BYTES, discard_upload
+
+
+def media_path(sha256: str) -> str:
+    """Get where the media file with this content hash is stored"""
+    return os.path.join(settings.UPLOAD_DIR, "media", sha256)
+
+
+async def store_media(file: UploadFile) -> Tuple[str, int]:
+    """Copy an upload to media storage in fixed-size chunks, returning its SHA-256 and size
+
+    Files are named by content hash, so uploading the same file again keeps
+    a single copy.
+    """
+    os.makedirs(os.path.dirname(media_path("")), exist_ok=True)
+    spool = media_path(f"{uuid4()}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(spool, "wb") as out:
+            while chunk := await file.read(SPOOL_CHUNK_BYTES):
+                digest.update(chunk)
+                size += len(chunk)
+                out.write(chunk)
+        sha256 = digest.hexdigest()
+        os.replace(spool, media_path(sha256))
+    except Exception:
+        discard_upload(spool)
+        raise
+    return sha256, size
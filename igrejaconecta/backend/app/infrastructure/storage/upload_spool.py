@@ -0,0 +1,48 @@
+"""
+Spools uploaded files to disk for background processing
+"""
+
+import asyncio
+import os
+from uuid import uuid4
+from fastapi import UploadFile
+from app.core.config import settings
+
+SPOOL_CHUNK_BYTES = 1024 * 1024
+
+
+async def spool_upload(file: UploadFile, suffix: str = ".csv") -> str:
+    """Copy an upload to UPLOAD_DIR in fixed-size chunks and return its path
+
+    Memory stays bounded by SPOOL_CHUNK_BYTES whatever the upload size.
+    Disk writes run in a thread so the event loop keeps serving requests.
+    """
+    await asyncio.to_thread(os.makedirs, settings.UPLOAD_DIR, exist_ok=True)
+    path = os.path.join(settings.UPLOAD_DIR, f"{uuid4()}{suffix}")
+    try:
+        spool = await asyncio.to_thread(open, path, "wb")
+        try:
+            while chunk := await file.read(SPOOL_CHUNK_BYTES):
+                await asyncio.to_thread(spool.write, chunk)
+        finally:
+            await asyncio.to_thread(spool.close)
+    except Exception:
+        await asyncio.to_thread(discard_upload, path)
+        raise
+    return path
+
+
+def check_upload(path: str) -> None:
+    """Fail clearly when a spooled upload is not visible to this process"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"Upload {path} not found: UPLOAD_DIR must be storage shared by the API and the workers"
+        )
+
+
+def discard_upload(path: str) -> None:
+    """Delete a spooled upload"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
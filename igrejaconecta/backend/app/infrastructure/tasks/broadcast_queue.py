@@ -0,0 +1,37 @@
+"""
+Celery implementation of the broadcast queue
+"""
+
+from typing import Optional, Dict, Any
+from datetime import datetime, timedelta
+from uuid import uuid4
+from app.core.config import settings
+from app.application.interfaces.services.broadcast_queue import IBroadcastQueue
+from app.infrastructure.cache.job_progress import JobProgressStore
+from app.infrastructure.tasks.broadcast_tasks import send_broadcast_job, send_scheduled_broadcast
+
+
+class CeleryBroadcastQueue(IBroadcastQueue):
+    """Runs broadcast sends on Celery workers and tracks them in Redis"""
+
+    def __init__(self, progress_store: Optional[JobProgressStore] = None):
+        self.progress_store = progress_store or JobProgressStore()
+
+    def enqueue_send(self, church_id: int, broadcast_id: int, resume: bool = False) -> str:
+        """Enqueue a broadcast send, or the resume of a failed one, and return the job ID"""
+        job_id = str(uuid4())
+        # Register the job before publishing so polling never sees a gap
+        self.progress_store.create(job_id, church_id=church_id, broadcast_id=broadcast_id)
+        send_broadcast_job.apply_async(args=[church_id, broadcast_id, resume], task_id=job_id)
+        return job_id
+
+    def schedule_send(self, broadcast_id: int, run_at: datetime) -> bool:
+        """Queue a scheduled broadcast to start at run_at"""
+        if run_at > datetime.utcnow() + timedelta(seconds=settings.SCHEDULER_ETA_HORIZON_SECONDS):
+            return False
+        send_scheduled_broadcast.apply_async(args=[broadcast_id], eta=run_at)
+        return True
+
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job state and sent/failed/total counters"""
+        return self.progress_store.get(job_id)
@@ -2,21 +2,31 @@
 Celery tasks for broadcast operations
 """
 
-from celery import Celery
+from typing import List, Optional
+from datetime import timedelta
+from uuid import uuid4
+from celery import Celery, chord
+from celery.signals import worker_process_init
 from app.core.config import settings
-from app.infrastructure.database.database import SessionLocal
-from app.infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
-from app.infrastructure.database.repositories.contact_repository_impl import ContactRepositoryImpl
-from app.infrastructure.database.repositories.church_repository_impl import ChurchRepositoryImpl
+from app.infrastructure.database.database import dispose_inherited_pools
+from app.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.database.delivery_ledger import SqlAlchemyDeliveryLedger
+from app.infrastructure.tasks.message_retry_queue import CeleryMessageRetryQueue
+from app.infrastructure.external.whatsapp.send_engine import WhatsAppSendEngine
 from app.infrastructure.external.whatsapp.whatsapp_client import WhatsAppClient
-from app.domain.entities.broadcast import BroadcastStatus
+from app.infrastructure.external.whatsapp.template_catalog import CachedWhatsAppTemplateCatalog
+from app.infrastructure.external.whatsapp.media_store import RedisWhatsAppMediaStore
+from app.infrastructure.cache.job_progress import JobProgressStore, JobProgressReporter
+from app.application.use_cases.broadcast.send_broadcast import SendBroadcastUseCase
+from app.core.exceptions import DomainException
 from datetime import datetime
 
 # Initialize Celery
 celery_app = Celery(
     "igrejaconecta",
     broker=settings.REDIS_URL,
-    backend=settings.REDIS_URL
+    backend=settings.REDIS_URL,
+    include=["app.infrastructure.tasks.contact_tasks"]
 )
 
 celery_app.conf.update(
@@ -25,96 +35,222 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
+    beat_schedule={
+        "dispatch-scheduled-broadcasts": {
+            "task": "app.infrastructure.tasks.broadcast_tasks.process_scheduled_broadcasts",
+            "schedule": settings.SCHEDULER_SWEEP_INTERVAL_SECONDS,
+        },
+    },
 )
 
 
-@celery_app.task
-def send_scheduled_broadcast(broadcast_id: int):
-    """Send a scheduled broadcast"""
-    db = SessionLocal()
+@worker_process_init.connect
+def _reset_database_pools(**kwargs):
+    # Prefork children must not share the parent's pooled connections
+    dispose_inherited_pools()
+
+
+def _send_use_case(
+    uow: SqlAlchemyUnitOfWork,
+    attempt: int = 0,
+    job_id: Optional[str] = None
+) -> SendBroadcastUseCase:
+    whatsapp = WhatsAppClient()
+    media_store = RedisWhatsAppMediaStore(whatsapp)
+    return SendBroadcastUseCase(
+        uow.broadcasts,
+        uow.contacts,
+        uow.churches,
+        WhatsAppSendEngine(
+            retry_queue=CeleryMessageRetryQueue(job_id), attempt=attempt, media_store=media_store
+        ),
+        SqlAlchemyDeliveryLedger(),
+        CachedWhatsAppTemplateCatalog(whatsapp),
+        media_store
+    )
+
+
+def _fan_out(
+    uow: SqlAlchemyUnitOfWork,
+    church_id: int,
+    broadcast_id: int,
+    job_id: str,
+    resume: bool = False
+) -> dict:
+    """Split the broadcast audience into chunks and send them as a chord
+
+    Every chunk is an independent task, so any idle worker can pick it up;
+    finalize_broadcast runs once, after the last chunk finishes. Chunks are
+    contact ID ranges rather than phone lists, so neither this task nor the
+    chord messages grow with the audience; each chunk streams its own range.
+    Chunks skip contacts the delivery ledger already records as sent, so a
+    resumed broadcast only costs the unsent remainder.
+    """
+    use_case = _send_use_case(uow)
+    broadcast, church = use_case.prepare(church_id, broadcast_id, resume)
+    # Publish the claim at once, so other triggers see the broadcast as sending
+    uow.commit()
+    
     try:
-        broadcast_repo = BroadcastRepositoryImpl(db)
-        contact_repo = ContactRepositoryImpl(db)
-        church_repo = ChurchRepositoryImpl(db)
-        whatsapp_service = WhatsAppClient()
+        chunks = use_case.recipient_chunks(broadcast, settings.BROADCAST_CHUNK_SIZE, resume)
+        total = sum(size for _, _, size in chunks)
         
-        # Get broadcast
-        broadcast = broadcast_repo.get_by_id(broadcast_id)
-        if not broadcast:
-            return {"error": "Broadcast not found"}
+        progress_store = JobProgressStore()
+        # A resumed job shows what earlier attempts delivered as sent; contacts
+        # that failed for good are left out, so remaining only counts the chunks
+        already_sent = uow.deliveries.count_sent(broadcast_id) if resume else 0
+        progress_store.set_total(job_id, total + already_sent)
+        progress_store.increment(job_id, sent=already_sent)
+        progress_store.set_state(job_id, "running")
         
-        # Check if can be sent
-        if not broadcast.can_be_sent():
-            return {"error": f"Cannot send broadcast with status {broadcast.status.value}"}
+        if not chunks:
+            return finalize_broadcast([], broadcast_id, job_id)
         
-        # Get church
-        church = church_repo.get_by_id(broadcast.church_id)
-        if not church or not church.is_whatsapp_configured():
-            return {"error": "WhatsApp not configured"}
+        chord(
+            send_broadcast_chunk.s(broadcast_id, first_id, last_id, size, job_id)
+            for first_id, last_id, size in chunks
+        )(finalize_broadcast.s(broadcast_id, job_id))
+    except Exception:
+        # Nothing was sent; do not leave the broadcast claimed forever
+        uow.rollback()
+        use_case.abort(broadcast)
+        uow.commit()
+        raise
+    
+    return {"chunks": len(chunks), "total": total}
+
+
+@celery_app.task(bind=True)
+def send_scheduled_broadcast(self, broadcast_id: int):
+    """Send a scheduled broadcast"""
+    job_id = self.request.id or str(uuid4())
+    with SqlAlchemyUnitOfWork() as uow:
+        broadcast = uow.broadcasts.get_by_id(broadcast_id)
+        if not broadcast:
+            return {"error": "Broadcast not found"}
         
-        # Get contacts
-        contacts = []
-        if broadcast.contact_tags:
-            contacts = contact_repo.list_by_tags(broadcast.church_id, broadcast.contact_tags)
+        JobProgressStore().create(job_id, church_id=broadcast.church_id, broadcast_id=broadcast_id)
+        try:
+            return _fan_out(uow, broadcast.church_id, broadcast_id, job_id)
+        except (DomainException, ValueError) as e:
+            JobProgressStore().set_state(job_id, "failed", error=str(e))
+            return {"error": str(e)}
+
+
+@celery_app.task(bind=True)
+def send_broadcast_job(self, church_id: int, broadcast_id: int, resume: bool = False):
+    """Send a broadcast enqueued from the API, reporting progress under the task ID"""
+    job_id = self.request.id
+    try:
+        with SqlAlchemyUnitOfWork() as uow:
+            return _fan_out(uow, church_id, broadcast_id, job_id, resume)
+    except Exception as e:
+        JobProgressStore().set_state(job_id, "failed", error=str(e))
+        raise
+
+
+# acks_late with reject_on_worker_lost redelivers a chunk whose worker died;
+# the rerun skips everything the ledger recorded before the crash
+@celery_app.task(acks_late=True, reject_on_worker_lost=True)
+def send_broadcast_chunk(broadcast_id: int, first_id: int, last_id: int, size: int, job_id: str):
+    """Send one chunk of a broadcast, streaming contacts with IDs in [first_id, last_id]"""
+    progress = JobProgressReporter(JobProgressStore(), job_id)
+    try:
+        with SqlAlchemyUnitOfWork() as uow:
+            use_case = _send_use_case(uow, job_id=job_id)
+            broadcast = uow.broadcasts.get_by_id(broadcast_id)
+            church = uow.churches.get_by_id(broadcast.church_id)
+            result = use_case.send_chunk(broadcast, church, (first_id, last_id), progress)
+            # Each finished chunk shows the send is alive, so it is not resumed under it
+            uow.broadcasts.renew_claim(broadcast_id)
+            return result
+    except Exception as e:
+        # A broken chunk must not stall the chord; recipients it did not
+        # report yet count as failed
+        unreported = max(size - progress.reported, 0)
+        progress.store.increment(job_id, failed=unreported)
+        return {"success": 0, "failed": unreported, "total": size, "error": str(e)}
+
+
+@celery_app.task
+def finalize_broadcast(chunk_results: List[dict], broadcast_id: int, job_id: str):
+    """Aggregate chunk results into the broadcast once the last chunk finishes
+
+    A chunk that broke leaves the broadcast failed, so it can be resumed for
+    the contacts it did not reach. total_sent comes from the delivery ledger,
+    which also counts what earlier attempts delivered.
+    """
+    result = {
+        "success": sum(r["success"] for r in chunk_results),
+        "failed": sum(r["failed"] for r in chunk_results),
+        "total": sum(r["total"] for r in chunk_results),
+    }
+    broken = [r["error"] for r in chunk_results if r.get("error")]
+    with SqlAlchemyUnitOfWork() as uow:
+        broadcast = uow.broadcasts.get_by_id(broadcast_id)
+        if broken:
+            broadcast.fail()
         else:
-            contacts = contact_repo.list_by_church(broadcast.church_id, limit=10000)
-        
-        # Send messages
-        success_count = 0
-        failed_count = 0
-        
-        for contact in contacts:
-            try:
-                if broadcast.link_url and broadcast.button_text:
-                    whatsapp_service.send_interactive_message(
-                        to=contact.phone.value,
-                        body=broadcast.message,
-                        button_text=broadcast.button_text,
-                        url=broadcast.link_url,
-                        phone_id=church.whatsapp_phone_id,
-                        token=church.whatsapp_access_token
-                    )
-                else:
-                    whatsapp_service.send_text_message(
-                        to=contact.phone.value,
-                        message=broadcast.message,
-                        phone_id=church.whatsapp_phone_id,
-                        token=church.whatsapp_access_token
-                    )
-                success_count += 1
-            except Exception:
-                failed_count += 1
-        
-        # Update broadcast
-        broadcast.update_total_sent(success_count)
-        broadcast.send()
-        broadcast_repo.update(broadcast)
-        
-        return {
-            "success": success_count,
-            "failed": failed_count,
-            "total": len(contacts)
-        }
-    finally:
-        db.close()
+            broadcast.send()
+        uow.broadcasts.update(broadcast)
+        uow.broadcasts.refresh_total_sent(broadcast_id)
+    
+    if broken:
+        JobProgressStore().set_state(job_id, "failed", error=f"{len(broken)} chunk(s) failed: {broken[0]}")
+    else:
+        # Completed now, or by the last retry if messages are still waiting for one
+        JobProgressStore().finish_chunks(job_id)
+    return result
+
+
+@celery_app.task(acks_late=True, reject_on_worker_lost=True)
+def retry_broadcast_messages(
+    broadcast_id: int,
+    contact_ids: List[int],
+    attempt: int,
+    job_id: Optional[str] = None
+):
+    """Send again messages of a broadcast that failed with a transient error
+
+    Scheduled by the send engine with a jittered backoff; a message still
+    failing transiently is scheduled again until MESSAGE_RETRY_MAX_ATTEMPTS,
+    then dead-lettered as failed in the delivery ledger. Outcomes are
+    reported into the progress of job_id, which completes with its last retry.
+    """
+    progress = JobProgressReporter(JobProgressStore(), job_id) if job_id else None
+    with SqlAlchemyUnitOfWork() as uow:
+        broadcast = uow.broadcasts.get_by_id(broadcast_id)
+        if not broadcast:
+            return {"error": "Broadcast not found"}
+        church = uow.churches.get_by_id(broadcast.church_id)
+        result = _send_use_case(uow, attempt, job_id).retry(broadcast, church, contact_ids, progress)
+        uow.broadcasts.refresh_total_sent(broadcast_id)
+    if progress:
+        progress.store.complete_if_settled(job_id)
+    return result
 
 
 @celery_app.task
 def process_scheduled_broadcasts():
-    """Process all scheduled broadcasts that are due"""
-    db = SessionLocal()
-    try:
-        broadcast_repo = BroadcastRepositoryImpl(db)
-        
-        # Get scheduled broadcasts due now
-        scheduled = broadcast_repo.list_scheduled(before=datetime.utcnow())
-        
-        results = []
-        for broadcast in scheduled:
-            result = send_scheduled_broadcast.delay(broadcast.id)
-            results.append({"broadcast_id": broadcast.id, "task_id": result.id})
-        
-        return {"processed": len(results), "tasks": results}
-    finally:
-        db.close()
+    """Queue scheduled broadcasts coming due that have no dispatch in flight
+
+    Reconciles what the ETA path missed: broadcasts scheduled beyond the ETA
+    horizon, and dispatches lost before they started (their lease lapsed).
+    """
+    with SqlAlchemyUnitOfWork() as uow:
+        claimed = uow.broadcasts.claim_due_scheduled(
+            datetime.utcnow(),
+            horizon=timedelta(seconds=settings.SCHEDULER_ETA_HORIZON_SECONDS),
+            lease=timedelta(seconds=settings.SCHEDULER_DISPATCH_LEASE_SECONDS),
+            limit=settings.SCHEDULER_SWEEP_BATCH_SIZE
+        )
+    
+    # Claims are committed before publishing; a crash in between only delays
+    # the send until the lease lapses and the next sweep claims it again
+    results = []
+    for broadcast_id, scheduled_at in claimed:
+        result = send_scheduled_broadcast.apply_async(args=[broadcast_id], eta=scheduled_at)
+        results.append({"broadcast_id": broadcast_id, "task_id": result.id})
+    
+    return {"processed": len(results), "tasks": results}
 
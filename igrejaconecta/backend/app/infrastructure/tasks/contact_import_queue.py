@@ -0,0 +1,32 @@
+"""
+Celery implementation of the contact import queue
+"""
+
+from typing import Optional, Dict, Any, List
+from uuid import uuid4
+from app.application.interfaces.services.contact_import_queue import IContactImportQueue
+from app.infrastructure.cache.job_progress import JobProgressStore
+from app.infrastructure.tasks.contact_tasks import import_contacts_job
+
+
+class CeleryContactImportQueue(IContactImportQueue):
+    """Runs contact imports on Celery workers and tracks them in Redis"""
+
+    def __init__(self, progress_store: Optional[JobProgressStore] = None):
+        self.progress_store = progress_store or JobProgressStore()
+
+    def enqueue_import(self, church_id: int, file_path: str) -> str:
+        """Enqueue the import of a spooled CSV file and return the job ID"""
+        job_id = str(uuid4())
+        # Register the job before publishing so polling never sees a gap
+        self.progress_store.create(job_id, church_id=church_id)
+        import_contacts_job.apply_async(args=[church_id, file_path], task_id=job_id)
+        return job_id
+
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job state and imported/duplicates/rejected counters"""
+        return self.progress_store.get(job_id)
+
+    def get_rejections(self, job_id: str) -> List[Dict[str, Any]]:
+        """Get rows rejected by the import"""
+        return self.progress_store.get_rejections(job_id)
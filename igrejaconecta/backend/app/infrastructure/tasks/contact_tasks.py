@@ -0,0 +1,29 @@
+"""
+Celery tasks for contact operations
+"""
+
+from app.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.cache.job_progress import JobProgressStore, JobImportReporter
+from app.infrastructure.storage.upload_spool import check_upload, discard_upload
+from app.infrastructure.tasks.broadcast_tasks import celery_app
+from app.application.use_cases.contact.import_contacts_csv import ImportContactsCSVUseCase
+
+
+@celery_app.task(bind=True)
+def import_contacts_job(self, church_id: int, file_path: str):
+    """Import a spooled CSV upload, reporting progress under the task ID"""
+    job_id = self.request.id
+    progress_store = JobProgressStore()
+    try:
+        progress_store.set_state(job_id, "running")
+        check_upload(file_path)
+        with SqlAlchemyUnitOfWork() as uow:
+            use_case = ImportContactsCSVUseCase(uow.contacts, uow.churches, unit_of_work=uow)
+            result = use_case.execute(church_id, file_path, JobImportReporter(progress_store, job_id))
+        progress_store.set_state(job_id, "completed")
+        return result.model_dump()
+    except Exception as e:
+        progress_store.set_state(job_id, "failed", error=str(e))
+        raise
+    finally:
+        discard_upload(file_path)
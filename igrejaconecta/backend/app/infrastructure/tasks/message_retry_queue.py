@@ -0,0 +1,49 @@
+"""
+Celery implementation of the message retry queue
+"""
+
+import random
+from typing import List, Optional
+from app.core.config import settings
+from app.application.interfaces.services.message_retry_queue import IMessageRetryQueue
+
+
+def retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Get the jittered exponential backoff before retry number attempt (1-based)
+
+    Half the delay is fixed and half random, so retries of messages that
+    failed together (a burst of 429s) spread out instead of hitting the API
+    again in lockstep.
+    """
+    ceiling = min(
+        settings.MESSAGE_RETRY_MAX_DELAY_SECONDS,
+        settings.MESSAGE_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)
+    )
+    delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+    return max(delay, retry_after or 0)
+
+
+class CeleryMessageRetryQueue(IMessageRetryQueue):
+    """Runs message retries as delayed Celery tasks
+
+    Retries report into the progress of job_id, the send job they belong to.
+    """
+
+    def __init__(self, job_id: Optional[str] = None):
+        self.job_id = job_id
+
+    def schedule_retry(
+        self,
+        broadcast_id: int,
+        contact_ids: List[int],
+        attempt: int,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """Queue another attempt for contacts of a broadcast, after a backoff for the given attempt"""
+        # Imported here because the tasks module builds this queue for its send engine
+        from app.infrastructure.tasks.broadcast_tasks import retry_broadcast_messages
+
+        retry_broadcast_messages.apply_async(
+            args=[broadcast_id, contact_ids, attempt, self.job_id],
+            countdown=retry_delay(attempt, retry_after)
+        )
@@ -0,0 +1,96 @@
+"""
+Consumer of WhatsApp status callbacks
+
+Run one or more with `python -m app.infrastructure.tasks.status_consumer`;
+they share the work through the Redis consumer group.
+"""
+
+import json
+import logging
+import os
+import socket
+import time
+from typing import List, Optional
+from app.core.config import settings
+from app.domain.value_objects.status_event import StatusEvent
+from app.application.use_cases.broadcast.apply_status_events import ApplyStatusEventsUseCase
+from app.infrastructure.cache.status_event_stream import StatusEventStream
+from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.external.whatsapp.webhook import parse_status_events
+
+logger = logging.getLogger(__name__)
+
+
+def _entry_time(entry_id: str) -> float:
+    """Get when a stream entry was added, from the milliseconds part of its ID"""
+    return int(entry_id.split("-")[0]) / 1000
+
+
+def _parse(payload: Optional[str]) -> List[StatusEvent]:
+    """Parse a stored callback body; malformed bodies yield no events"""
+    if not payload:
+        return []
+    try:
+        return parse_status_events(json.loads(payload))
+    except (ValueError, TypeError, AttributeError, KeyError):
+        logger.warning("Dropping malformed status callback")
+        return []
+
+
+class StatusEventConsumer:
+    """Applies status callbacks to the delivery ledger in batches
+
+    A batch of callbacks is one transaction: a locked read of the affected
+    deliveries, one bulk update and one counter update per broadcast, so a
+    burst after a large broadcast costs round trips per batch, not per event.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[StatusEventStream] = None,
+        session_factory=SessionLocal,
+        name: Optional[str] = None
+    ):
+        self.stream = stream or StatusEventStream()
+        self.session_factory = session_factory
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+
+    def process_batch(self) -> int:
+        """Read and apply one batch of callbacks, returning how many were read"""
+        entries = self.stream.read(self.name, settings.STATUS_CONSUMER_BATCH_SIZE, settings.STATUS_CONSUMER_BLOCK_MS)
+        if not entries:
+            return 0
+
+        events_by_entry = {entry_id: _parse(payload) for entry_id, payload in entries}
+        with SqlAlchemyUnitOfWork(self.session_factory) as uow:
+            unknown = ApplyStatusEventsUseCase(uow.deliveries).execute(
+                [event for events in events_by_entry.values() for event in events]
+            )
+
+        # Statuses of messages not recorded yet stay pending and are claimed
+        # again later, unless the callback is older than the match window
+        cutoff = time.time() - settings.STATUS_EVENT_MATCH_WINDOW_SECONDS
+        self.stream.ack([
+            entry_id
+            for entry_id, events in events_by_entry.items()
+            if _entry_time(entry_id) < cutoff
+            or not any(event.whatsapp_message_id in unknown for event in events)
+        ])
+        return len(entries)
+
+    def run(self) -> None:
+        """Consume callbacks until the process is stopped"""
+        self.stream.ensure_group()
+        while True:
+            try:
+                self.process_batch()
+            except Exception:
+                # Unacknowledged entries are claimed again; back off and keep going
+                logger.exception("Failed to apply status callbacks")
+                time.sleep(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    StatusEventConsumer().run()
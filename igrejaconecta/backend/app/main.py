@@ -3,10 +3,17 @@ IgrejaConecta - Backend API
 FastAPI application entry point
 """
 
-from fastapi import FastAPI, Request
+import hmac
+from typing import Optional
+from fastapi import FastAPI, Request, Header
+from sqlalchemy import text
 from fastapi.middleware.cors import CORSMiddleware
-from app.presentation.api.v1 import church, contacts, broadcasts, templates
+from app.presentation.api.v1 import church, contacts, broadcasts, templates, webhooks
 from app.presentation.middleware.error_handler import exception_handler
+from app.infrastructure.database.database import engine, async_engine
+from app.infrastructure.database.pool_metrics import sync_pool_metrics, async_pool_metrics
+from app.infrastructure.cache.redis_client import get_async_redis
+from app.core.config import settings
 from app.core.exceptions import (
     DomainException,
     AuthenticationException,
@@ -42,14 +49,47 @@ async def root():
     return {"message": "IgrejaConecta API", "version": "1.0.0"}
 
 
+@app.on_event("shutdown")
+async def close_database():
+    await async_engine.dispose()
+
+
+@app.on_event("shutdown")
+async def close_redis():
+    await get_async_redis().aclose()
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
 
+def can_read_pool_metrics(token: Optional[str]) -> bool:
+    """Check the X-Metrics-Token header; without HEALTH_METRICS_TOKEN set, nobody can"""
+    expected = settings.HEALTH_METRICS_TOKEN
+    return bool(expected and token and hmac.compare_digest(token, expected))
+
+
+@app.get("/health/db")
+async def database_health_check(x_metrics_token: Optional[str] = Header(None)):
+    """Database liveness; pool usage and checkout wait times only with the metrics token"""
+    if can_read_pool_metrics(x_metrics_token):
+        return {
+            "api": async_pool_metrics.snapshot(async_engine.pool),
+            "worker": sync_pool_metrics.snapshot(engine.pool),
+        }
+    try:
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        return {"database": True}
+    except Exception:
+        return {"database": False}
+
+
 # Include routers
 app.include_router(church.router, prefix="/api/v1/church", tags=["church"])
 app.include_router(contacts.router, prefix="/api/v1/contacts", tags=["contacts"])
 app.include_router(broadcasts.router, prefix="/api/v1/broadcasts", tags=["broadcasts"])
 app.include_router(templates.router, prefix="/api/v1/templates", tags=["templates"])
+app.include_router(webhooks.router, prefix="/api/v1/webhooks", tags=["webhooks"])
 
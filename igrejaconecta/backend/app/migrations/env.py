@@ -3,8 +3,6 @@ Alembic environment configuration
 """
 
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
 from alembic import context
 import os
 import sys
@@ -18,7 +16,10 @@ from app.infrastructure.database.models import (
     ContactModel,
     BroadcastModel,
     TemplateModel,
+    TagCountModel,
+    DeliveryModel,
 )
+from app.infrastructure.database.engine import create_database_engine
 from app.core.config import settings
 
 # this is the Alembic Config object, which provides
@@ -74,11 +75,9 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    # Same driver, statement timeout and connect options as the application;
+    # migrations hold a single connection, so no pool is kept
+    connectable = create_database_engine(settings, null_pool=True)
 
     with connectable.connect() as connection:
         context.configure(
@@ -2,76 +2,94 @@
 Broadcasts API endpoints
 """
 
-from fastapi import APIRouter, Depends
-from typing import List, Optional
-from sqlalchemy.orm import Session
+import asyncio
+from fastapi import APIRouter, Depends, Query, UploadFile, File
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.application.dto.broadcast_dto import (
     BroadcastCreateDTO,
+    BroadcastMediaDTO,
     BroadcastResponseDTO,
+    BroadcastPageDTO,
     BroadcastStatisticsDTO,
+    BroadcastJobDTO,
+    BroadcastProgressDTO,
 )
+from app.application.dto.pagination import encode_cursor, decode_cursor
 from app.application.use_cases.broadcast.create_broadcast import CreateBroadcastUseCase
-from app.application.use_cases.broadcast.send_broadcast import SendBroadcastUseCase
+from app.application.use_cases.broadcast.enqueue_broadcast import EnqueueBroadcastUseCase
+from app.application.use_cases.broadcast.get_broadcast_progress import GetBroadcastProgressUseCase
 from app.application.interfaces.repositories.broadcast_repository import IBroadcastRepository
 from app.application.interfaces.repositories.church_repository import IChurchRepository
-from app.application.interfaces.services.whatsapp_service import IWhatsAppService
-from app.presentation.middleware.auth_middleware import get_firebase_uid
+from app.application.interfaces.services.broadcast_queue import IBroadcastQueue
+from app.infrastructure.database.unit_of_work import AsyncSqlAlchemyUnitOfWork
+from app.infrastructure.storage.media_files import store_media, media_path
+from app.infrastructure.storage.upload_spool import discard_upload
+from app.presentation.middleware.auth_middleware import get_current_church_id
 from app.core.dependencies import (
     get_db,
+    get_unit_of_work,
     get_broadcast_repository,
     get_church_repository,
-    get_whatsapp_service,
-    get_contact_repository,
+    get_broadcast_queue,
 )
-from app.core.exceptions import ChurchNotFoundException
 from app.domain.entities.broadcast import BroadcastStatus
+from app.domain.value_objects.media import Media
+from app.core.exceptions import InvalidMediaException
 
 router = APIRouter()
 
 
-def get_current_church_id(
-    firebase_uid: str = Depends(get_firebase_uid),
-    db: Session = Depends(get_db),
-) -> int:
-    """Get current church ID from Firebase UID"""
-    church_repository = get_church_repository(db)
-    church = church_repository.get_by_firebase_uid(firebase_uid)
-    if not church:
-        raise ChurchNotFoundException("Church not found")
-    return church.id
-
-
 @router.post("/", response_model=BroadcastResponseDTO, status_code=201)
 async def create_broadcast(
     dto: BroadcastCreateDTO,
     church_id: int = Depends(get_current_church_id),
-    db: Session = Depends(get_db),
+    uow: AsyncSqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    broadcast_queue: IBroadcastQueue = Depends(get_broadcast_queue),
 ):
     """Create a new broadcast"""
-    broadcast_repository = get_broadcast_repository(db)
-    church_repository = get_church_repository(db)
-    use_case = CreateBroadcastUseCase(broadcast_repository, church_repository)
-    return use_case.execute(church_id, dto)
+    use_case = CreateBroadcastUseCase(uow.broadcasts, uow.churches, broadcast_queue, uow)
+    return await use_case.execute(church_id, dto)
+
+
+@router.post("/media", response_model=BroadcastMediaDTO, status_code=201)
+async def upload_broadcast_media(
+    file: UploadFile = File(...),
+    church_id: int = Depends(get_current_church_id),
+):
+    """Store an image, document or video to send with broadcasts"""
+    # Reject unsupported types before storing anything
+    Media.kind_of(file.content_type)
+    sha256, size = await store_media(file)
+    try:
+        media = Media.from_upload(sha256, file.content_type, file.filename, size)
+    except InvalidMediaException:
+        discard_upload(media_path(sha256))
+        raise
+    return BroadcastMediaDTO(**media.to_dict())
 
 
-@router.get("/", response_model=List[BroadcastResponseDTO])
+@router.get("/", response_model=BroadcastPageDTO)
 async def list_broadcasts(
-    skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     church_id: int = Depends(get_current_church_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    """List broadcasts"""
+    """List broadcasts, newest first, one page per cursor"""
     broadcast_repository = get_broadcast_repository(db)
     broadcast_status = BroadcastStatus(status) if status else None
-    broadcasts = broadcast_repository.list_by_church(
+    # One extra row tells whether another page follows
+    broadcasts = await broadcast_repository.list_by_church(
         church_id,
-        skip=skip,
-        limit=limit,
-        status=broadcast_status
+        limit=limit + 1,
+        status=broadcast_status,
+        after=decode_cursor(cursor, datetime, int) if cursor else None
     )
-    return [
+    page = broadcasts[:limit]
+    items = [
         BroadcastResponseDTO(
             id=b.id,
             church_id=b.church_id,
@@ -80,43 +98,82 @@ async def list_broadcasts(
             link_url=b.link_url,
             button_text=b.button_text,
             contact_tags=b.contact_tags,
+            segment=b.segment.to_dict() if b.segment else None,
             scheduled_at=b.scheduled_at,
             sent_at=b.sent_at,
             status=b.status.value,
             total_sent=b.total_sent,
+            total_delivered=b.total_delivered,
+            total_read=b.total_read,
+            total_failed=b.total_failed,
+            whatsapp_template=b.whatsapp_template,
+            whatsapp_template_language=b.whatsapp_template_language,
+            template_parameters=b.template_parameters,
+            media=b.media.to_dict() if b.media else None,
             created_at=b.created_at
         )
-        for b in broadcasts
+        for b in page
     ]
+    next_cursor = encode_cursor(page[-1].created_at, page[-1].id) if len(broadcasts) > limit else None
+    return BroadcastPageDTO(items=items, next_cursor=next_cursor)
 
 
-@router.post("/{broadcast_id}/send")
+@router.post("/{broadcast_id}/send", response_model=BroadcastJobDTO, status_code=202)
 async def send_broadcast(
     broadcast_id: int,
     church_id: int = Depends(get_current_church_id),
-    db: Session = Depends(get_db),
-    whatsapp_service: IWhatsAppService = Depends(get_whatsapp_service),
+    db: AsyncSession = Depends(get_db),
+    broadcast_queue: IBroadcastQueue = Depends(get_broadcast_queue),
+):
+    """Send broadcast immediately in a background job"""
+    broadcast_repository = get_broadcast_repository(db)
+    church_repository = get_church_repository(db)
+    use_case = EnqueueBroadcastUseCase(
+        broadcast_repository,
+        church_repository,
+        broadcast_queue
+    )
+    return await use_case.execute(church_id, broadcast_id)
+
+
+@router.post("/{broadcast_id}/resume", response_model=BroadcastJobDTO, status_code=202)
+async def resume_broadcast(
+    broadcast_id: int,
+    church_id: int = Depends(get_current_church_id),
+    db: AsyncSession = Depends(get_db),
+    broadcast_queue: IBroadcastQueue = Depends(get_broadcast_queue),
 ):
-    """Send broadcast immediately"""
+    """Resume a failed broadcast, sending only to contacts not yet delivered"""
     broadcast_repository = get_broadcast_repository(db)
     church_repository = get_church_repository(db)
-    contact_repository = get_contact_repository(db)
-    use_case = SendBroadcastUseCase(
+    use_case = EnqueueBroadcastUseCase(
         broadcast_repository,
-        contact_repository,
         church_repository,
-        whatsapp_service
+        broadcast_queue
     )
-    return use_case.execute(church_id, broadcast_id)
+    return await use_case.execute(church_id, broadcast_id, resume=True)
+
+
+@router.get("/{broadcast_id}/jobs/{job_id}", response_model=BroadcastProgressDTO)
+async def get_send_progress(
+    broadcast_id: int,
+    job_id: str,
+    church_id: int = Depends(get_current_church_id),
+    broadcast_queue: IBroadcastQueue = Depends(get_broadcast_queue),
+):
+    """Get progress of a broadcast send job"""
+    use_case = GetBroadcastProgressUseCase(broadcast_queue)
+    # The progress store is a sync Redis client; keep it off the event loop
+    return await asyncio.to_thread(use_case.execute, church_id, broadcast_id, job_id)
 
 
 @router.get("/statistics", response_model=BroadcastStatisticsDTO)
 async def get_statistics(
     church_id: int = Depends(get_current_church_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get broadcast statistics"""
     broadcast_repository = get_broadcast_repository(db)
-    stats = broadcast_repository.get_statistics(church_id)
+    stats = await broadcast_repository.get_statistics(church_id)
     return BroadcastStatisticsDTO(**stats)
 
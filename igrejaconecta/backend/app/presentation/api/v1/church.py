@@ -4,7 +4,7 @@ Church API endpoints
 
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.application.dto.church_dto import (
     ChurchCreateDTO,
     ChurchUpdateDTO,
@@ -33,7 +33,7 @@ router = APIRouter()
 async def create_church(
     dto: ChurchCreateDTO,
     firebase_uid: str = Depends(get_firebase_uid),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     firebase_service: IFirebaseService = Depends(get_firebase_service),
 ):
     """Create a new church"""
@@ -43,17 +43,17 @@ async def create_church(
     
     church_repository = get_church_repository(db)
     use_case = CreateChurchUseCase(church_repository)
-    return use_case.execute(dto)
+    return await use_case.execute(dto)
 
 
 @router.get("/me", response_model=ChurchResponseDTO)
 async def get_my_church(
     firebase_uid: str = Depends(get_firebase_uid),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get current user's church"""
     church_repository = get_church_repository(db)
-    church = church_repository.get_by_firebase_uid(firebase_uid)
+    church = await church_repository.get_by_firebase_uid(firebase_uid)
     if not church:
         raise ChurchNotFoundException("Church not found")
     return ChurchResponseDTO(
@@ -63,6 +63,7 @@ async def get_my_church(
         email=church.email,
         phone=church.phone,
         whatsapp_phone_id=church.whatsapp_phone_id,
+        messaging_tier=church.messaging_tier,
         is_active=church.is_active,
         created_at=church.created_at
     )
@@ -72,11 +73,11 @@ async def get_my_church(
 async def update_my_church(
     dto: ChurchUpdateDTO,
     firebase_uid: str = Depends(get_firebase_uid),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Update current user's church"""
     church_repository = get_church_repository(db)
-    church = church_repository.get_by_firebase_uid(firebase_uid)
+    church = await church_repository.get_by_firebase_uid(firebase_uid)
     if not church:
         raise ChurchNotFoundException("Church not found")
     
@@ -87,7 +88,7 @@ async def update_my_church(
     if dto.phone:
         church.phone = dto.phone
     
-    updated = church_repository.update(church)
+    updated = await church_repository.update(church)
     return ChurchResponseDTO(
         id=updated.id,
         name=updated.name,
@@ -95,6 +96,7 @@ async def update_my_church(
         email=updated.email,
         phone=updated.phone,
         whatsapp_phone_id=updated.whatsapp_phone_id,
+        messaging_tier=updated.messaging_tier,
         is_active=updated.is_active,
         created_at=updated.created_at
     )
@@ -104,15 +106,15 @@ async def update_my_church(
 async def configure_whatsapp(
     dto: WhatsAppConfigDTO,
     firebase_uid: str = Depends(get_firebase_uid),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     whatsapp_service: IWhatsAppService = Depends(get_whatsapp_service),
 ):
     """Configure WhatsApp Business for church"""
     church_repository = get_church_repository(db)
-    church = church_repository.get_by_firebase_uid(firebase_uid)
+    church = await church_repository.get_by_firebase_uid(firebase_uid)
     if not church:
         raise ChurchNotFoundException("Church not found")
     
     use_case = ConfigureWhatsAppUseCase(church_repository, whatsapp_service)
-    return use_case.execute(church.id, dto)
+    return await use_case.execute(church.id, dto)
 
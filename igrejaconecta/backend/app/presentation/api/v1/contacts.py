@@ -2,90 +2,172 @@
 Contacts API endpoints
 """
 
-from fastapi import APIRouter, Depends, UploadFile, File
-from typing import List
-from sqlalchemy.orm import Session
+import asyncio
+from fastapi import APIRouter, Depends, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.application.dto.contact_dto import (
     ContactCreateDTO,
     ContactUpdateDTO,
     ContactResponseDTO,
+    ContactPageDTO,
     ContactBulkCreateDTO,
+    ContactImportJobDTO,
+    ContactImportProgressDTO,
+    TagCountDTO,
+    AudienceQueryDTO,
+    AudienceSizeDTO,
 )
+from app.application.dto.pagination import encode_cursor, decode_cursor
 from app.application.use_cases.contact.create_contact import CreateContactUseCase
-from app.application.use_cases.contact.import_contacts_csv import ImportContactsCSVUseCase
+from app.application.use_cases.contact.bulk_create_contacts import BulkCreateContactsUseCase
+from app.application.use_cases.contact.enqueue_contact_import import EnqueueContactImportUseCase
+from app.application.use_cases.contact.get_contact_import_progress import GetContactImportProgressUseCase
+from app.application.use_cases.contact.get_audience_size import GetAudienceSizeUseCase
 from app.application.interfaces.repositories.contact_repository import IContactRepository
 from app.application.interfaces.repositories.church_repository import IChurchRepository
-from app.presentation.middleware.auth_middleware import get_firebase_uid
+from app.application.interfaces.services.contact_import_queue import IContactImportQueue
+from app.infrastructure.storage.upload_spool import spool_upload, discard_upload
+from app.infrastructure.database.unit_of_work import AsyncSqlAlchemyUnitOfWork
+from app.domain.entities.contact import Contact
+from app.presentation.middleware.auth_middleware import get_current_church_id
 from app.core.dependencies import (
     get_db,
     get_contact_repository,
     get_church_repository,
+    get_contact_import_queue,
 )
-from app.core.exceptions import ChurchNotFoundException
 
 router = APIRouter()
 
+EXPORT_BATCH_SIZE = 1000  # Contacts read and written per chunk of the export
 
-def get_current_church_id(
-    firebase_uid: str = Depends(get_firebase_uid),
-    db: Session = Depends(get_db),
-) -> int:
-    """Get current church ID from Firebase UID"""
-    church_repository = get_church_repository(db)
-    church = church_repository.get_by_firebase_uid(firebase_uid)
-    if not church:
-        raise ChurchNotFoundException("Church not found")
-    return church.id
+
+def _to_response(contact: Contact) -> ContactResponseDTO:
+    return ContactResponseDTO(
+        id=contact.id,
+        church_id=contact.church_id,
+        name=contact.name,
+        phone=contact.phone.value,
+        tags=contact.tags,
+        created_at=contact.created_at
+    )
 
 
 @router.post("/", response_model=ContactResponseDTO, status_code=201)
 async def create_contact(
     dto: ContactCreateDTO,
     church_id: int = Depends(get_current_church_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new contact"""
     contact_repository = get_contact_repository(db)
     church_repository = get_church_repository(db)
     use_case = CreateContactUseCase(contact_repository, church_repository)
-    return use_case.execute(church_id, dto)
+    return await use_case.execute(church_id, dto)
+
+
+@router.post("/bulk", response_model=List[ContactResponseDTO], status_code=201)
+async def bulk_create_contacts(
+    dto: ContactBulkCreateDTO,
+    church_id: int = Depends(get_current_church_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create many contacts at once, skipping phones already registered"""
+    contact_repository = get_contact_repository(db)
+    church_repository = get_church_repository(db)
+    use_case = BulkCreateContactsUseCase(contact_repository, church_repository)
+    return await use_case.execute(church_id, dto)
 
 
-@router.get("/", response_model=List[ContactResponseDTO])
+@router.get("/", response_model=ContactPageDTO)
 async def list_contacts(
-    skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    church_id: int = Depends(get_current_church_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """List contacts, one page per cursor"""
+    contact_repository = get_contact_repository(db)
+    after_id = decode_cursor(cursor, int)[0] if cursor else None
+    # One extra row tells whether another page follows
+    contacts = await contact_repository.list_by_church(church_id, limit=limit + 1, after_id=after_id)
+    page = contacts[:limit]
+    return ContactPageDTO(
+        items=[_to_response(c) for c in page],
+        next_cursor=encode_cursor(page[-1].id) if len(contacts) > limit else None
+    )
+
+
+@router.get("/tags", response_model=List[TagCountDTO])
+async def list_tag_counts(
+    church_id: int = Depends(get_current_church_id),
+    db: AsyncSession = Depends(get_db),
+):
+    """List tags with how many contacts carry each"""
+    contact_repository = get_contact_repository(db)
+    tag_counts = await contact_repository.get_tag_counts(church_id)
+    return [TagCountDTO(tag=tag, contacts=count) for tag, count in tag_counts.items()]
+
+
+@router.post("/audience", response_model=AudienceSizeDTO)
+async def get_audience_size(
+    dto: AudienceQueryDTO,
     church_id: int = Depends(get_current_church_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    """List contacts"""
+    """Count the contacts a tag segment selects"""
     contact_repository = get_contact_repository(db)
-    contacts = contact_repository.list_by_church(church_id, skip=skip, limit=limit)
-    return [
-        ContactResponseDTO(
-            id=c.id,
-            church_id=c.church_id,
-            name=c.name,
-            phone=c.phone.value,
-            tags=c.tags,
-            created_at=c.created_at
-        )
-        for c in contacts
-    ]
-
-
-@router.post("/upload", response_model=List[ContactResponseDTO])
+    use_case = GetAudienceSizeUseCase(contact_repository)
+    return await use_case.execute(church_id, dto)
+
+
+async def _export_lines(church_id: int) -> AsyncIterator[str]:
+    # The response body streams after the request session is closed,
+    # so the export reads through a unit of work of its own
+    async with AsyncSqlAlchemyUnitOfWork() as uow:
+        lines = []
+        async for contact in uow.contacts.iter_by_church(church_id, batch_size=EXPORT_BATCH_SIZE):
+            lines.append(_to_response(contact).model_dump_json())
+            if len(lines) == EXPORT_BATCH_SIZE:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+
+@router.get("/export")
+async def export_contacts(church_id: int = Depends(get_current_church_id)):
+    """Export every contact as newline-delimited JSON"""
+    return StreamingResponse(_export_lines(church_id), media_type="application/x-ndjson")
+
+
+@router.post("/upload", response_model=ContactImportJobDTO, status_code=202)
 async def upload_contacts_csv(
     file: UploadFile = File(...),
     church_id: int = Depends(get_current_church_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    import_queue: IContactImportQueue = Depends(get_contact_import_queue),
 ):
-    """Import contacts from CSV file"""
-    content = await file.read()
-    csv_content = content.decode('utf-8')
+    """Import contacts from CSV file in a background job"""
+    file_path = await spool_upload(file)
     
-    contact_repository = get_contact_repository(db)
     church_repository = get_church_repository(db)
-    use_case = ImportContactsCSVUseCase(contact_repository, church_repository)
-    return use_case.execute(church_id, csv_content)
+    use_case = EnqueueContactImportUseCase(church_repository, import_queue)
+    try:
+        return await use_case.execute(church_id, file_path)
+    except Exception:
+        await asyncio.to_thread(discard_upload, file_path)
+        raise
 
+
+@router.get("/imports/{job_id}", response_model=ContactImportProgressDTO)
+async def get_import_progress(
+    job_id: str,
+    church_id: int = Depends(get_current_church_id),
+    import_queue: IContactImportQueue = Depends(get_contact_import_queue),
+):
+    """Get progress and rejected rows of a contact import job"""
+    use_case = GetContactImportProgressUseCase(import_queue)
+    return await asyncio.to_thread(use_case.execute, church_id, job_id)
@@ -0,0 +1,37 @@
+"""
+WhatsApp webhook endpoints
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+from app.application.interfaces.services.status_event_publisher import IStatusEventPublisher
+from app.presentation.middleware.webhook_signature import verify_whatsapp_signature, verify_subscription
+from app.core.dependencies import get_status_event_publisher
+
+router = APIRouter()
+
+
+@router.get("/whatsapp", response_class=PlainTextResponse)
+async def verify_webhook(
+    mode: Optional[str] = Query(None, alias="hub.mode"),
+    token: Optional[str] = Query(None, alias="hub.verify_token"),
+    challenge: str = Query("", alias="hub.challenge"),
+):
+    """Answer the subscription handshake from the Meta app dashboard"""
+    verify_subscription(mode, token)
+    return challenge
+
+
+@router.post("/whatsapp")
+async def receive_webhook(
+    body: bytes = Depends(verify_whatsapp_signature),
+    publisher: IStatusEventPublisher = Depends(get_status_event_publisher),
+):
+    """Acknowledge a status callback at once; the status consumer applies it later
+
+    Meta retries callbacks that are not answered quickly, so nothing here
+    touches the database: the body is appended to a Redis stream as is.
+    """
+    await publisher.publish(body.decode())
+    return {"status": "accepted"}
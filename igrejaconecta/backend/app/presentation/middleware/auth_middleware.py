@@ -5,9 +5,11 @@ Firebase authentication middleware
 from typing import Optional
 from fastapi import HTTPException, Security, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.application.interfaces.services.firebase_service import IFirebaseService
-from app.core.dependencies import get_firebase_service
-from app.core.exceptions import AuthenticationException
+from app.core.dependencies import get_firebase_service, get_db, get_church_repository
+from app.core.exceptions import AuthenticationException, ChurchNotFoundException
+from app.infrastructure.cache.memory_cache import church_id_cache
 
 security = HTTPBearer()
 
@@ -37,3 +39,19 @@ async def get_firebase_uid(
     user = await get_current_user(credentials, firebase_service)
     return user.get('uid')
 
+
+async def get_current_church_id(
+    firebase_uid: str = Depends(get_firebase_uid),
+    db: AsyncSession = Depends(get_db),
+) -> int:
+    """Get current church ID from Firebase UID"""
+    church_id = church_id_cache.get(firebase_uid)
+    if church_id is not None:
+        return church_id
+    
+    church_repository = get_church_repository(db)
+    church = await church_repository.get_by_firebase_uid(firebase_uid)
+    if not church:
+        raise ChurchNotFoundException("Church not found")
+    church_id_cache.set(firebase_uid, church.id)
+    return church.id
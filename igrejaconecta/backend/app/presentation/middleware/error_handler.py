@@ -10,6 +10,7 @@ from app.core.exceptions import (
     ContactNotFoundException,
     BroadcastNotFoundException,
     TemplateNotFoundException,
+    JobNotFoundException,
     AuthenticationException,
     AuthorizationException,
     RepositoryException,
@@ -46,6 +47,12 @@ async def exception_handler(request: Request, exc: Exception):
             content={"detail": str(exc)}
         )
     
+    if isinstance(exc, JobNotFoundException):
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": str(exc)}
+        )
+    
     # Authentication/Authorization
     if isinstance(exc, AuthenticationException):
         return JSONResponse(
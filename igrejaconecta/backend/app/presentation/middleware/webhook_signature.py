@@ -0,0 +1,32 @@
+"""
+WhatsApp webhook signature verification
+"""
+
+from typing import Optional
+from fastapi import Request, Header
+from app.core.config import settings
+from app.core.exceptions import AuthenticationException, AuthorizationException
+from app.infrastructure.external.whatsapp.webhook import is_valid_signature
+
+
+async def verify_whatsapp_signature(
+    request: Request,
+    x_hub_signature_256: Optional[str] = Header(None)
+) -> bytes:
+    """Get the raw callback body, rejecting it unless Meta signed it with our app secret"""
+    if not settings.WHATSAPP_APP_SECRET:
+        raise AuthorizationException("WhatsApp webhook app secret not configured")
+    body = await request.body()
+    if not is_valid_signature(body, x_hub_signature_256, settings.WHATSAPP_APP_SECRET):
+        raise AuthenticationException("Invalid webhook signature")
+    return body
+
+
+def verify_subscription(mode: Optional[str], token: Optional[str]) -> None:
+    """Check a webhook subscription request against the configured verify token"""
+    if (
+        mode != "subscribe"
+        or not settings.WHATSAPP_WEBHOOK_VERIFY_TOKEN
+        or token != settings.WHATSAPP_WEBHOOK_VERIFY_TOKEN
+    ):
+        raise AuthorizationException("Invalid webhook verify token")
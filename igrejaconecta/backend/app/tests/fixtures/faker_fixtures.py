@@ -24,7 +24,9 @@ def fake_church(**kwargs) -> Church:
         whatsapp_phone_id=kwargs.get('whatsapp_phone_id', None),
         whatsapp_access_token=kwargs.get('whatsapp_access_token', None),
         created_at=kwargs.get('created_at', datetime.utcnow()),
-        is_active=kwargs.get('is_active', True)
+        is_active=kwargs.get('is_active', True),
+        messaging_tier=kwargs.get('messaging_tier', None),
+        whatsapp_business_account_id=kwargs.get('whatsapp_business_account_id', None)
     )
 
 
@@ -54,7 +56,12 @@ def fake_broadcast(church_id: int, **kwargs) -> Broadcast:
         sent_at=kwargs.get('sent_at', None),
         status=kwargs.get('status', BroadcastStatus.PENDING),
         total_sent=kwargs.get('total_sent', 0),
-        created_at=kwargs.get('created_at', datetime.utcnow())
+        created_at=kwargs.get('created_at', datetime.utcnow()),
+        whatsapp_template=kwargs.get('whatsapp_template', None),
+        whatsapp_template_language=kwargs.get('whatsapp_template_language', None),
+        template_parameters=kwargs.get('template_parameters', []),
+        media=kwargs.get('media', None),
+        claimed_at=kwargs.get('claimed_at', None)
     )
 
 
@@ -0,0 +1,14 @@
+"""
+In-memory fakes for infrastructure services
+"""
+
+
+class FakeRateLimiter:
+    """In-memory stand-in for the Redis token bucket that never waits"""
+    
+    def __init__(self):
+        self.acquired = []
+    
+    async def acquire(self, phone_id, tier=None, tokens=1):
+        self.acquired.extend([(phone_id, tier)] * tokens)
+        return 0.0
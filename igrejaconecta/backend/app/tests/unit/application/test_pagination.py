@@ -0,0 +1,24 @@
+"""
+Unit tests for keyset pagination cursors
+"""
+
+import pytest
+from datetime import datetime
+from app.application.dto.pagination import encode_cursor, decode_cursor
+from app.core.exceptions import InvalidCursorException
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 250000)
+    
+    cursor = encode_cursor(created_at, 42)
+    
+    assert decode_cursor(cursor, datetime, int) == (created_at, 42)
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(InvalidCursorException):
+        decode_cursor("not-a-cursor", int)
+    
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(encode_cursor(42), datetime, int)
@@ -0,0 +1,111 @@
+"""
+Unit tests for background broadcast jobs: enqueueing, progress and scheduling
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, AsyncMock
+from sqlalchemy.dialects import postgresql
+from app.application.use_cases.broadcast.enqueue_broadcast import EnqueueBroadcastUseCase
+from app.application.use_cases.broadcast.get_broadcast_progress import GetBroadcastProgressUseCase
+from app.application.use_cases.broadcast.create_broadcast import CreateBroadcastUseCase
+from app.application.dto.broadcast_dto import BroadcastCreateDTO
+from app.domain.entities.broadcast import BroadcastStatus
+from app.infrastructure.database.repositories.broadcast_repository_impl import BroadcastModelMapper
+from app.core.exceptions import BroadcastNotFoundException, JobNotFoundException
+from app.tests.fixtures.faker_fixtures import fake_church, fake_broadcast
+
+
+@pytest.mark.asyncio
+async def test_enqueue_broadcast_returns_job():
+    """Test that a valid broadcast is handed to the queue"""
+    broadcast_repo = AsyncMock()
+    broadcast_repo.get_by_id.return_value = fake_broadcast(church_id=1, id=10)
+    church_repo = AsyncMock()
+    church_repo.get_by_id.return_value = fake_church(
+        id=1, whatsapp_phone_id="123", whatsapp_access_token="token"
+    )
+    queue = Mock()
+    queue.enqueue_send.return_value = "job-1"
+    
+    result = await EnqueueBroadcastUseCase(broadcast_repo, church_repo, queue).execute(1, 10)
+    
+    assert result.job_id == "job-1"
+    assert result.state == "queued"
+    queue.enqueue_send.assert_called_once_with(1, 10, False)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_broadcast_of_other_church():
+    """Test that broadcasts from another church are not enqueued"""
+    broadcast_repo = AsyncMock()
+    broadcast_repo.get_by_id.return_value = fake_broadcast(church_id=2, id=10)
+    queue = Mock()
+    
+    with pytest.raises(BroadcastNotFoundException):
+        await EnqueueBroadcastUseCase(broadcast_repo, AsyncMock(), queue).execute(1, 10)
+    queue.enqueue_send.assert_not_called()
+
+
+def test_get_progress_reports_remaining():
+    """Test progress counters of a running job"""
+    queue = Mock()
+    queue.get_progress.return_value = {
+        "state": "running", "church_id": "1", "broadcast_id": "10",
+        "total": 100, "sent": 40, "failed": 5,
+    }
+    
+    result = GetBroadcastProgressUseCase(queue).execute(1, 10, "job-1")
+    
+    assert result.remaining == 55
+    assert result.sent == 40
+
+
+def test_get_progress_of_other_church():
+    """Test that jobs from another church are hidden"""
+    queue = Mock()
+    queue.get_progress.return_value = {
+        "state": "running", "church_id": "2", "broadcast_id": "10",
+        "total": 1, "sent": 0, "failed": 0,
+    }
+    
+    with pytest.raises(JobNotFoundException):
+        GetBroadcastProgressUseCase(queue).execute(1, 10, "job-1")
+
+
+@pytest.mark.asyncio
+async def test_create_scheduled_broadcast_queues_eta_dispatch():
+    """Test that a broadcast scheduled within the horizon is queued at creation"""
+    scheduled_at = datetime.utcnow() + timedelta(minutes=10)
+    broadcast_repo = AsyncMock()
+    broadcast_repo.create.return_value = fake_broadcast(
+        church_id=1, id=10, scheduled_at=scheduled_at, status=BroadcastStatus.PENDING
+    )
+    church_repo = AsyncMock()
+    church_repo.get_by_id.return_value = fake_church(id=1)
+    events = []
+    uow = AsyncMock()
+    uow.commit.side_effect = lambda: events.append("commit")
+    queue = Mock()
+    queue.schedule_send.side_effect = lambda *args: events.append("schedule_send") or True
+    dto = BroadcastCreateDTO(message="Culto às 19h", scheduled_at=scheduled_at)
+    
+    await CreateBroadcastUseCase(broadcast_repo, church_repo, queue, uow).execute(1, dto)
+    
+    # The task must not run before the broadcast is committed
+    assert events == ["commit", "schedule_send"]
+    queue.schedule_send.assert_called_once_with(10, scheduled_at)
+    broadcast_repo.mark_dispatched.assert_awaited_once_with(10, scheduled_at)
+
+
+def test_sweep_claims_rows_with_skip_locked():
+    """Test that the reconciliation sweep claims due rows without blocking other sweeps"""
+    statement = BroadcastModelMapper()._claim_due_statement(
+        datetime(2024, 1, 1), timedelta(minutes=30), timedelta(minutes=10), limit=500
+    )
+    
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert sql.startswith("UPDATE broadcasts SET dispatched_at")
+    assert "RETURNING broadcasts.id, broadcasts.scheduled_at" in sql
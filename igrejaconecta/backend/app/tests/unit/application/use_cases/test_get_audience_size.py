@@ -0,0 +1,31 @@
+"""
+Unit tests for GetAudienceSizeUseCase
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from app.application.use_cases.contact.get_audience_size import GetAudienceSizeUseCase
+from app.application.dto.contact_dto import AudienceQueryDTO
+
+
+@pytest.mark.asyncio
+async def test_single_tag_is_read_from_tag_counts():
+    contact_repo = AsyncMock()
+    contact_repo.get_tag_counts.return_value = {"jovens": 120}
+    
+    result = await GetAudienceSizeUseCase(contact_repo).execute(1, AudienceQueryDTO(segment={"tag": "jovens"}))
+    
+    assert result.contacts == 120
+    contact_repo.count_recipients.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_expressions_are_counted_in_the_database():
+    contact_repo = AsyncMock()
+    contact_repo.count_recipients.return_value = 45
+    dto = AudienceQueryDTO(segment={"and": [{"tag": "jovens"}, {"not": {"tag": "visitante"}}]})
+    
+    result = await GetAudienceSizeUseCase(contact_repo).execute(1, dto)
+    
+    assert result.contacts == 45
+    assert contact_repo.count_recipients.await_args.args[1].op == "and"
@@ -0,0 +1,82 @@
+"""
+Unit tests for contact import use cases
+"""
+
+import pytest
+from io import StringIO
+from unittest.mock import Mock
+from app.application.use_cases.contact.import_contacts_csv import ImportContactsCSVUseCase
+from app.application.use_cases.contact.get_contact_import_progress import GetContactImportProgressUseCase
+from app.core.exceptions import JobNotFoundException
+from app.tests.fixtures.faker_fixtures import fake_church
+
+
+CSV = """phone,name,tags
+(11) 99999-0001,Maria,"membro, líder"
+11999990001,Maria Duplicada,
+11999990002,,jovens
+123,Inválido,
+11999990003,João,
+"""
+
+
+def _bulk_create(contacts, skip_duplicates):
+    for index, contact in enumerate(contacts, start=1):
+        contact.id = index
+    return contacts
+
+
+def test_import_normalizes_and_deduplicates():
+    """Test that phones are normalized and duplicates resolved in batches"""
+    church_repo = Mock()
+    church_repo.get_by_id.return_value = fake_church(id=1)
+    contact_repo = Mock()
+    contact_repo.get_existing_phones.return_value = {"11999990003"}
+    contact_repo.bulk_create.side_effect = _bulk_create
+    reporter = Mock()
+    
+    result = ImportContactsCSVUseCase(contact_repo, church_repo).execute(1, StringIO(CSV), reporter)
+    
+    assert (result.imported, result.duplicates, result.rejected) == (2, 1, 2)
+    contact_repo.get_existing_phones.assert_called_once_with(
+        1, ["11999990001", "11999990002", "11999990003"]
+    )
+    contact_repo.get_by_phone.assert_not_called()
+    inserted = contact_repo.bulk_create.call_args.args[0]
+    assert [c.phone.value for c in inserted] == ["11999990001", "11999990002"]
+    assert inserted[0].name == "Maria"
+    assert inserted[0].tags == ["membro", "líder"]
+    assert inserted[1].name is None
+    reporter.reject.assert_called_once_with([
+        {"row": 3, "phone": "11999990001", "reason": "duplicate phone in file"},
+        {"row": 5, "phone": "123", "reason": "invalid phone"},
+    ])
+    reporter.advance.assert_called_once_with(imported=2, duplicates=1, rejected=2)
+
+
+def test_import_reads_in_chunks(monkeypatch):
+    """Test that the file is processed one chunk at a time"""
+    monkeypatch.setattr(
+        "app.application.use_cases.contact.import_contacts_csv.settings.CONTACT_IMPORT_BATCH_SIZE", 2
+    )
+    church_repo = Mock()
+    church_repo.get_by_id.return_value = fake_church(id=1)
+    contact_repo = Mock()
+    contact_repo.get_existing_phones.return_value = set()
+    contact_repo.bulk_create.side_effect = _bulk_create
+    
+    result = ImportContactsCSVUseCase(contact_repo, church_repo).execute(1, StringIO(CSV))
+    
+    assert contact_repo.get_existing_phones.call_count == 3
+    assert result.imported + result.duplicates + result.rejected == 5
+
+
+def test_import_progress_of_other_church():
+    """Test that import jobs from another church are hidden"""
+    queue = Mock()
+    queue.get_progress.return_value = {
+        "state": "running", "church_id": "2", "imported": 0, "duplicates": 0, "rejected": 0,
+    }
+    
+    with pytest.raises(JobNotFoundException):
+        GetContactImportProgressUseCase(queue).execute(1, "job-1")
@@ -0,0 +1,206 @@
+"""
+Unit tests for SendBroadcastUseCase
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from sqlalchemy.dialects import postgresql
+from app.application.use_cases.broadcast.send_broadcast import SendBroadcastUseCase
+from app.domain.entities.broadcast import BroadcastStatus
+from app.domain.value_objects.segment import Segment
+from app.domain.value_objects.recipient import Recipient
+from app.domain.value_objects.whatsapp_template import WhatsAppTemplate
+from app.core.exceptions import InvalidMessageTemplateException
+from app.infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
+from app.tests.fixtures.faker_fixtures import fake_church, fake_broadcast
+
+
+def test_send_broadcast_streams_recipients():
+    """Test that recipients are streamed from the repository without a cap"""
+    broadcast_repo = Mock()
+    broadcast = fake_broadcast(church_id=1, id=10, contact_tags=[])
+    broadcast_repo.get_by_id.return_value = broadcast
+    broadcast_repo.claim_for_sending.return_value = broadcast
+    church_repo = Mock()
+    church_repo.get_by_id.return_value = fake_church(
+        id=1, whatsapp_phone_id="123", whatsapp_access_token="token"
+    )
+    contact_repo = Mock()
+    contact_repo.count_recipients.return_value = 20000
+    contact_repo.iter_recipients.return_value = iter([Recipient(1, "5511999990000")])
+    sender = Mock()
+    sender.send_broadcast.return_value = {"success": 1, "failed": 0, "total": 1}
+    progress = Mock()
+    
+    use_case = SendBroadcastUseCase(broadcast_repo, contact_repo, church_repo, sender)
+    result = use_case.execute(1, 10, progress)
+    
+    assert result["success"] == 1
+    progress.set_total.assert_called_once_with(20000)
+    contact_repo.iter_recipients.assert_called_once_with(
+        1, Segment.everyone(), id_range=None, skip_settled_for=None
+    )
+    contact_repo.list_by_church.assert_not_called()
+    recipients = sender.send_broadcast.call_args.args[2]
+    assert list(recipients) == [Recipient(1, "5511999990000")]
+
+
+def test_second_trigger_loses_the_claim():
+    """Test that a broadcast another trigger already claimed is not sent again"""
+    broadcast_repo = Mock()
+    broadcast_repo.get_by_id.return_value = fake_broadcast(church_id=1, id=10)
+    broadcast_repo.claim_for_sending.return_value = None
+    church_repo = Mock()
+    church_repo.get_by_id.return_value = fake_church(
+        id=1, whatsapp_phone_id="123", whatsapp_access_token="token"
+    )
+    sender = Mock()
+    
+    use_case = SendBroadcastUseCase(broadcast_repo, Mock(), church_repo, sender)
+    with pytest.raises(ValueError):
+        use_case.execute(1, 10)
+    
+    sender.send_broadcast.assert_not_called()
+    broadcast_repo.update.assert_not_called()
+
+
+def test_claim_is_a_conditional_update():
+    """Test that claiming flips pending to sending in one UPDATE ... RETURNING"""
+    db = Mock()
+    db.execute.return_value.scalar_one_or_none.return_value = None
+    
+    assert BroadcastRepositoryImpl(db).claim_for_sending(10) is None
+    
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE broadcasts SET claimed_at=%(claimed_at)s, status=%(status)s")
+    assert "broadcasts.status = " in sql and "RETURNING" in sql
+
+
+def test_resume_claim_takes_over_an_expired_lease():
+    """Test that resuming also claims a broadcast left sending whose lease lapsed"""
+    db = Mock()
+    db.execute.return_value.scalar_one_or_none.return_value = None
+    
+    BroadcastRepositoryImpl(db).claim_for_sending(10, resume=True, lease=timedelta(minutes=30))
+    
+    statement = db.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "broadcasts.status = %(status_1)s OR broadcasts.status = %(status_2)s AND broadcasts.claimed_at < " in sql
+    params = statement.compile().params
+    assert (params["status_1"], params["status_2"]) == ("failed", "sending")
+
+
+def test_resume_claims_a_failed_broadcast_and_skips_delivered():
+    """Test that resuming sends only to contacts the ledger has not recorded as sent"""
+    broadcast = fake_broadcast(church_id=1, id=10, status=BroadcastStatus.FAILED, total_sent=3000)
+    broadcast_repo = Mock()
+    broadcast_repo.get_by_id.return_value = broadcast
+    broadcast_repo.claim_for_sending.return_value = broadcast
+    church_repo = Mock()
+    church_repo.get_by_id.return_value = fake_church(
+        id=1, whatsapp_phone_id="123", whatsapp_access_token="token"
+    )
+    contact_repo = Mock()
+    sender = Mock()
+    sender.send_broadcast.return_value = {"success": 2000, "failed": 0, "total": 2000}
+    ledger = Mock()
+    
+    use_case = SendBroadcastUseCase(broadcast_repo, contact_repo, church_repo, sender, ledger)
+    use_case.execute(1, 10, resume=True)
+    
+    broadcast_repo.claim_for_sending.assert_called_once_with(10, resume=True, lease=timedelta(minutes=30))
+    assert contact_repo.iter_recipients.call_args.kwargs["skip_settled_for"] == 10
+    assert sender.send_broadcast.call_args.args[4] is ledger
+    assert broadcast.total_sent == 5000
+
+
+def test_resume_after_a_crash_sends_only_the_remainder():
+    """Test that a broadcast whose workers died mid-send is resumed for the contacts they did not reach"""
+    broadcast = fake_broadcast(
+        church_id=1, id=10, status=BroadcastStatus.SENDING, claimed_at=datetime.utcnow() - timedelta(hours=1)
+    )
+    audience = [Recipient(i, f"551190000000{i}") for i in range(1, 6)]
+    ledger = set()
+    crashes = [2]  # The first send dies after two messages
+    
+    def iter_recipients(church_id, segment, id_range=None, skip_settled_for=None):
+        return (r for r in audience if skip_settled_for is None or r.contact_id not in ledger)
+    
+    def send_broadcast(broadcast, church, recipients, progress, delivery_ledger):
+        sent = []
+        for recipient in recipients:
+            if crashes and len(sent) == crashes[0]:
+                crashes.pop()
+                raise SystemExit("worker killed")
+            ledger.add(recipient.contact_id)
+            sent.append(recipient.contact_id)
+        return {"success": len(sent), "failed": 0, "total": len(sent), "sent": sent}
+    
+    broadcast_repo = Mock()
+    broadcast_repo.get_by_id.return_value = broadcast
+    broadcast_repo.claim_for_sending.return_value = broadcast
+    church_repo = Mock()
+    church_repo.get_by_id.return_value = fake_church(id=1, whatsapp_phone_id="123", whatsapp_access_token="token")
+    contact_repo = Mock()
+    contact_repo.iter_recipients.side_effect = iter_recipients
+    sender = Mock()
+    sender.send_broadcast.side_effect = send_broadcast
+    use_case = SendBroadcastUseCase(broadcast_repo, contact_repo, church_repo, sender, Mock())
+    
+    with pytest.raises(SystemExit):
+        sender.send_broadcast(broadcast, None, iter_recipients(1, None), None, None)
+    result = use_case.execute(1, 10, resume=True)
+    
+    assert result["sent"] == [3, 4, 5]
+    assert ledger == {1, 2, 3, 4, 5}
+    assert broadcast.status == BroadcastStatus.SENT
+
+
+def test_broadcast_with_a_live_lease_cannot_be_resumed():
+    """Test that a send still renewing its lease is not resumed under its workers"""
+    broadcast_repo = Mock()
+    broadcast_repo.get_by_id.return_value = fake_broadcast(
+        church_id=1, id=10, status=BroadcastStatus.SENDING, claimed_at=datetime.utcnow() - timedelta(minutes=1)
+    )
+    
+    use_case = SendBroadcastUseCase(broadcast_repo, Mock(), Mock(), Mock())
+    with pytest.raises(ValueError):
+        use_case.execute(1, 10, resume=True)
+    
+    broadcast_repo.claim_for_sending.assert_not_called()
+
+
+def test_pending_broadcast_cannot_be_resumed():
+    """Test that resume only applies to failed broadcasts"""
+    broadcast_repo = Mock()
+    broadcast_repo.get_by_id.return_value = fake_broadcast(church_id=1, id=10, status=BroadcastStatus.PENDING)
+    
+    use_case = SendBroadcastUseCase(broadcast_repo, Mock(), Mock(), Mock())
+    with pytest.raises(ValueError):
+        use_case.execute(1, 10, resume=True)
+    
+    broadcast_repo.claim_for_sending.assert_not_called()
+
+
+def test_template_parameters_are_checked_before_claiming():
+    """Test that a template broadcast whose parameters do not fit the approved template is never claimed"""
+    broadcast_repo = Mock()
+    broadcast_repo.get_by_id.return_value = fake_broadcast(
+        church_id=1,
+        id=10,
+        whatsapp_template="aviso_culto",
+        whatsapp_template_language="pt_BR",
+        template_parameters=["{nome}"]
+    )
+    church_repo = Mock()
+    church_repo.get_by_id.return_value = fake_church(id=1, whatsapp_phone_id="123", whatsapp_access_token="token")
+    catalog = Mock()
+    catalog.find.return_value = WhatsAppTemplate("aviso_culto", "pt_BR", parameter_count=2)
+    
+    use_case = SendBroadcastUseCase(broadcast_repo, Mock(), church_repo, Mock(), template_catalog=catalog)
+    with pytest.raises(InvalidMessageTemplateException):
+        use_case.prepare(1, 10)
+    
+    catalog.find.assert_called_once_with(church_repo.get_by_id.return_value, "aviso_culto", "pt_BR")
+    broadcast_repo.claim_for_sending.assert_not_called()
@@ -0,0 +1,33 @@
+"""
+Unit tests for message placeholders
+"""
+
+import pytest
+from app.domain.value_objects.message_renderer import compile_message
+from app.domain.value_objects.recipient import Recipient
+from app.core.exceptions import InvalidMessageTemplateException
+
+
+def test_render_fills_placeholders_per_recipient():
+    """Test that contact and church values replace placeholders, with fallbacks"""
+    renderer = compile_message("Olá {primeiro_nome:irmão}! A {igreja} te espera ({tags}) {{sábado}}")
+    
+    ana = Recipient(1, "5511900000001", name="Ana Maria", tags=("jovens", "coral"))
+    anonymous = Recipient(2, "5511900000002")
+    
+    assert renderer.render(ana, "Igreja Central") == "Olá Ana! A Igreja Central te espera (jovens, coral) {sábado}"
+    assert renderer.render(anonymous, "Igreja Central") == "Olá irmão! A Igreja Central te espera () {sábado}"
+    assert not renderer.is_static()
+
+
+def test_compile_is_cached_by_content():
+    """Test that the same message text compiles once"""
+    assert compile_message("Bom dia, {nome}") is compile_message("Bom dia, " + "{nome}")
+    assert compile_message("Sem variáveis").is_static()
+
+
+@pytest.mark.parametrize("message", ["Olá {apelido}", "Olá {}", "Olá {nome!r}", "Chave aberta {"])
+def test_invalid_placeholders_are_rejected(message):
+    """Test that unknown or malformed placeholders fail at compile time"""
+    with pytest.raises(InvalidMessageTemplateException):
+        compile_message(message)
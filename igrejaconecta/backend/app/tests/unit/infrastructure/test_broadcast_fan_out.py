@@ -0,0 +1,148 @@
+"""
+Unit tests for splitting broadcasts into chunk tasks and finalizing them
+"""
+
+import fakeredis
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from app.application.use_cases.broadcast.send_broadcast import SendBroadcastUseCase
+from app.domain.entities.broadcast import BroadcastStatus
+from app.infrastructure.cache.job_progress import JobProgressStore, JobProgressReporter
+from app.infrastructure.database.repositories.contact_repository_impl import ContactRepositoryImpl
+from app.infrastructure.tasks import broadcast_tasks
+from app.tests.fixtures.faker_fixtures import fake_church, fake_broadcast
+
+
+def _contacts_session(rows):
+    # recipient_chunks only reads id and church_id, so a bare SQLite table will do
+    session = Session(create_engine("sqlite://"))
+    session.execute(text("CREATE TABLE contacts (id INTEGER PRIMARY KEY, church_id INT, phone TEXT, tags TEXT)"))
+    for contact_id, church_id in rows:
+        session.execute(
+            text("INSERT INTO contacts (id, church_id, phone) VALUES (:id, :church_id, 'x')"),
+            {"id": contact_id, "church_id": church_id}
+        )
+    return session
+
+
+def _record_deliveries(session, broadcast_id, statuses):
+    session.execute(text("CREATE TABLE broadcast_deliveries (broadcast_id INT, contact_id INT, status TEXT)"))
+    for contact_id, status in statuses.items():
+        session.execute(
+            text("INSERT INTO broadcast_deliveries VALUES (:broadcast_id, :contact_id, :status)"),
+            {"broadcast_id": broadcast_id, "contact_id": contact_id, "status": status}
+        )
+
+
+def _store(monkeypatch):
+    store = JobProgressStore(fakeredis.FakeRedis(decode_responses=True))
+    monkeypatch.setattr(broadcast_tasks, "JobProgressStore", lambda: store)
+    return store
+
+
+def test_recipient_chunks_split_the_audience_by_contact_id():
+    """Test that chunks cover the church's contacts in ID order, chunk_size at a time, with gaps in IDs"""
+    session = _contacts_session([(1, 1), (2, 1), (3, 2), (5, 1), (7, 1), (8, 1), (11, 1), (20, 1)])
+    
+    chunks = ContactRepositoryImpl(session).recipient_chunks(1, None, 3)
+    
+    assert chunks == [(1, 5, 3), (7, 11, 3), (20, 20, 1)]
+
+
+def test_fan_out_commits_the_claim_before_publishing_chunks(monkeypatch):
+    """Test that chunk tasks can never run against a claim the database does not have yet"""
+    store = _store(monkeypatch)
+    store.create("job-1")
+    calls = MagicMock()
+    use_case = calls.use_case
+    use_case.prepare.return_value = (fake_broadcast(church_id=1, id=10), fake_church(id=1))
+    use_case.recipient_chunks.return_value = [(1, 5, 3), (7, 7, 1)]
+    uow = calls.uow
+    monkeypatch.setattr(broadcast_tasks, "_send_use_case", lambda *args, **kwargs: use_case)
+    monkeypatch.setattr(broadcast_tasks, "chord", calls.chord)
+    
+    result = broadcast_tasks._fan_out(uow, 1, 10, "job-1")
+    
+    assert result == {"chunks": 2, "total": 4}
+    names = [call[0] for call in calls.mock_calls]
+    assert names.index("uow.commit") < names.index("chord")
+    headers = list(calls.chord.call_args.args[0])
+    assert [signature.args for signature in headers] == [(10, 1, 5, 3, "job-1"), (10, 7, 7, 1, "job-1")]
+    assert store.get("job-1")["total"] == 4 and store.get("job-1")["state"] == "running"
+
+
+def test_resumed_progress_counts_only_contacts_left_to_send(monkeypatch):
+    """Test that a resumed job's chunks are sized after the ledger, so its progress reaches zero remaining"""
+    store = _store(monkeypatch)
+    store.create("job-1")
+    session = _contacts_session([(i, 1) for i in range(1, 8)])
+    _record_deliveries(session, 10, {1: "sent", 2: "delivered", 3: "failed", 4: "retrying"})
+    broadcast = fake_broadcast(church_id=1, id=10, status=BroadcastStatus.FAILED)
+    broadcast_repo = MagicMock()
+    broadcast_repo.get_by_id.return_value = broadcast
+    broadcast_repo.claim_for_sending.return_value = broadcast
+    church_repo = MagicMock()
+    church_repo.get_by_id.return_value = fake_church(id=1, whatsapp_phone_id="123", whatsapp_access_token="token")
+    use_case = SendBroadcastUseCase(broadcast_repo, ContactRepositoryImpl(session), church_repo, MagicMock())
+    uow = MagicMock()
+    uow.deliveries.count_sent.return_value = 2
+    chord = MagicMock()
+    monkeypatch.setattr(broadcast_tasks, "_send_use_case", lambda *args, **kwargs: use_case)
+    monkeypatch.setattr(broadcast_tasks, "chord", chord)
+    monkeypatch.setattr(broadcast_tasks.settings, "BROADCAST_CHUNK_SIZE", 2)
+    
+    result = broadcast_tasks._fan_out(uow, 1, 10, "job-1", resume=True)
+    
+    # Contact 4 is still retrying, so it is sent again; 1 to 3 are settled
+    assert result == {"chunks": 2, "total": 4}
+    headers = list(chord.call_args.args[0])
+    assert [signature.args[1:4] for signature in headers] == [(4, 5, 2), (6, 7, 2)]
+    progress = store.get("job-1")
+    assert (progress["total"], progress["sent"], progress["failed"]) == (6, 2, 0)
+    
+    # Every chunk reports each contact it sends to, and nothing else
+    reporter = JobProgressReporter(store, "job-1")
+    reporter.advance(sent=3, failed=1)
+    assert store.finish_chunks("job-1")
+    progress = store.get("job-1")
+    assert progress["total"] - progress["sent"] - progress["failed"] == 0
+
+
+def _finalize(monkeypatch, chunk_results):
+    store = _store(monkeypatch)
+    store.create("job-1", state="running")
+    broadcast = fake_broadcast(church_id=1, id=10, status=BroadcastStatus.SENDING)
+    uow = MagicMock()
+    uow.__enter__.return_value = uow
+    uow.broadcasts.get_by_id.return_value = broadcast
+    monkeypatch.setattr(broadcast_tasks, "SqlAlchemyUnitOfWork", lambda: uow)
+    result = broadcast_tasks.finalize_broadcast.run(chunk_results, 10, "job-1")
+    return result, broadcast, uow, store
+
+
+def test_finalize_marks_the_broadcast_sent_and_recounts_total_sent(monkeypatch):
+    """Test that finalize sums the chunks, sets the final status and recounts from the ledger"""
+    result, broadcast, uow, store = _finalize(monkeypatch, [
+        {"success": 3, "failed": 0, "total": 3},
+        {"success": 1, "failed": 1, "total": 2},
+    ])
+    
+    assert result == {"success": 4, "failed": 1, "total": 5}
+    assert broadcast.status == BroadcastStatus.SENT
+    uow.broadcasts.update.assert_called_once_with(broadcast)
+    uow.broadcasts.refresh_total_sent.assert_called_once_with(10)
+    assert store.get("job-1")["state"] == "completed"
+
+
+def test_finalize_fails_the_broadcast_when_a_chunk_broke(monkeypatch):
+    """Test that a broken chunk leaves the broadcast failed, so it can be resumed"""
+    _, broadcast, uow, store = _finalize(monkeypatch, [
+        {"success": 3, "failed": 0, "total": 3},
+        {"success": 0, "failed": 2, "total": 2, "error": "connection reset"},
+    ])
+    
+    assert broadcast.status == BroadcastStatus.FAILED
+    uow.broadcasts.refresh_total_sent.assert_called_once_with(10)
+    assert store.get("job-1")["state"] == "failed"
+    assert "connection reset" in store.get("job-1")["error"]
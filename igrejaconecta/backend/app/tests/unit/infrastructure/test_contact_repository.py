@@ -0,0 +1,92 @@
+"""
+Unit tests for ContactRepositoryImpl bulk writes
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from sqlalchemy.dialects import postgresql
+from app.domain.entities.contact import Contact
+from app.domain.value_objects.phone import Phone
+from app.domain.value_objects.recipient import Recipient
+from app.infrastructure.database.repositories.contact_repository_impl import ContactRepositoryImpl
+from app.infrastructure.database.repositories.async_contact_repository_impl import AsyncContactRepositoryImpl
+
+
+def _contact(phone: str) -> Contact:
+    return Contact(id=None, church_id=1, name=None, phone=Phone(phone), tags=[], created_at=datetime.utcnow())
+
+
+def test_bulk_create_hydrates_from_returning_rows():
+    """Test that IDs come from INSERT ... RETURNING without refreshing each row"""
+    created_at = datetime(2024, 1, 1)
+    db = MagicMock()
+    # Second phone was skipped as a duplicate, so only one row comes back
+    db.execute.return_value = [
+        SimpleNamespace(id=7, church_id=1, phone="11999990002", created_at=created_at)
+    ]
+    
+    contacts = [_contact("11999990001"), _contact("11999990002")]
+    created = ContactRepositoryImpl(db).bulk_create(contacts, skip_duplicates=True)
+    
+    assert [(c.id, c.phone.value, c.created_at) for c in created] == [(7, "11999990002", created_at)]
+    # One INSERT ... RETURNING for the batch, one upsert of the tag counts
+    assert db.execute.call_count == 2
+    db.refresh.assert_not_called()
+    db.flush.assert_called_once()
+    db.commit.assert_not_called()
+    insert_sql, counts_sql = (
+        str(call.args[0].compile(dialect=postgresql.dialect())) for call in db.execute.call_args_list
+    )
+    assert "ON CONFLICT" in insert_sql and "RETURNING" in insert_sql
+    assert "church_tag_counts" in counts_sql
+
+
+def test_tag_deltas_follow_contact_changes():
+    """Test that tag counts move with creates, tag edits and deletes"""
+    repository = ContactRepositoryImpl(MagicMock())
+    
+    assert repository._tag_deltas(1, None, ["jovens", "jovens"]) == {(1, ""): 1, (1, "jovens"): 1}
+    assert +repository._tag_deltas(1, ["jovens"], ["jovens", "coral"]) == {(1, "coral"): 1}
+    assert repository._tag_deltas(1, ["coral"], None) == {(1, ""): -1, (1, "coral"): -1}
+
+
+def test_blank_tags_never_count_towards_the_church_total():
+    """Test that empty and whitespace tags are dropped instead of landing on the total row"""
+    repository = ContactRepositoryImpl(MagicMock())
+    
+    assert repository._tag_deltas(1, None, ["", " ", "jovens"]) == {(1, ""): 1, (1, "jovens"): 1}
+    assert +repository._tag_deltas(1, [""], [" jovens "]) == {(1, "jovens"): 1}
+    contact = Contact(
+        id=None, church_id=1, name=None, phone=Phone("11999990001"),
+        tags=["", " jovens", "jovens ", "  "], created_at=datetime.utcnow()
+    )
+    assert contact.tags == ["jovens"]
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_create_awaits_session():
+    """Test that the async repository writes through the AsyncSession"""
+    db = AsyncMock()
+    db.execute.return_value = [
+        SimpleNamespace(id=3, church_id=1, phone="11999990001", created_at=datetime(2024, 1, 1))
+    ]
+    
+    created = await AsyncContactRepositoryImpl(db).bulk_create([_contact("11999990001")])
+    
+    assert created[0].id == 3
+    db.flush.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+def test_resumed_recipients_skip_delivered_contacts():
+    """Test that resuming anti-joins the delivery ledger instead of loading it"""
+    db = MagicMock()
+    db.execute.return_value = [(5, "11999990005", "Ana", ["jovens"])]
+    
+    recipients = list(ContactRepositoryImpl(db).iter_recipients(1, id_range=(1, 500), skip_settled_for=10))
+    
+    assert recipients == [Recipient(5, "11999990005", name="Ana", tags=("jovens",))]
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "NOT (EXISTS (SELECT" in sql and "broadcast_deliveries" in sql
@@ -0,0 +1,49 @@
+"""
+Unit tests for the broadcast delivery ledger
+"""
+
+from unittest.mock import MagicMock
+from sqlalchemy.dialects import postgresql
+from app.domain.entities.delivery import Delivery, DeliveryStatus
+from app.infrastructure.database.repositories.delivery_repository_impl import DeliveryRepositoryImpl
+from app.infrastructure.database.delivery_ledger import SqlAlchemyDeliveryLedger
+
+
+def test_record_upserts_without_downgrading_sent():
+    """Test that one upsert writes the batch and never turns a sent row into failed"""
+    db = MagicMock()
+    
+    DeliveryRepositoryImpl(db).record([
+        Delivery(broadcast_id=10, contact_id=2, status=DeliveryStatus.FAILED, error="timeout"),
+        Delivery(broadcast_id=10, contact_id=1, status=DeliveryStatus.SENT, whatsapp_message_id="wamid.1"),
+    ])
+    
+    db.execute.assert_called_once()
+    stmt = db.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (broadcast_id, contact_id) DO UPDATE" in sql
+    assert "WHERE (broadcast_deliveries.status NOT IN" in sql
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert params["contact_id_m0"] == 1  # Rows sorted by key for a stable lock order
+
+
+def test_record_ignores_empty_batches():
+    """Test that an empty batch issues no statement"""
+    db = MagicMock()
+    
+    DeliveryRepositoryImpl(db).record([])
+    
+    db.execute.assert_not_called()
+
+
+def test_ledger_commits_each_batch_in_its_own_session():
+    """Test that the ledger does not write through the sending task's session"""
+    session = MagicMock()
+    
+    SqlAlchemyDeliveryLedger(session_factory=lambda: session).record([
+        Delivery(broadcast_id=10, contact_id=1, status=DeliveryStatus.SENT)
+    ])
+    
+    session.execute.assert_called_once()
+    session.commit.assert_called_once()
+    session.close.assert_called_once()
@@ -0,0 +1,33 @@
+"""
+Unit tests for the database engine factory
+"""
+
+from sqlalchemy.pool import NullPool
+from app.core.config import Settings
+from app.infrastructure.database.engine import engine_options, create_database_engine
+
+
+def test_pooled_options_come_from_settings():
+    settings = Settings(DB_POOL_SIZE=5, DB_MAX_OVERFLOW=2, DB_STATEMENT_TIMEOUT_MS=1500)
+    
+    options = engine_options(settings)
+    
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 2
+    assert options["connect_args"] == {"options": "-c statement_timeout=1500"}
+
+
+def test_null_pool_mode_for_pgbouncer():
+    settings = Settings(DB_NULL_POOL=True, DB_STATEMENT_TIMEOUT_MS=0)
+    
+    options = engine_options(settings, use_asyncpg=True)
+    
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+
+
+def test_migrations_engine_keeps_no_pool():
+    engine = create_database_engine(Settings(), null_pool=True)
+    
+    assert isinstance(engine.pool, NullPool)
@@ -0,0 +1,63 @@
+"""
+Unit tests for broadcast job progress across chunks and retries
+"""
+
+import fakeredis
+from unittest.mock import MagicMock
+from app.infrastructure.cache.job_progress import JobProgressStore, JobProgressReporter
+from app.infrastructure.tasks import broadcast_tasks
+
+
+def _store():
+    return JobProgressStore(fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_job_completes_only_after_its_retries_settle():
+    """Test that finishing the chunks leaves the job running while retries are pending"""
+    store = _store()
+    store.create("job-1", state="running")
+    reporter = JobProgressReporter(store, "job-1")
+    reporter.advance(sent=8, retrying=2)
+    
+    assert not store.finish_chunks("job-1")
+    assert store.get("job-1")["state"] == "running"
+    
+    reporter.advance(sent=1, retrying=-1)
+    assert not store.complete_if_settled("job-1")
+    reporter.advance(failed=1, retrying=-1)
+    assert store.complete_if_settled("job-1")
+    
+    progress = store.get("job-1")
+    assert (progress["state"], progress["sent"], progress["failed"], progress["retrying"]) == ("completed", 9, 1, 0)
+
+
+def test_failed_job_is_not_completed_by_a_late_retry():
+    """Test that retries settling after a broken chunk keep the job failed"""
+    store = _store()
+    store.create("job-1", state="running")
+    store.set_state("job-1", "failed", error="chunk broke")
+    
+    assert not store.complete_if_settled("job-1")
+    assert store.get("job-1")["state"] == "failed"
+
+
+def test_broken_chunk_only_fails_recipients_it_did_not_report(monkeypatch):
+    """Test that progress never counts a chunk's recipients twice"""
+    store = _store()
+    store.create("job-1", state="running")
+    
+    def send_chunk(broadcast, church, id_range, progress):
+        progress.advance(sent=3, failed=1, retrying=2)
+        raise RuntimeError("database went away")
+    
+    use_case = MagicMock()
+    use_case.send_chunk.side_effect = send_chunk
+    monkeypatch.setattr(broadcast_tasks, "JobProgressStore", lambda: store)
+    monkeypatch.setattr(broadcast_tasks, "SqlAlchemyUnitOfWork", MagicMock())
+    monkeypatch.setattr(broadcast_tasks, "_send_use_case", lambda uow, attempt=0, job_id=None: use_case)
+    
+    result = broadcast_tasks.send_broadcast_chunk.run(10, 1, 100, 10, "job-1")
+    
+    assert result["failed"] == 4 and "database went away" in result["error"]
+    progress = store.get("job-1")
+    assert (progress["sent"], progress["failed"], progress["retrying"]) == (3, 5, 2)
@@ -0,0 +1,99 @@
+"""
+Unit tests for media broadcasts
+"""
+
+import json
+import fakeredis
+import httpx
+import pytest
+from unittest.mock import Mock
+from app.core.config import settings
+from app.domain.value_objects.media import Media
+from app.domain.value_objects.recipient import Recipient
+from app.core.exceptions import InvalidMediaException
+from app.infrastructure.external.whatsapp.media_store import RedisWhatsAppMediaStore
+from app.infrastructure.external.whatsapp.send_engine import WhatsAppSendEngine
+from app.tests.fixtures.faker_fixtures import fake_church, fake_broadcast
+from app.tests.fixtures.fakes import FakeRateLimiter
+
+SHA256 = "ab" * 32
+
+
+def test_media_follows_whatsapp_limits():
+    """Test that uploads are typed by MIME type and bounded by WhatsApp's sizes"""
+    assert Media.from_upload(SHA256, "application/pdf", "boletim.pdf", 1024).kind == Media.DOCUMENT
+    
+    with pytest.raises(InvalidMediaException):
+        Media.from_upload(SHA256, "image/gif", "flyer.gif", 1024)
+    with pytest.raises(InvalidMediaException):
+        Media.from_upload(SHA256, "image/png", "flyer.png", 6 * 1024 * 1024)
+    with pytest.raises(InvalidMediaException):
+        Media.from_dict({"kind": "video", "sha256": SHA256, "mime_type": "image/png"})
+
+
+def test_media_is_uploaded_once_per_phone_number(monkeypatch, tmp_path):
+    """Test that the media ID is cached by phone number and content hash"""
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    (tmp_path / "media").mkdir()
+    (tmp_path / "media" / SHA256).write_bytes(b"png")
+    whatsapp = Mock()
+    whatsapp.upload_media.side_effect = ["media-1", "media-2"]
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    store = RedisWhatsAppMediaStore(whatsapp, redis)
+    media = Media(Media.IMAGE, SHA256, "image/png", "flyer.png")
+    church = fake_church(id=1, whatsapp_phone_id="123", whatsapp_access_token="token")
+    other_number = fake_church(id=2, whatsapp_phone_id="456", whatsapp_access_token="token")
+    
+    assert store.media_id(church, media) == "media-1"
+    assert store.media_id(church, media) == "media-1"
+    assert store.media_id(other_number, media) == "media-2"
+    
+    assert whatsapp.upload_media.call_count == 2
+    assert 0 < redis.ttl(f"whatsapp:media:123:{SHA256}") <= store.ttl
+
+
+def test_media_broadcast_references_the_uploaded_id():
+    """Test that every recipient gets the same media ID with a personalised caption"""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json={"messages": [{"id": "wamid.1"}]})
+
+    media_store = Mock()
+    media_store.media_id.return_value = "media-1"
+    engine = WhatsAppSendEngine(
+        max_in_flight=2,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=FakeRateLimiter(),
+        media_store=media_store,
+    )
+    broadcast = fake_broadcast(
+        church_id=1,
+        message="Boletim da semana, {nome}",
+        media=Media(Media.DOCUMENT, SHA256, "application/pdf", "boletim.pdf"),
+    )
+    # Basic tier sends one message per request
+    church = fake_church(id=1, whatsapp_phone_id="123", whatsapp_access_token="token", messaging_tier="basic")
+
+    recipients = [Recipient(1, "5511900000001", name="Ana"), Recipient(2, "5511900000002", name="Rui")]
+
+    engine.send_broadcast(broadcast, church, recipients)
+
+    media_store.media_id.assert_called_once()
+    captions = sorted(message["document"]["caption"] for message in sent)
+    assert captions == ["Boletim da semana, Ana", "Boletim da semana, Rui"]
+    assert all(message["document"]["id"] == "media-1" for message in sent)
+    assert sent[0]["document"]["filename"] == "boletim.pdf"
+
+
+def test_missing_media_file_fails_before_uploading(monkeypatch, tmp_path):
+    """Test that a file the worker cannot see fails the send with a clear error"""
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    whatsapp = Mock()
+    store = RedisWhatsAppMediaStore(whatsapp, fakeredis.FakeRedis(decode_responses=True))
+    church = fake_church(id=1, whatsapp_phone_id="123", whatsapp_access_token="token")
+    
+    with pytest.raises(InvalidMediaException, match="shared by the API and the workers"):
+        store.media_id(church, Media(Media.DOCUMENT, SHA256, "application/pdf", "boletim.pdf"))
+    whatsapp.upload_media.assert_not_called()
@@ -0,0 +1,71 @@
+"""
+Unit tests for in-process auth caches
+"""
+
+import time
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.infrastructure.cache.memory_cache import TTLCache, token_cache
+from app.infrastructure.database.cache_invalidation import invalidate_after_commit
+from app.infrastructure.external.firebase.firebase_auth import FirebaseAuth
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the cache stays bounded"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries expire after their own TTL"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, ttl=0.01)
+    cache.set("b", 2, ttl=-5)
+    time.sleep(0.02)
+    
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+
+def test_verify_token_is_cached_until_exp():
+    """Test that a verified token is not verified again"""
+    token_cache.clear()
+    service = FirebaseAuth.__new__(FirebaseAuth)
+    decoded = {"uid": "user-1", "exp": time.time() + 3600}
+    
+    with patch(
+        "app.infrastructure.external.firebase.firebase_auth.auth.verify_id_token",
+        return_value=decoded
+    ) as verify:
+        assert service.verify_token("token") == decoded
+        assert service.verify_token("token") == decoded
+    
+    verify.assert_called_once_with("token")
+    token_cache.clear()
+
+
+def test_church_cache_entry_is_dropped_only_when_the_change_commits():
+    """Test that invalidation waits for the commit and is skipped on rollback"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("uid-1", 1)
+    session = Session(create_engine("sqlite://"))
+    session.connection()
+    
+    invalidate_after_commit(session, cache, "uid-1")
+    assert cache.get("uid-1") == 1
+    session.rollback()
+    session.commit()
+    assert cache.get("uid-1") == 1
+    
+    session.connection()
+    invalidate_after_commit(session, cache, "uid-1")
+    session.commit()
+    assert cache.get("uid-1") is None
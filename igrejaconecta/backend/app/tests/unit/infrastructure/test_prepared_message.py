@@ -0,0 +1,71 @@
+"""
+Unit tests for prepared WhatsApp messages
+"""
+
+import json
+from app.infrastructure.external.whatsapp.payloads import build_text_payload, build_interactive_payload
+from app.infrastructure.external.whatsapp.prepared_message import (
+    prepare_text_message,
+    prepare_interactive_message,
+    prepare_broadcast_message,
+    text_placeholder,
+)
+from app.tests.fixtures.faker_fixtures import fake_broadcast
+
+URL = "https://graph.facebook.com/v20.0/123/messages"
+
+
+def test_prepared_body_matches_the_built_payload():
+    """Test that splicing the recipient gives the same JSON as building the payload"""
+    message = 'Culto às 19h "hoje" {recipient} "to":"x"'
+    prepared = prepare_text_message(URL, "token", message)
+    
+    assert json.loads(prepared.body("5511900000001")) == build_text_payload("5511900000001", message)
+    assert json.loads(prepared.body("5511900000002"))["to"] == "5511900000002"
+    assert prepared.headers["Authorization"] == "Bearer token"
+    assert str(prepared.url) == URL
+
+
+def test_prepared_interactive_message():
+    """Test that interactive payloads keep the button while the recipient changes"""
+    prepared = prepare_interactive_message(URL, "token", "Inscreva-se", "Abrir formulário longo demais", "https://x.y")
+    
+    assert json.loads(prepared.body("5511900000001")) == build_interactive_payload(
+        "5511900000001", "Inscreva-se", "Abrir formulário longo demais", "https://x.y"
+    )
+
+
+def test_prepared_broadcast_message_picks_the_payload_type():
+    """Test that broadcasts without a button are sent as text"""
+    broadcast = fake_broadcast(church_id=1, link_url=None, button_text=None)
+    
+    body = json.loads(prepare_broadcast_message(broadcast, URL, "token", [broadcast.message]).body("5511900000001"))
+    
+    assert body["type"] == "text"
+    assert body["text"]["body"] == broadcast.message
+
+
+def test_personalised_message_splices_text_per_recipient():
+    """Test that the message placeholder is replaced along with the recipient"""
+    broadcast = fake_broadcast(church_id=1, link_url="https://x.y", button_text="Abrir")
+    prepared = prepare_broadcast_message(broadcast, URL, "token", [text_placeholder(0)])
+    
+    body = json.loads(prepared.body("5511900000001", 'Olá "Ana"'))
+    
+    assert body["to"] == "5511900000001"
+    assert body["interactive"]["body"]["text"] == 'Olá "Ana"'
+    assert body["interactive"]["action"]["buttons"][0]["url"] == "https://x.y"
+
+
+def test_template_message_binds_parameters_per_recipient():
+    """Test that static parameters are encoded once and personalised ones spliced in order"""
+    broadcast = fake_broadcast(church_id=1, whatsapp_template="aviso_culto", whatsapp_template_language="pt_BR")
+    texts = [text_placeholder(0), "domingo", text_placeholder(1)]
+    prepared = prepare_broadcast_message(broadcast, URL, "token", texts)
+    
+    body = json.loads(prepared.body("5511900000001", "Ana", "Igreja Central"))
+    
+    assert body["type"] == "template"
+    assert body["template"]["name"] == "aviso_culto"
+    assert body["template"]["language"] == {"code": "pt_BR"}
+    assert [p["text"] for p in body["template"]["components"][0]["parameters"]] == ["Ana", "domingo", "Igreja Central"]
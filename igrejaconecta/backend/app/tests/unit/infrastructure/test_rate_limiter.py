@@ -0,0 +1,63 @@
+"""
+Unit tests for the Redis token bucket rate limiter
+"""
+
+import fakeredis
+import pytest
+from app.infrastructure.cache import rate_limiter
+from app.infrastructure.cache.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", waits.append)
+    return waits
+
+
+def _limiter():
+    return RateLimiter(fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_burst_within_capacity_does_not_wait(sleeps):
+    """Test that a full bucket serves one second of the tier's rate at once"""
+    limiter = _limiter()
+    
+    assert limiter.acquire("123", "basic", tokens=15) == 0
+    assert limiter.acquire("123", "basic", tokens=5) == 0
+    assert sleeps == []
+
+
+def test_bucket_in_debt_waits_for_the_deficit(sleeps):
+    """Test that callers past capacity wait for the deficit at the tier's rate"""
+    limiter = _limiter()
+    limiter.acquire("123", "basic", tokens=20)
+    
+    first = limiter.acquire("123", "basic", tokens=10)
+    second = limiter.acquire("123", "basic", tokens=10)
+    
+    assert first == pytest.approx(10 / 20, abs=0.01)
+    assert second == pytest.approx(20 / 20, abs=0.01)
+    assert sleeps == [first, second]
+
+
+def test_bucket_refills_over_time(sleeps):
+    """Test that tokens come back at the tier's rate up to capacity"""
+    limiter = _limiter()
+    limiter.acquire("123", "basic", tokens=20)
+    key = "ratelimit:whatsapp:123"
+    # Pretend the last reservation happened half a second ago
+    last = float(limiter.client.hget(key, "ts"))
+    limiter.client.hset(key, "ts", last - 0.5)
+    
+    assert limiter.acquire("123", "basic", tokens=10) == 0
+    assert limiter.acquire("123", "basic", tokens=10) == pytest.approx(10 / 20, abs=0.01)
+
+
+def test_each_phone_number_has_its_own_bucket(sleeps):
+    """Test that draining one phone number's bucket leaves the others untouched"""
+    limiter = _limiter()
+    limiter.acquire("123", "basic", tokens=20)
+    
+    assert limiter.acquire("123", "basic") > 0
+    assert limiter.acquire("456", "basic", tokens=20) == 0
@@ -0,0 +1,50 @@
+"""
+Unit tests for tag segments and their SQL compilation
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.domain.value_objects.segment import Segment
+from app.infrastructure.database.segment_compiler import compile_segment
+from app.infrastructure.database.models.contact_model import ContactModel
+from app.core.exceptions import InvalidSegmentException
+
+
+def _sql(segment: Segment) -> str:
+    clause = compile_segment(segment, ContactModel.tags)
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_sibling_tags_merge_into_index_operators():
+    segment = Segment.from_dict({"and": [
+        {"tag": "jovens"},
+        {"tag": "membros"},
+        {"or": [{"tag": "coral"}, {"tag": "louvor"}]},
+        {"not": {"tag": "visitante"}},
+    ]})
+    
+    sql = _sql(segment)
+    
+    assert "contacts.tags @> ARRAY['jovens', 'membros']" in sql
+    assert "contacts.tags && ARRAY['coral', 'louvor']" in sql
+    assert "contacts.tags IS NULL OR NOT (contacts.tags @> ARRAY['visitante'])" in sql
+
+
+def test_segment_round_trips_through_dict():
+    data = {"or": [{"tag": "coral"}, {"not": {"and": [{"tag": "a"}, {"tag": "b"}]}}]}
+    
+    assert Segment.from_dict(data).to_dict() == data
+    assert Segment.any_of([]).is_everyone()
+
+
+@pytest.mark.parametrize("data", [
+    {"tag": ""},
+    {"xor": []},
+    {"or": []},
+    {"and": {"tag": "a"}},
+    {"tag": "a", "not": {"tag": "b"}},
+    {"or": [{"tag": str(i)} for i in range(Segment.MAX_TERMS)]},
+])
+def test_malformed_segments_are_rejected(data):
+    with pytest.raises(InvalidSegmentException):
+        Segment.from_dict(data)
@@ -0,0 +1,289 @@
+"""
+Unit tests for WhatsAppSendEngine
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qs
+import httpx
+import pytest
+from app.core.config import settings
+from app.domain.entities.delivery import DeliveryStatus
+from app.domain.value_objects.recipient import Recipient
+from app.infrastructure.external.whatsapp.send_engine import WhatsAppSendEngine
+from app.tests.fixtures.faker_fixtures import fake_church, fake_broadcast
+from app.tests.fixtures.fakes import FakeRateLimiter
+
+
+@pytest.fixture(autouse=True)
+def single_message_requests(monkeypatch):
+    """Send one message per request unless a test opts into batches"""
+    monkeypatch.setattr(settings, "WHATSAPP_BATCH_SIZE", 1)
+
+
+def configured_church():
+    return fake_church(
+        id=1,
+        whatsapp_phone_id="123456",
+        whatsapp_access_token="token",
+        messaging_tier="high",
+    )
+
+
+def test_send_broadcast_counts_success_and_failure():
+    """Test that every recipient is settled as success or failure"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b'"5511900000002"' in request.content:
+            return httpx.Response(400, json={"error": {"message": "invalid"}})
+        return httpx.Response(200, json={"messages": [{"id": "wamid.1"}]})
+
+    rate_limiter = FakeRateLimiter()
+    engine = WhatsAppSendEngine(
+        max_in_flight=4,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=rate_limiter,
+    )
+    broadcast = fake_broadcast(church_id=1, link_url=None, button_text=None)
+    recipients = [Recipient(i, f"551190000000{i}") for i in (1, 2, 3)]
+
+    result = engine.send_broadcast(broadcast, configured_church(), recipients)
+
+    assert result == {"success": 2, "failed": 1, "retrying": 0, "total": 3}
+    assert rate_limiter.acquired == [("123456", "high")] * 3
+
+
+def test_send_broadcast_respects_in_flight_limit():
+    """Test that no more than max_in_flight requests are outstanding"""
+    state = {"in_flight": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return httpx.Response(200, json={"messages": [{"id": "wamid.1"}]})
+
+    engine = WhatsAppSendEngine(
+        max_in_flight=3,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=FakeRateLimiter(),
+    )
+    broadcast = fake_broadcast(church_id=1)
+    recipients = (Recipient(i, f"55119000000{i:02d}") for i in range(20))
+
+    result = engine.send_broadcast(broadcast, configured_church(), recipients)
+
+    assert result["success"] == 20
+    assert state["peak"] == 3
+
+
+def test_send_broadcast_personalises_each_message():
+    """Test that placeholders are rendered with each recipient's name and the church name"""
+    sent = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        sent[payload["to"]] = payload["text"]["body"]
+        return httpx.Response(200, json={"messages": [{"id": "wamid.1"}]})
+
+    engine = WhatsAppSendEngine(
+        max_in_flight=2,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=FakeRateLimiter(),
+    )
+    broadcast = fake_broadcast(church_id=1, message="Paz, {nome:irmão}! Culto na {igreja}", link_url=None, button_text=None)
+    church = configured_church()
+    recipients = [Recipient(1, "5511900000001", name="Ana"), Recipient(2, "5511900000002")]
+
+    engine.send_broadcast(broadcast, church, recipients)
+
+    assert sent == {
+        "5511900000001": f"Paz, Ana! Culto na {church.name}",
+        "5511900000002": f"Paz, irmão! Culto na {church.name}",
+    }
+
+
+class FakeLedger:
+    """Collects the batches the engine writes"""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def record(self, deliveries):
+        self.batches.append(list(deliveries))
+
+
+def test_send_broadcast_records_deliveries_in_batches(monkeypatch):
+    """Test that every outcome reaches the ledger, with its message ID, in bounded batches"""
+    monkeypatch.setattr(settings, "DELIVERY_LEDGER_BATCH_SIZE", 2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b'"5511900000002"' in request.content:
+            return httpx.Response(400, json={"error": {"message": "invalid"}})
+        return httpx.Response(200, json={"messages": [{"id": "wamid.ok"}]})
+
+    engine = WhatsAppSendEngine(
+        max_in_flight=1,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=FakeRateLimiter(),
+    )
+    broadcast = fake_broadcast(church_id=1, id=10)
+    recipients = [Recipient(i, f"551190000000{i}") for i in (1, 2, 3)]
+    ledger = FakeLedger()
+
+    engine.send_broadcast(broadcast, configured_church(), recipients, ledger=ledger)
+
+    assert [len(batch) for batch in ledger.batches] == [2, 1]
+    deliveries = {d.contact_id: d for batch in ledger.batches for d in batch}
+    assert deliveries[1].status == DeliveryStatus.SENT
+    assert deliveries[1].whatsapp_message_id == "wamid.ok"
+    assert deliveries[2].status == DeliveryStatus.FAILED and deliveries[2].error
+    assert all(d.broadcast_id == 10 for d in deliveries.values())
+
+
+class FakeRetryQueue:
+    """Collects scheduled retries"""
+    
+    def __init__(self):
+        self.scheduled = []
+    
+    def schedule_retry(self, broadcast_id, contact_ids, attempt, retry_after=None):
+        self.scheduled.append((broadcast_id, sorted(contact_ids), attempt, retry_after))
+
+
+def _throttled_engine(retry_queue, attempt=0):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b'"5511900000001"' in request.content:
+            return httpx.Response(429, headers={"Retry-After": "30"}, json={"error": {"code": 130429}})
+        if b'"5511900000002"' in request.content:
+            return httpx.Response(400, json={"error": {"code": 131026, "message": "undeliverable"}})
+        return httpx.Response(200, json={"messages": [{"id": "wamid.ok"}]})
+
+    return WhatsAppSendEngine(
+        max_in_flight=2,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=FakeRateLimiter(),
+        retry_queue=retry_queue,
+        attempt=attempt,
+    )
+
+
+def test_transient_failures_are_scheduled_for_retry():
+    """Test that throttled messages go to the retry queue and permanent ones are dead-lettered"""
+    retry_queue = FakeRetryQueue()
+    ledger = FakeLedger()
+    broadcast = fake_broadcast(church_id=1, id=10)
+    recipients = [Recipient(i, f"551190000000{i}") for i in (1, 2, 3)]
+
+    result = _throttled_engine(retry_queue).send_broadcast(
+        broadcast, configured_church(), recipients, ledger=ledger
+    )
+
+    assert result == {"success": 1, "failed": 1, "retrying": 1, "total": 3}
+    assert retry_queue.scheduled == [(10, [1], 1, 30.0)]
+    statuses = {d.contact_id: (d.status, d.error_code) for batch in ledger.batches for d in batch}
+    assert statuses[1] == (DeliveryStatus.RETRYING, 130429)
+    assert statuses[2] == (DeliveryStatus.FAILED, 131026)
+
+
+def test_last_attempt_dead_letters_transient_failures(monkeypatch):
+    """Test that a transient failure out of attempts is recorded as failed"""
+    monkeypatch.setattr(settings, "MESSAGE_RETRY_MAX_ATTEMPTS", 3)
+    retry_queue = FakeRetryQueue()
+    broadcast = fake_broadcast(church_id=1, id=10)
+
+    result = _throttled_engine(retry_queue, attempt=3).send_broadcast(
+        broadcast, configured_church(), [Recipient(1, "5511900000001")]
+    )
+
+    assert result["failed"] == 1 and result["retrying"] == 0
+    assert retry_queue.scheduled == []
+
+
+def test_fast_tiers_send_messages_in_graph_api_batches(monkeypatch):
+    """Test that messages are batched per request and each operation is settled on its own"""
+    monkeypatch.setattr(settings, "WHATSAPP_BATCH_SIZE", 2)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        operations = json.loads(parse_qs(request.content.decode())["batch"][0])
+        requests.append(request)
+        results = []
+        for operation in operations:
+            assert operation["relative_url"] == "123456/messages"
+            body = parse_qs(operation["body"])
+            to = body["to"][0]
+            if to == "5511900000002":
+                results.append({"code": 400, "body": json.dumps({"error": {"code": 131026}})})
+            elif to == "5511900000004":
+                results.append({
+                    "code": 429,
+                    "headers": [{"name": "Retry-After", "value": "30"}],
+                    "body": json.dumps({"error": {"code": 130429}}),
+                })
+            elif to == "5511900000005":
+                results.append(None)
+            else:
+                assert json.loads(body["text"][0])["body"] == "Paz, Ana!"
+                results.append({"code": 200, "body": json.dumps({"messages": [{"id": f"wamid.{to}"}]})})
+        return httpx.Response(200, json=results)
+
+    rate_limiter = FakeRateLimiter()
+    retry_queue = FakeRetryQueue()
+    ledger = FakeLedger()
+    engine = WhatsAppSendEngine(
+        max_in_flight=1,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        rate_limiter=rate_limiter,
+        retry_queue=retry_queue,
+    )
+    broadcast = fake_broadcast(church_id=1, id=10, message="Paz, {nome}!", link_url=None, button_text=None)
+    recipients = [Recipient(i, f"551190000000{i}", name="Ana") for i in (1, 2, 3, 4, 5)]
+
+    result = engine.send_broadcast(broadcast, configured_church(), recipients, ledger=ledger)
+
+    assert len(requests) == 3
+    assert str(requests[0].url) == f"{engine.base_url}/"
+    assert len(rate_limiter.acquired) == 5
+    assert result == {"success": 2, "failed": 1, "retrying": 2, "total": 5}
+    assert retry_queue.scheduled == [(10, [4, 5], 1, 30.0)]
+    deliveries = {d.contact_id: d for batch in ledger.batches for d in batch}
+    assert deliveries[3].whatsapp_message_id == "wamid.5511900000003"
+    assert deliveries[2].error_code == 131026
+
+
+class FakeProgress:
+    """Sums what the engine reports"""
+    
+    def __init__(self):
+        self.counters = {"sent": 0, "failed": 0, "retrying": 0}
+    
+    def set_total(self, total):
+        pass
+    
+    def advance(self, sent=0, failed=0, retrying=0):
+        self.counters["sent"] += sent
+        self.counters["failed"] += failed
+        self.counters["retrying"] += retrying
+
+
+def test_retries_are_reported_until_they_settle():
+    """Test that scheduled retries count as retrying and leave that counter when a retry settles them"""
+    progress = FakeProgress()
+    broadcast = fake_broadcast(church_id=1, id=10)
+    recipients = [Recipient(i, f"551190000000{i}") for i in (1, 2, 3)]
+    
+    _throttled_engine(FakeRetryQueue()).send_broadcast(broadcast, configured_church(), recipients, progress)
+    assert progress.counters == {"sent": 1, "failed": 1, "retrying": 1}
+    
+    # The retry is throttled again: still retrying, not counted twice
+    _throttled_engine(FakeRetryQueue(), attempt=1).send_broadcast(
+        broadcast, configured_church(), [Recipient(1, "5511900000001")], progress
+    )
+    assert progress.counters == {"sent": 1, "failed": 1, "retrying": 1}
+    
+    # Out of attempts: dead-lettered as failed
+    _throttled_engine(FakeRetryQueue(), attempt=settings.MESSAGE_RETRY_MAX_ATTEMPTS).send_broadcast(
+        broadcast, configured_church(), [Recipient(1, "5511900000001")], progress
+    )
+    assert progress.counters == {"sent": 1, "failed": 2, "retrying": 0}
@@ -0,0 +1,103 @@
+"""
+Unit tests for WhatsApp status webhook ingestion
+"""
+
+import hashlib
+import hmac
+import json
+import fakeredis
+from datetime import datetime
+from unittest.mock import MagicMock
+from app.domain.entities.delivery import DeliveryStatus
+from app.domain.value_objects.status_event import StatusEvent
+from app.infrastructure.cache.status_event_stream import StatusEventStream
+from app.infrastructure.database.repositories.delivery_repository_impl import DeliveryRepositoryImpl
+from app.infrastructure.external.whatsapp.webhook import is_valid_signature, parse_status_events
+from app.infrastructure.tasks.status_consumer import StatusEventConsumer
+
+
+def _callback(*statuses) -> dict:
+    return {
+        "object": "whatsapp_business_account",
+        "entry": [{"changes": [{"field": "messages", "value": {"statuses": list(statuses)}}]}],
+    }
+
+
+def _status(message_id: str, status: str, timestamp: int = 1700000000, **extra) -> dict:
+    return {"id": message_id, "status": status, "timestamp": str(timestamp), "recipient_id": "5511", **extra}
+
+
+def test_signature_must_match_the_raw_body():
+    """Test that only callbacks signed with the app secret are accepted"""
+    body = b'{"entry": []}'
+    signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    
+    assert is_valid_signature(body, signature, "secret")
+    assert not is_valid_signature(body + b" ", signature, "secret")
+    assert not is_valid_signature(body, None, "secret")
+
+
+def test_parse_keeps_tracked_statuses_with_errors():
+    """Test that delivered/read/failed statuses are extracted and other callbacks ignored"""
+    payload = _callback(
+        _status("wamid.1", "delivered"),
+        _status("wamid.2", "failed", errors=[{"code": 131026, "title": "Message undeliverable"}]),
+        _status("wamid.3", "sent"),
+    )
+    payload["entry"].append({"changes": [{"field": "messages", "value": {"messages": [{"id": "in"}]}}]})
+    
+    events = parse_status_events(payload)
+    
+    assert [(e.whatsapp_message_id, e.status) for e in events] == [
+        ("wamid.1", DeliveryStatus.DELIVERED),
+        ("wamid.2", DeliveryStatus.FAILED),
+    ]
+    assert events[1].error_code == 131026
+
+
+def test_status_events_only_move_forward_and_roll_up_counters():
+    """Test that one batch updates deliveries in bulk and broadcast counters by delta"""
+    db = MagicMock()
+    row = lambda contact_id, message_id, status: MagicMock(
+        broadcast_id=10, contact_id=contact_id, whatsapp_message_id=message_id, status=status
+    )
+    db.execute.return_value.all.return_value = [
+        row(1, "wamid.1", "sent"),
+        row(2, "wamid.2", "read"),
+    ]
+    at = datetime(2024, 1, 1)
+    events = [
+        StatusEvent("wamid.1", DeliveryStatus.READ, at),
+        StatusEvent("wamid.1", DeliveryStatus.DELIVERED, at),  # Late duplicate
+        StatusEvent("wamid.2", DeliveryStatus.DELIVERED, at),  # Would be a step back
+    ]
+    
+    matched = DeliveryRepositoryImpl(db).apply_status_events(events)
+    
+    assert matched == {"wamid.1", "wamid.2"}
+    _, deliveries_call, counters_call = db.execute.call_args_list
+    assert deliveries_call.args[1] == [
+        {"broadcast_id": 10, "contact_id": 1, "status": "read", "error": None, "error_code": None}
+    ]
+    assert counters_call.args[1] == [{"b_id": 10, "total_delivered": 1, "total_read": 1, "total_failed": 0}]
+
+
+def test_consumer_leaves_unrecorded_messages_pending():
+    """Test that callbacks for messages missing from the ledger are not acknowledged yet"""
+    redis = fakeredis.FakeRedis(decode_responses=True)
+    stream = StatusEventStream(redis)
+    stream.ensure_group()
+    redis.xadd(stream.key, {"payload": json.dumps(_callback(_status("wamid.known", "delivered")))})
+    redis.xadd(stream.key, {"payload": json.dumps(_callback(_status("wamid.unknown", "delivered")))})
+    redis.xadd(stream.key, {"payload": "not json"})
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [
+        MagicMock(broadcast_id=10, contact_id=1, whatsapp_message_id="wamid.known", status="sent")
+    ]
+    
+    consumer = StatusEventConsumer(stream, session_factory=lambda: session, name="test")
+    
+    assert consumer.process_batch() == 3
+    session.commit.assert_called_once()
+    pending = redis.xpending(stream.key, stream.group)
+    assert pending["pending"] == 1
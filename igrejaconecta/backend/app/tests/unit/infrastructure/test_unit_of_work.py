@@ -0,0 +1,78 @@
+"""
+Unit tests for the SQLAlchemy units of work
+"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from app.core.config import settings
+from app.main import can_read_pool_metrics
+from app.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork, AsyncSqlAlchemyUnitOfWork
+from app.infrastructure.database.pool_metrics import PoolMetrics
+
+
+def test_unit_of_work_commits_and_closes_on_success():
+    session = MagicMock()
+    
+    with SqlAlchemyUnitOfWork(session_factory=lambda: session) as uow:
+        assert uow.contacts.db is session
+        assert uow.broadcasts.db is session
+    
+    session.connection.assert_called_once()
+    session.commit.assert_called_once()
+    session.rollback.assert_not_called()
+    session.close.assert_called_once()
+
+
+def test_unit_of_work_rolls_back_on_error():
+    session = MagicMock()
+    
+    with pytest.raises(ValueError):
+        with SqlAlchemyUnitOfWork(session_factory=lambda: session):
+            raise ValueError("boom")
+    
+    session.commit.assert_not_called()
+    session.rollback.assert_called_once()
+    session.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_unit_of_work_rolls_back_on_error():
+    session = AsyncMock()
+    
+    with pytest.raises(ValueError):
+        async with AsyncSqlAlchemyUnitOfWork(session_factory=lambda: session):
+            raise ValueError("boom")
+    
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited_once()
+    session.close.assert_awaited_once()
+
+
+def test_pool_metrics_snapshot():
+    metrics = PoolMetrics()
+    metrics.record_checkout(0.002)
+    metrics.record_checkout(0.004)
+    metrics.record_timeout()
+    
+    pool = MagicMock(spec=["size", "checkedin", "checkedout", "overflow"])
+    pool.size.return_value = 10
+    pool.checkedin.return_value = 8
+    pool.checkedout.return_value = 2
+    pool.overflow.return_value = -8
+    
+    stats = metrics.snapshot(pool)
+    
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["avg_wait_ms"] == 3.0
+    assert stats["max_wait_ms"] == 4.0
+    assert stats["checkedout"] == 2
+
+
+def test_pool_metrics_need_the_metrics_token(monkeypatch):
+    assert not can_read_pool_metrics("anything")
+    
+    monkeypatch.setattr(settings, "HEALTH_METRICS_TOKEN", "internal")
+    assert can_read_pool_metrics("internal")
+    assert not can_read_pool_metrics("wrong")
+    assert not can_read_pool_metrics(None)
@@ -0,0 +1,53 @@
+"""
+Unit tests for Graph API batch requests
+"""
+
+import json
+from urllib.parse import parse_qs
+import httpx
+from unittest.mock import Mock
+from app.core.config import settings
+from app.infrastructure.external.whatsapp.batch import batch_size
+from app.infrastructure.external.whatsapp.whatsapp_client import WhatsAppClient
+
+
+def test_batches_only_fit_tiers_whose_bucket_holds_them(monkeypatch):
+    """Test that a batch never takes more rate limit tokens than the tier allows per second"""
+    monkeypatch.setattr(settings, "WHATSAPP_BATCH_SIZE", 100)
+    
+    assert batch_size("max") == 50
+    assert batch_size("standard") == 50
+    assert batch_size("basic") == 1
+
+
+def test_bulk_messages_are_sent_in_batches(monkeypatch):
+    """Test that each operation of a batch succeeds or fails on its own"""
+    monkeypatch.setattr(settings, "WHATSAPP_BATCH_SIZE", 2)
+    batches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+        operations = json.loads(parse_qs(request.content.decode())["batch"][0])
+        batches.append([parse_qs(operation["body"])["to"][0] for operation in operations])
+        if len(batches) == 2:
+            # Graph API skipped the rest of this batch
+            return httpx.Response(200, json=[
+                {"code": 400, "body": json.dumps({"error": {"code": 131026}})},
+                None,
+            ])
+        return httpx.Response(200, json=[
+            {"code": 200, "body": json.dumps({"messages": [{"id": "wamid.1"}]})},
+            {"code": 200, "body": json.dumps({"messages": [{"id": "wamid.2"}]})},
+        ])
+
+    rate_limiter = Mock()
+    client = WhatsAppClient(rate_limiter=rate_limiter, http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    recipients = [f"551190000000{i}" for i in (1, 2, 3, 4)]
+
+    results = client.send_bulk_messages(recipients, "Culto às 19h & ceia", "123", "token", "high")
+
+    assert batches == [recipients[:2], recipients[2:]]
+    assert rate_limiter.acquire.call_args.args == ("123", "high")
+    assert rate_limiter.acquire.call_args.kwargs["tokens"] == 2
+    assert [r["result"]["messages"][0]["id"] for r in results["success"]] == ["wamid.1", "wamid.2"]
+    assert [(r["to"], r["retryable"]) for r in results["failed"]] == [(recipients[2], False), (recipients[3], True)]
@@ -0,0 +1,47 @@
+"""
+Unit tests for WhatsApp error classification and retry backoff
+"""
+
+import httpx
+from app.core.config import settings
+from app.core.exceptions import WhatsAppTransientException, WhatsAppPermanentException
+from app.infrastructure.external.whatsapp.errors import classify_http_error
+from app.infrastructure.tasks.message_retry_queue import retry_delay
+
+
+def _status_error(status_code: int, **kwargs) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://graph.facebook.com/v20.0/123/messages")
+    response = httpx.Response(status_code, request=request, **kwargs)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_throttling_server_errors_and_timeouts_are_transient():
+    """Test that failures a later attempt can fix are classified as transient"""
+    throttled = classify_http_error(_status_error(429, headers={"Retry-After": "12"}))
+    assert isinstance(throttled, WhatsAppTransientException)
+    assert throttled.retry_after == 12.0
+    assert isinstance(classify_http_error(_status_error(503)), WhatsAppTransientException)
+    # Pair rate limit comes back as a 400 but clears up on its own
+    pair_limited = classify_http_error(_status_error(400, json={"error": {"code": 131056}}))
+    assert isinstance(pair_limited, WhatsAppTransientException)
+    assert isinstance(classify_http_error(httpx.ReadTimeout("timeout")), WhatsAppTransientException)
+
+
+def test_invalid_recipient_is_permanent():
+    """Test that client errors without a throttling code are not retried"""
+    error = classify_http_error(_status_error(400, json={"error": {"code": 131026}}))
+    
+    assert isinstance(error, WhatsAppPermanentException)
+    assert error.code == 131026
+
+
+def test_retry_delay_grows_with_jitter_and_cap(monkeypatch):
+    """Test that the backoff doubles per attempt, stays jittered and is capped"""
+    monkeypatch.setattr(settings, "MESSAGE_RETRY_BASE_DELAY_SECONDS", 4.0)
+    monkeypatch.setattr(settings, "MESSAGE_RETRY_MAX_DELAY_SECONDS", 60.0)
+    
+    assert all(2.0 <= retry_delay(1) <= 4.0 for _ in range(50))
+    assert all(8.0 <= retry_delay(3) <= 16.0 for _ in range(50))
+    assert all(30.0 <= retry_delay(10) <= 60.0 for _ in range(50))
+    assert len({retry_delay(3) for _ in range(20)}) > 1
+    assert retry_delay(1, retry_after=45.0) == 45.0
@@ -0,0 +1,60 @@
+"""
+Unit tests for approved WhatsApp templates
+"""
+
+import httpx
+from unittest.mock import Mock
+from app.domain.value_objects.whatsapp_template import WhatsAppTemplate
+from app.infrastructure.cache.memory_cache import TTLCache
+from app.infrastructure.external.whatsapp.whatsapp_client import WhatsAppClient
+from app.infrastructure.external.whatsapp.template_catalog import CachedWhatsAppTemplateCatalog
+from app.tests.fixtures.faker_fixtures import fake_church
+
+
+def test_approved_templates_follow_pagination():
+    """Test that every page is read and body variables are counted"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("after") == "2":
+            return httpx.Response(200, json={"data": [
+                {"name": "boas_vindas", "language": "pt_BR", "status": "APPROVED", "components": []},
+            ]})
+        return httpx.Response(200, json={
+            "data": [
+                {
+                    "name": "aviso_culto",
+                    "language": "pt_BR",
+                    "status": "APPROVED",
+                    "components": [
+                        {"type": "HEADER", "format": "TEXT", "text": "Aviso {{1}}"},
+                        {"type": "BODY", "text": "Olá {{1}}, culto {{2}} às {{3}}"},
+                    ],
+                },
+                {"name": "rascunho", "language": "pt_BR", "status": "REJECTED", "components": []},
+            ],
+            "paging": {"next": "https://graph.facebook.com/v20.0/999/message_templates?after=2"},
+        })
+
+    client = WhatsAppClient(rate_limiter=Mock(), http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    templates = client.get_approved_templates("999", "token")
+
+    assert templates == [
+        WhatsAppTemplate("aviso_culto", "pt_BR", parameter_count=3),
+        WhatsAppTemplate("boas_vindas", "pt_BR", parameter_count=0),
+    ]
+
+
+def test_catalog_lists_templates_once_per_church():
+    """Test that lookups hit the cache, and an unknown template triggers one refresh"""
+    service = Mock()
+    service.get_approved_templates.return_value = [WhatsAppTemplate("aviso_culto", "pt_BR", 1)]
+    catalog = CachedWhatsAppTemplateCatalog(service, TTLCache(maxsize=10, ttl=60))
+    church = fake_church(id=1, whatsapp_access_token="token", whatsapp_business_account_id="999")
+
+    assert catalog.find(church, "aviso_culto", "pt_BR").parameter_count == 1
+    assert catalog.find(church, "aviso_culto", "pt_BR").parameter_count == 1
+    assert service.get_approved_templates.call_count == 1
+
+    assert catalog.find(church, "aviso_culto", "en_US") is None
+    assert service.get_approved_templates.call_count == 2
+    service.get_approved_templates.assert_called_with("999", "token")
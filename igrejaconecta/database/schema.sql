@@ -11,6 +11,8 @@ CREATE TABLE IF NOT EXISTS churches (
     phone VARCHAR(20),
     whatsapp_phone_id TEXT,
     whatsapp_access_token TEXT, -- Encrypted
+    messaging_tier VARCHAR(20), -- basic, standard, high, max (throughput WhatsApp)
+    whatsapp_business_account_id TEXT, -- WABA dos templates aprovados
     created_at TIMESTAMP DEFAULT NOW(),
     is_active BOOLEAN DEFAULT TRUE
 );
@@ -35,10 +37,20 @@ CREATE TABLE IF NOT EXISTS broadcasts (
     link_url TEXT,
     button_text VARCHAR(50),
     contact_tags TEXT[],
+    segment JSONB, -- expressão de tags, ex: {"and": [{"tag": "jovens"}, {"not": {"tag": "visitante"}}]}
     scheduled_at TIMESTAMP,
+    dispatched_at TIMESTAMP, -- quando o envio agendado foi entregue à fila
+    claimed_at TIMESTAMP, -- lease do envio em andamento, renovado a cada lote concluído
     sent_at TIMESTAMP,
-    status VARCHAR(20) DEFAULT 'pending', -- pending, sent, failed
+    status VARCHAR(20) DEFAULT 'pending', -- pending, sending, sent, failed, cancelled
     total_sent INT DEFAULT 0,
+    total_delivered INT DEFAULT 0, -- contadores dos webhooks de status
+    total_read INT DEFAULT 0,
+    total_failed INT DEFAULT 0,
+    whatsapp_template VARCHAR(512), -- template aprovado pelo WhatsApp, enviado no lugar de message
+    whatsapp_template_language VARCHAR(15),
+    template_parameters TEXT[],
+    media JSONB, -- arquivo enviado com a mensagem, ex: {"kind": "image", "sha256": "...", "mime_type": "image/jpeg"}
     created_at TIMESTAMP DEFAULT NOW()
 );
 
@@ -53,11 +65,69 @@ CREATE TABLE IF NOT EXISTS templates (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+-- Colunas adicionadas depois da criação das tabelas: CREATE TABLE IF NOT EXISTS
+-- não altera bancos já existentes, então elas também são aplicadas aqui
+ALTER TABLE churches ADD COLUMN IF NOT EXISTS messaging_tier VARCHAR(20);
+ALTER TABLE churches ADD COLUMN IF NOT EXISTS whatsapp_business_account_id TEXT;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS segment JSONB;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS dispatched_at TIMESTAMP;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS total_delivered INT DEFAULT 0;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS total_read INT DEFAULT 0;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS total_failed INT DEFAULT 0;
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS whatsapp_template VARCHAR(512);
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS whatsapp_template_language VARCHAR(15);
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS template_parameters TEXT[];
+ALTER TABLE broadcasts ADD COLUMN IF NOT EXISTS media JSONB;
+
+-- Tabela: contatos por tag, atualizada junto com cada escrita em contacts
+-- (tag '' guarda o total de contatos da igreja; tags de contatos nunca são vazias)
+CREATE TABLE IF NOT EXISTS church_tag_counts (
+    church_id INT NOT NULL REFERENCES churches(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    contact_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (church_id, tag)
+);
+
+-- Preenche as contagens a partir dos contatos já existentes
+INSERT INTO church_tag_counts (church_id, tag, contact_count)
+SELECT church_id, tag, COUNT(*)
+FROM (SELECT DISTINCT id, church_id, btrim(unnest(tags)) AS tag FROM contacts) AS contact_tags
+WHERE tag <> ''
+GROUP BY church_id, tag
+UNION ALL
+SELECT church_id, '', COUNT(*) FROM contacts GROUP BY church_id
+ON CONFLICT (church_id, tag) DO NOTHING;
+
+-- Tabela: resultado do envio de cada transmissão para cada contato
+-- (gravada em lotes durante o envio; permite retomar sem reenviar)
+CREATE TABLE IF NOT EXISTS broadcast_deliveries (
+    broadcast_id INT NOT NULL REFERENCES broadcasts(id) ON DELETE CASCADE,
+    contact_id INT NOT NULL REFERENCES contacts(id) ON DELETE CASCADE,
+    status VARCHAR(20) NOT NULL, -- sent, retrying, failed (falha definitiva)
+    whatsapp_message_id VARCHAR(128),
+    error TEXT,
+    error_code INT, -- código de erro da Graph API
+    attempted_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (broadcast_id, contact_id)
+);
+
 -- Índices para melhor performance
-CREATE INDEX IF NOT EXISTS idx_contacts_church_id ON contacts(church_id);
+-- (church_id, id) e (church_id, created_at, id) atendem a paginação por cursor
+-- e substituem os índices só por church_id; o de agendamento passou a ser parcial
+DROP INDEX IF EXISTS idx_contacts_church_id;
+DROP INDEX IF EXISTS idx_broadcasts_church_id;
+DROP INDEX IF EXISTS idx_broadcasts_scheduled_at;
+DROP INDEX IF EXISTS idx_templates_church_id;
+CREATE INDEX IF NOT EXISTS idx_contacts_church_id_id ON contacts(church_id, id);
 CREATE INDEX IF NOT EXISTS idx_contacts_tags ON contacts USING GIN(tags);
-CREATE INDEX IF NOT EXISTS idx_broadcasts_church_id ON broadcasts(church_id);
+CREATE INDEX IF NOT EXISTS idx_broadcasts_church_created ON broadcasts(church_id, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_broadcasts_status ON broadcasts(status);
-CREATE INDEX IF NOT EXISTS idx_broadcasts_scheduled_at ON broadcasts(scheduled_at);
-CREATE INDEX IF NOT EXISTS idx_templates_church_id ON templates(church_id);
+CREATE INDEX IF NOT EXISTS idx_broadcasts_pending_schedule ON broadcasts(scheduled_at)
+    WHERE status = 'pending' AND scheduled_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_templates_church_created ON templates(church_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_broadcast_deliveries_failed ON broadcast_deliveries(broadcast_id)
+    WHERE status = 'failed';
+CREATE INDEX IF NOT EXISTS idx_broadcast_deliveries_message ON broadcast_deliveries(whatsapp_message_id)
+    WHERE whatsapp_message_id IS NOT NULL;
 